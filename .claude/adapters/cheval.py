@@ -11,19 +11,168 @@ I/O Contract:
 from __future__ import annotations
 
 import argparse
+import contextlib
+import dataclasses
+import functools
+import hashlib
+import io
 import json
 import logging
 import os
+import re
 import sys
-import traceback
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from enum import IntEnum
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, TextIO, Tuple
 
 # Add the adapters directory to Python path for imports
 _ADAPTERS_DIR = os.path.dirname(os.path.abspath(__file__))
 if _ADAPTERS_DIR not in sys.path:
     sys.path.insert(0, _ADAPTERS_DIR)
 
+# Try orjson import — optional C encoder, stdlib json fallback
+try:
+    import orjson
+
+    def _dumps_bytes(obj: Any, indent: bool = False) -> bytes:
+        """Serialize obj to UTF-8 JSON bytes with a trailing newline (orjson)."""
+        option = orjson.OPT_APPEND_NEWLINE | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, option=option)
+
+    def _dumps(obj: Any, indent: bool = False) -> str:
+        """Serialize obj to a JSON string (orjson)."""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0).decode("utf-8")
+
+    def _loads(data: Any) -> Any:
+        """Parse JSON from str or bytes (orjson; errors are ValueErrors)."""
+        return orjson.loads(data)
+except ImportError:
+
+    def _dumps(obj: Any, indent: bool = False) -> str:
+        """Serialize obj to a JSON string (stdlib fallback, byte-identical to orjson)."""
+        if indent:
+            return json.dumps(obj, indent=2, separators=(",", ": "), ensure_ascii=False)
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+
+    def _dumps_bytes(obj: Any, indent: bool = False) -> bytes:
+        """Serialize obj to UTF-8 JSON bytes with a trailing newline (stdlib fallback)."""
+        return (_dumps(obj, indent) + "\n").encode("utf-8")
+
+    def _loads(data: Any) -> Any:
+        """Parse JSON from str or bytes (stdlib fallback)."""
+        return json.loads(data)
+
+
+def _error_obj(code: str, message: str, retryable: bool = False, **extra: Any) -> Dict[str, Any]:
+    """Build the error envelope (SDD §4.2.2 Error Taxonomy)."""
+    obj = {"error": True, "code": code, "message": message, "retryable": retryable}
+    obj.update(extra)
+    return obj
+
+
+def _error_json(code: str, message: str, retryable: bool = False, **extra: Any) -> str:
+    """Format error as JSON for stderr (SDD §4.2.2 Error Taxonomy)."""
+    return _dumps(_error_obj(code, message, retryable, **extra))
+
+
+# Prompts larger than this fail fast (override: defaults.max_input_bytes)
+MAX_INPUT_BYTES = 8 * 1024 * 1024
+
+# Fast argv path: option → (dest, type) for value options, flag → dest for
+# store_true flags. Must mirror _build_parser(); anything else (--help,
+# abbreviations, bad values) falls back to argparse for its error handling.
+_FAST_OPTIONS: Dict[str, Tuple[str, Any]] = {
+    "--agent": ("agent", str),
+    "--input": ("input", str),
+    "--prompt": ("prompt", str),
+    "--system": ("system", str),
+    "--model": ("model", str),
+    "--max-tokens": ("max_tokens", int),
+    "--output-format": ("output_format", str),
+    "--timeout": ("timeout", int),
+    "--poll": ("poll_id", str),
+    "--cancel": ("cancel_id", str),
+    "--concurrency": ("concurrency", int),
+}
+_FAST_FLAGS: Dict[str, str] = {
+    "--json-errors": "json_errors",
+    "--include-thinking": "include_thinking",
+    "--async": "async_mode",
+    "--dry-run": "dry_run",
+    "--print-effective-config": "print_config",
+    "--validate-bindings": "validate_bindings",
+    "--batch": "batch",
+    "--serve": "serve",
+}
+_FAST_DEFAULTS: Dict[str, Any] = {
+    **{dest: None for dest, _ in _FAST_OPTIONS.values()},
+    **{dest: False for dest in _FAST_FLAGS.values()},
+    "max_tokens": 4096,
+    "output_format": "text",
+    "concurrency": 1,
+}
+
+
+def _fast_parse_args(argv: List[str]) -> Optional[argparse.Namespace]:
+    """Parse the common flag set without building an ArgumentParser.
+
+    Returns None when argv needs argparse (unknown flag, --help, bad value).
+    """
+    values = dict(_FAST_DEFAULTS)
+    i = 0
+    while i < len(argv):
+        arg = argv[i]
+        if arg in _FAST_FLAGS:
+            values[_FAST_FLAGS[arg]] = True
+            i += 1
+            continue
+        name, eq, value = arg.partition("=")
+        if name not in _FAST_OPTIONS:
+            return None
+        if not eq:
+            if i + 1 >= len(argv) or argv[i + 1].startswith("-"):
+                return None
+            value = argv[i + 1]
+            i += 1
+        i += 1
+        dest, conv = _FAST_OPTIONS[name]
+        try:
+            values[dest] = conv(value)
+        except ValueError:
+            return None
+    if values["output_format"] not in ("text", "json"):
+        return None
+    return argparse.Namespace(**values)
+
+
+def _reads_stdin(args: argparse.Namespace) -> bool:
+    """True if args runs a command that reads stdin when run in-process."""
+    if args.print_config or args.validate_bindings or args.poll_id or args.cancel_id or args.serve:
+        return False
+    if args.batch:
+        return not args.input
+    return bool(args.agent) and not (args.dry_run or args.prompt or args.input)
+
+
+# Daemon client (CHEVAL_DAEMON=1): hand argv to a running `--serve` process
+# before importing the provider stack; fall through if none is reachable.
+# argv the fast parser can't handle (abbreviations, --help) runs in-process.
+_daemon_args = _fast_parse_args(sys.argv[1:]) if __name__ == "__main__" and os.environ.get("CHEVAL_DAEMON") == "1" else None
+if _daemon_args is not None and not _daemon_args.serve:
+    from loa_cheval.daemon import forward
+
+    _exit_code = forward(
+        sys.argv[1:],
+        read_stdin=_reads_stdin(_daemon_args),
+        max_stdin_bytes=MAX_INPUT_BYTES,
+        error_json=_error_json,
+    )
+    if _exit_code is not None:
+        sys.exit(_exit_code)
+
 from loa_cheval.types import (
     BudgetExceededError,
     ChevalError,
@@ -36,16 +185,13 @@ from loa_cheval.types import (
     RateLimitError,
     RetriesExhaustedError,
 )
-from loa_cheval.config.loader import get_config, get_effective_config_display, load_config
+from loa_cheval.config.loader import get_config, get_effective_config_display, get_effective_config_entries, load_config
 from loa_cheval.routing.resolver import (
     NATIVE_PROVIDER,
     resolve_execution,
     validate_bindings,
 )
-from loa_cheval.routing.context_filter import audit_filter_context
-from loa_cheval.providers import get_adapter
 from loa_cheval.types import ProviderConfig, ModelConfig
-from loa_cheval.metering.budget import BudgetEnforcer
 
 # Configure logging to stderr only
 logging.basicConfig(
@@ -55,31 +201,95 @@ logging.basicConfig(
 )
 logger = logging.getLogger("loa_cheval")
 
-# Exit code mapping (SDD §4.2.2)
-EXIT_CODES = {
-    "SUCCESS": 0,
-    "API_ERROR": 1,
-    "RATE_LIMITED": 1,
-    "PROVIDER_UNAVAILABLE": 1,
-    "RETRIES_EXHAUSTED": 1,
-    "INVALID_INPUT": 2,
-    "INVALID_CONFIG": 2,
-    "NATIVE_RUNTIME_REQUIRED": 2,
-    "TIMEOUT": 3,
-    "MISSING_API_KEY": 4,
-    "INVALID_RESPONSE": 5,
-    "BUDGET_EXCEEDED": 6,
-    "CONTEXT_TOO_LARGE": 7,
-    "INTERACTION_PENDING": 8,
-}
-
-
-def _error_json(code: str, message: str, retryable: bool = False, **extra: Any) -> str:
-    """Format error as JSON for stderr (SDD §4.2.2 Error Taxonomy)."""
-    obj = {"error": True, "code": code, "message": message, "retryable": retryable}
-    obj.update(extra)
-    return json.dumps(obj)
 
+# Exit codes (SDD §4.2.2). Several error codes share a value; IntEnum keeps
+# those as aliases, so Exit.RATE_LIMITED == Exit.API_ERROR == 1.
+class Exit(IntEnum):
+    SUCCESS = 0
+    API_ERROR = 1
+    RATE_LIMITED = 1
+    PROVIDER_UNAVAILABLE = 1
+    RETRIES_EXHAUSTED = 1
+    INVALID_INPUT = 2
+    INVALID_CONFIG = 2
+    NATIVE_RUNTIME_REQUIRED = 2
+    TIMEOUT = 3
+    MISSING_API_KEY = 4
+    INVALID_RESPONSE = 5
+    BUDGET_EXCEEDED = 6
+    CONTEXT_TOO_LARGE = 7
+    INTERACTION_PENDING = 8
+
+
+# Error code string → exit code, for dynamic lookups on ChevalError.code
+# (includes the aliases, which iterating Exit would skip).
+EXIT_CODES: Dict[str, Exit] = dict(Exit.__members__)
+
+
+# Env vars whose values are scrubbed from unexpected error messages
+_API_KEY_ENV_VARS = ("OPENAI_API_KEY", "ANTHROPIC_API_KEY", "MOONSHOT_API_KEY", "GOOGLE_API_KEY")
+
+
+# Try pyahocorasick — optional multi-pattern automaton, regex alternation fallback
+try:
+    import ahocorasick
+
+    @functools.lru_cache(maxsize=1)
+    def _secret_automaton(secrets: Tuple[str, ...]) -> Any:
+        """Build an Aho-Corasick automaton over the non-empty secret values."""
+        values = {v for v in secrets if v}
+        if not values:
+            return None
+        automaton = ahocorasick.Automaton()
+        for value in values:
+            automaton.add_word(value, len(value))
+        automaton.make_automaton()
+        return automaton
+
+    def _redact_secrets(msg: str) -> str:
+        """Replace any live API key value in msg with ***REDACTED*** in one pass.
+
+        The automaton is cached on the current key values, so it is rebuilt
+        only when the environment changes.
+        """
+        automaton = _secret_automaton(tuple(os.environ.get(k, "") for k in _API_KEY_ENV_VARS))
+        if automaton is None:
+            return msg
+        parts: List[str] = []
+        pos = 0
+        # iter_long: leftmost-longest, non-overlapping matches as (end, length)
+        for end, length in automaton.iter_long(msg):
+            parts.append(msg[pos:end - length + 1])
+            parts.append("***REDACTED***")
+            pos = end + 1
+        parts.append(msg[pos:])
+        return "".join(parts)
+except ImportError:
+
+    @functools.lru_cache(maxsize=1)
+    def _secret_pattern(secrets: Tuple[str, ...]) -> Optional["re.Pattern[str]"]:
+        """Compile one alternation over the non-empty secret values (longest first)."""
+        values = sorted({v for v in secrets if v}, key=len, reverse=True)
+        if not values:
+            return None
+        return re.compile("|".join(map(re.escape, values)))
+
+    def _redact_secrets(msg: str) -> str:
+        """Replace any live API key value in msg with ***REDACTED*** in one pass.
+
+        The compiled pattern is cached on the current key values, so it is
+        rebuilt only when the environment changes.
+        """
+        pattern = _secret_pattern(tuple(os.environ.get(k, "") for k in _API_KEY_ENV_VARS))
+        if pattern is None:
+            return msg
+        return pattern.sub("***REDACTED***", msg)
+
+
+# Message roles, interned explicitly so dict lookups on them compare by
+# identity even against roles that arrive via JSON (batch jobs, adapters).
+ROLE_SYSTEM = sys.intern("system")
+ROLE_USER = sys.intern("user")
 
 CONTEXT_SEPARATOR = "\n\n---\n\n"
 CONTEXT_WRAPPER_START = (
@@ -93,6 +303,91 @@ PERSONA_AUTHORITY = (
 )
 
 
+# Prompt file cache: absolute path → (st_mtime_ns, st_size, stripped text).
+# Revalidated with a single stat() per lookup; LRU-bounded for long-lived
+# processes that cycle through many agents. Locked for --batch --concurrency.
+_PERSONA_CACHE: "OrderedDict[str, Tuple[int, int, str]]" = OrderedDict()
+_PERSONA_CACHE_MAXSIZE = 100
+_PERSONA_CACHE_LOCK = threading.Lock()
+
+
+def _read_prompt_file(path: Path) -> Optional[str]:
+    """Read and strip a prompt file, reusing the cached text if unchanged.
+
+    Returns None if the file does not exist.
+    """
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+
+    key = os.path.abspath(path)
+    with _PERSONA_CACHE_LOCK:
+        cached = _PERSONA_CACHE.get(key)
+        if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            _PERSONA_CACHE.move_to_end(key)
+            return cached[2]
+
+    text = path.read_text().strip()
+    with _PERSONA_CACHE_LOCK:
+        _PERSONA_CACHE[key] = (st.st_mtime_ns, st.st_size, text)
+        _PERSONA_CACHE.move_to_end(key)
+        if len(_PERSONA_CACHE) > _PERSONA_CACHE_MAXSIZE:
+            _PERSONA_CACHE.popitem(last=False)
+    return text
+
+
+# Persona search dir listing: absolute dir → (st_mtime_ns, subdirectory names).
+# One os.scandir() per directory change lets lookups skip agents that have no
+# directory at all without stat()ing their persona.md candidates.
+_AGENT_DIRS: Dict[str, Tuple[int, frozenset]] = {}
+
+
+def _agent_dirs(search_dir: str) -> frozenset:
+    """Return the names of subdirectories of search_dir (empty if missing)."""
+    key = os.path.abspath(search_dir)
+    try:
+        mtime_ns = os.stat(key).st_mtime_ns
+    except OSError:
+        return frozenset()
+
+    with _PERSONA_CACHE_LOCK:
+        cached = _AGENT_DIRS.get(key)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+
+    with os.scandir(key) as it:
+        names = frozenset(entry.name for entry in it if entry.is_dir())
+    with _PERSONA_CACHE_LOCK:
+        _AGENT_DIRS[key] = (mtime_ns, names)
+    return names
+
+
+def _clear_persona_cache() -> None:
+    """Clear the prompt file cache. Used for testing."""
+    with _PERSONA_CACHE_LOCK:
+        _PERSONA_CACHE.clear()
+        _AGENT_DIRS.clear()
+    _merge_prompts.cache_clear()
+
+
+@functools.lru_cache(maxsize=32)
+def _merge_prompts(persona_text: str, system_text: str) -> str:
+    """Persona + separator + context-isolated system + authority reinforcement.
+
+    Cached: _read_prompt_file hands back the same str objects while files are
+    unchanged, so lookups hit on identity and reuse the merged prompt.
+    """
+    return "".join((
+        persona_text,
+        CONTEXT_SEPARATOR,
+        CONTEXT_WRAPPER_START,
+        system_text,
+        CONTEXT_WRAPPER_END,
+        PERSONA_AUTHORITY,
+    ))
+
+
 def _load_persona(agent_name: str, system_override: Optional[str] = None) -> Optional[str]:
     """Load persona.md for the given agent with optional system merge (SDD §4.3.2).
 
@@ -102,6 +397,9 @@ def _load_persona(agent_name: str, system_override: Optional[str] = None) -> Opt
          context isolation wrapper
       3. If --system file missing: fall back to persona alone (not None)
       4. If no persona found: return system alone (backward compat) or None
+
+    File contents are cached per path and revalidated by mtime + size;
+    agents without a directory in a search dir are skipped via _agent_dirs().
     """
     # Step 1: Find persona.md
     persona_text = None
@@ -109,8 +407,10 @@ def _load_persona(agent_name: str, system_override: Optional[str] = None) -> Opt
     for search_dir in [".claude/skills", ".claude"]:
         persona_path = Path(search_dir) / agent_name / "persona.md"
         searched_paths.append(str(persona_path))
-        if persona_path.exists():
-            persona_text = persona_path.read_text().strip()
+        if agent_name not in _agent_dirs(search_dir):
+            continue
+        persona_text = _read_prompt_file(persona_path)
+        if persona_text is not None:
             break
 
     if persona_text is None:
@@ -123,23 +423,13 @@ def _load_persona(agent_name: str, system_override: Optional[str] = None) -> Opt
     # Step 2: Load --system override if provided
     system_text = None
     if system_override:
-        path = Path(system_override)
-        if path.exists():
-            system_text = path.read_text().strip()
-        else:
+        system_text = _read_prompt_file(Path(system_override))
+        if system_text is None:
             logger.warning("System prompt file not found: %s — falling back to persona", system_override)
 
     # Step 3: Merge or return
     if persona_text and system_text:
-        # Merge: persona + separator + context-isolated system + authority reinforcement
-        return (
-            persona_text
-            + CONTEXT_SEPARATOR
-            + CONTEXT_WRAPPER_START
-            + system_text
-            + CONTEXT_WRAPPER_END
-            + PERSONA_AUTHORITY
-        )
+        return _merge_prompts(persona_text, system_text)
     elif persona_text:
         return persona_text
     elif system_text:
@@ -149,8 +439,91 @@ def _load_persona(agent_name: str, system_override: Optional[str] = None) -> Opt
         return None
 
 
+def _write_bytes(out: TextIO, data: bytes) -> None:
+    """Write UTF-8 bytes to out's binary buffer in one write (decoded for text-only streams)."""
+    buffer = getattr(out, "buffer", None)
+    if buffer is None:
+        out.write(data.decode("utf-8"))
+        return
+    out.flush()
+    buffer.write(data)
+    buffer.flush()
+
+
+def _write_text(out: TextIO, text: str) -> None:
+    """Write text plus newline, as one encode + write on binary-capable streams."""
+    _write_bytes(out, text.encode("utf-8") + b"\n")
+
+
+def _write_json(out: TextIO, obj: Any, indent: bool = False) -> None:
+    """Write obj as one JSON line (or indented block) without a str round-trip."""
+    _write_bytes(out, _dumps_bytes(obj, indent))
+
+
+def _write_error(err: TextIO, code: str, message: str, retryable: bool = False, **extra: Any) -> None:
+    """Write one error envelope line to err (normally stderr)."""
+    _write_bytes(err, _dumps_bytes(_error_obj(code, message, retryable, **extra)))
+
+
+_STDIN_CHUNK = 64 * 1024
+
+
+def _read_stdin(max_bytes: int = MAX_INPUT_BYTES) -> str:
+    """Read stdin as UTF-8 in 64 KiB chunks with one decode at the end.
+
+    Raises InvalidInputError as soon as more than max_bytes arrive, without
+    draining the rest. Text-only streams (no binary buffer) are read as-is.
+    """
+    buffer = getattr(sys.stdin, "buffer", None)
+    if buffer is None:
+        text = sys.stdin.read(max_bytes + 1)
+        if len(text) > max_bytes or len(text.encode("utf-8")) > max_bytes:
+            raise InvalidInputError(f"Input exceeds max_input_bytes ({max_bytes})")
+        return text
+
+    read = getattr(buffer, "read1", buffer.read)
+    data = bytearray()
+    while True:
+        chunk = read(_STDIN_CHUNK)
+        if not chunk:
+            break
+        data += chunk
+        if len(data) > max_bytes:
+            raise InvalidInputError(f"Input exceeds max_input_bytes ({max_bytes})")
+    return data.decode("utf-8")
+
+
+# Built ProviderConfigs: (provider name, id(config)) → (config, ProviderConfig).
+# Loaded configs are never mutated, so a config object's identity fixes the
+# result; the stored reference keeps the id from being reused while cached.
+# LRU-bounded so several live configs (batch, daemon) don't evict each other.
+_PROVIDER_CONFIGS: "OrderedDict[Tuple[str, int], Tuple[Dict[str, Any], ProviderConfig]]" = OrderedDict()
+_PROVIDER_CONFIGS_MAXSIZE = 32
+_PROVIDER_CONFIGS_LOCK = threading.Lock()
+
+
+def _clear_provider_config_cache() -> None:
+    """Clear the built ProviderConfig cache. Used for testing."""
+    with _PROVIDER_CONFIGS_LOCK:
+        _PROVIDER_CONFIGS.clear()
+
+
+def _strip_thinking(extra: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """Drop thinking config from a model's extra (thinking_traces flag false)."""
+    if not extra:
+        return extra
+    return {k: v for k, v in extra.items() if k not in ("thinking_level", "thinking_budget")}
+
+
 def _build_provider_config(provider_name: str, config: Dict[str, Any]) -> ProviderConfig:
     """Build ProviderConfig from merged hounfour config."""
+    key = (provider_name, id(config))
+    with _PROVIDER_CONFIGS_LOCK:
+        cached = _PROVIDER_CONFIGS.get(key)
+        if cached is not None and cached[0] is config:
+            _PROVIDER_CONFIGS.move_to_end(key)
+            return cached[1]
+
     providers = config.get("providers", {})
     if provider_name not in providers:
         raise ConfigError(f"Provider '{provider_name}' not configured")
@@ -160,24 +533,19 @@ def _build_provider_config(provider_name: str, config: Dict[str, Any]) -> Provid
     thinking_enabled = flags.get("thinking_traces", True)
 
     prov = providers[provider_name]
-    models_raw = prov.get("models", {})
-    models = {}
-    for model_id, model_data in models_raw.items():
-        extra = model_data.get("extra")
-        # Strip thinking config when thinking_traces flag is false
-        if extra and not thinking_enabled:
-            extra = {k: v for k, v in extra.items()
-                     if k not in ("thinking_level", "thinking_budget")}
-        models[model_id] = ModelConfig(
+    models = {
+        model_id: ModelConfig(
             capabilities=model_data.get("capabilities", []),
             context_window=model_data.get("context_window", 128000),
             token_param=model_data.get("token_param", "max_tokens"),
             pricing=model_data.get("pricing"),
             api_mode=model_data.get("api_mode"),
-            extra=extra,
+            extra=model_data.get("extra") if thinking_enabled else _strip_thinking(model_data.get("extra")),
         )
+        for model_id, model_data in prov.get("models", {}).items()
+    }
 
-    return ProviderConfig(
+    provider_config = ProviderConfig(
         name=provider_name,
         type=prov.get("type", "openai"),
         endpoint=prov.get("endpoint", ""),
@@ -187,6 +555,107 @@ def _build_provider_config(provider_name: str, config: Dict[str, Any]) -> Provid
         read_timeout=prov.get("read_timeout", 120.0),
         write_timeout=prov.get("write_timeout", 30.0),
     )
+    with _PROVIDER_CONFIGS_LOCK:
+        _PROVIDER_CONFIGS[key] = (config, provider_config)
+        if len(_PROVIDER_CONFIGS) > _PROVIDER_CONFIGS_MAXSIZE:
+            _PROVIDER_CONFIGS.popitem(last=False)
+    return provider_config
+
+
+# Adapter cache: (provider, endpoint, config digest) → adapter. Reused across
+# invocations in one process (--batch) so HTTP connections stay warm. The
+# digest covers the auth value, so secrets never appear in the key.
+_ADAPTER_CACHE: "OrderedDict[Tuple[str, str, str], Any]" = OrderedDict()
+_ADAPTER_CACHE_MAXSIZE = 16
+_ADAPTER_CACHE_LOCK = threading.Lock()
+
+
+def _get_cached_adapter(provider_name: str, config: Dict[str, Any]) -> Any:
+    """Return a (possibly shared) adapter for provider_name."""
+    from loa_cheval.providers import get_adapter
+
+    provider_config = _build_provider_config(provider_name, config)
+    digest = hashlib.blake2b(digest_size=8)
+    digest.update(str(provider_config.auth).encode("utf-8"))
+    digest.update(repr(dataclasses.replace(provider_config, auth="")).encode("utf-8"))
+    key = (provider_name, provider_config.endpoint, digest.hexdigest())
+
+    with _ADAPTER_CACHE_LOCK:
+        adapter = _ADAPTER_CACHE.get(key)
+        if adapter is not None:
+            _ADAPTER_CACHE.move_to_end(key)
+            return adapter
+
+    adapter = get_adapter(provider_config)
+    with _ADAPTER_CACHE_LOCK:
+        adapter = _ADAPTER_CACHE.setdefault(key, adapter)
+        _ADAPTER_CACHE.move_to_end(key)
+        if len(_ADAPTER_CACHE) > _ADAPTER_CACHE_MAXSIZE:
+            _ADAPTER_CACHE.popitem(last=False)
+    return adapter
+
+
+def _clear_adapter_cache() -> None:
+    """Clear the adapter cache. Used for testing."""
+    with _ADAPTER_CACHE_LOCK:
+        _ADAPTER_CACHE.clear()
+
+
+@dataclasses.dataclass(frozen=True)
+class FeatureFlags:
+    """hounfour.feature_flags resolved once per invocation (all default on)."""
+
+    google_adapter: bool = True
+    deep_research: bool = True
+    thinking_traces: bool = True
+    metering: bool = True
+    # BB-603: mixed-type — False | "audit" | "enforce"
+    context_filtering: Any = False
+
+    @classmethod
+    def from_config(cls, hounfour: Dict[str, Any]) -> "FeatureFlags":
+        flags = hounfour.get("feature_flags", {})
+        return cls(
+            google_adapter=flags.get("google_adapter", True),
+            deep_research=flags.get("deep_research", True),
+            thinking_traces=flags.get("thinking_traces", True),
+            metering=flags.get("metering", True),
+            context_filtering=flags.get("context_filtering", False),
+        )
+
+
+_DEFAULT_FLAGS = FeatureFlags()
+
+# Last resolved (feature_flags dict, FeatureFlags). Loaded configs are never
+# mutated, so the dict's identity fixes the result; holding the reference
+# keeps its id from being reused. Batch jobs and daemon requests sharing one
+# config resolve flags once.
+_FLAGS_MEMO: Optional[Tuple[Dict[str, Any], FeatureFlags]] = None
+
+
+def _feature_flags(hounfour: Dict[str, Any]) -> FeatureFlags:
+    """FeatureFlags for hounfour, reused while its feature_flags dict is unchanged."""
+    global _FLAGS_MEMO
+    raw = hounfour.get("feature_flags")
+    if not raw:
+        return _DEFAULT_FLAGS
+    memo = _FLAGS_MEMO
+    if memo is not None and memo[0] is raw:
+        return memo[1]
+    flags = FeatureFlags.from_config(hounfour)
+    _FLAGS_MEMO = (raw, flags)
+    return flags
+
+
+def _check_flags(flags: FeatureFlags, provider: str, model_id: str) -> Optional[str]:
+    """Check resolved feature flags. Returns error message if blocked, None if allowed."""
+    if provider == "google" and not flags.google_adapter:
+        return "Google adapter is disabled (hounfour.feature_flags.google_adapter: false)"
+
+    if "deep-research" in model_id and not flags.deep_research:
+        return "Deep Research is disabled (hounfour.feature_flags.deep_research: false)"
+
+    return None
 
 
 def _check_feature_flags(hounfour: Dict[str, Any], provider: str, model_id: str) -> Optional[str]:
@@ -197,26 +666,48 @@ def _check_feature_flags(hounfour: Dict[str, Any], provider: str, model_id: str)
     - hounfour.deep_research: blocks Deep Research models
     - hounfour.thinking_traces: suppresses thinking config
     """
-    flags = hounfour.get("feature_flags", {})
+    return _check_flags(_feature_flags(hounfour), provider, model_id)
 
-    if provider == "google" and not flags.get("google_adapter", True):
-        return "Google adapter is disabled (hounfour.feature_flags.google_adapter: false)"
 
-    if "deep-research" in model_id and not flags.get("deep_research", True):
-        return "Deep Research is disabled (hounfour.feature_flags.deep_research: false)"
+def _hounfour_view(config: Dict[str, Any]) -> Dict[str, Any]:
+    """The hounfour section of config.
 
-    return None
+    load_config() already returns it unwrapped; configs handed in directly
+    (tests, embedding callers) may still carry the top-level "hounfour" key.
+    """
+    if "providers" in config:
+        return config
+    return config.get("hounfour", config)
 
 
-def cmd_invoke(args: argparse.Namespace) -> int:
-    """Main invocation: resolve agent → call provider → return response."""
-    config, sources = load_config(cli_args=vars(args))
-    hounfour = config if "providers" in config else config.get("hounfour", config)
+# Config sections read by binding resolution; --dry-run also checks flags.
+# Loading just these skips copying and interpolating everything else.
+_BINDING_SECTIONS = frozenset({"agents", "aliases", "providers"})
+_DRY_RUN_SECTIONS = _BINDING_SECTIONS | {"feature_flags"}
+
+
+def cmd_invoke(
+    args: argparse.Namespace,
+    out: Optional[TextIO] = None,
+    err: Optional[TextIO] = None,
+    config: Optional[Dict[str, Any]] = None,
+) -> int:
+    """Main invocation: resolve agent → call provider → return response.
+
+    out/err default to sys.stdout/sys.stderr; config defaults to a fresh
+    load_config(). Batch mode passes per-job buffers and a shared config.
+    """
+    out = out or sys.stdout
+    err = err or sys.stderr
+    if config is None:
+        only = _DRY_RUN_SECTIONS if args.dry_run else None
+        config, _ = load_config(cli_args=vars(args), only=only)
+    hounfour = _hounfour_view(config)
 
     agent_name = args.agent
     if not agent_name:
-        print(_error_json("INVALID_INPUT", "Missing --agent argument"), file=sys.stderr)
-        return EXIT_CODES["INVALID_INPUT"]
+        _write_error(err, "INVALID_INPUT", "Missing --agent argument")
+        return Exit.INVALID_INPUT
 
     # Resolve agent → provider:model
     try:
@@ -226,22 +717,23 @@ def cmd_invoke(args: argparse.Namespace) -> int:
             model_override=args.model,
         )
     except NativeRuntimeRequired as e:
-        print(_error_json(e.code, str(e)), file=sys.stderr)
-        return EXIT_CODES["NATIVE_RUNTIME_REQUIRED"]
+        _write_error(err, e.code, str(e))
+        return Exit.NATIVE_RUNTIME_REQUIRED
     except (ConfigError, InvalidInputError) as e:
-        print(_error_json(e.code, str(e)), file=sys.stderr)
-        return EXIT_CODES.get(e.code, 2)
+        _write_error(err, e.code, str(e))
+        return EXIT_CODES.get(e.code, Exit.INVALID_INPUT)
 
     # Native provider — should not reach model-invoke
     if resolved.provider == NATIVE_PROVIDER:
-        print(_error_json("INVALID_CONFIG", f"Agent '{agent_name}' is bound to native runtime — use SKILL.md directly, not model-invoke"), file=sys.stderr)
-        return EXIT_CODES["INVALID_CONFIG"]
+        _write_error(err, "INVALID_CONFIG", f"Agent '{agent_name}' is bound to native runtime — use SKILL.md directly, not model-invoke")
+        return Exit.INVALID_CONFIG
 
     # Feature flag check (Task 3.6)
-    flag_error = _check_feature_flags(hounfour, resolved.provider, resolved.model_id)
+    flags = _feature_flags(hounfour)
+    flag_error = _check_flags(flags, resolved.provider, resolved.model_id)
     if flag_error:
-        print(_error_json("INVALID_CONFIG", flag_error), file=sys.stderr)
-        return EXIT_CODES["INVALID_CONFIG"]
+        _write_error(err, "INVALID_CONFIG", flag_error)
+        return Exit.INVALID_CONFIG
 
     # Dry run — print resolved model and exit
     if args.dry_run:
@@ -251,39 +743,48 @@ def cmd_invoke(args: argparse.Namespace) -> int:
             "resolved_model": resolved.model_id,
             "temperature": binding.temperature,
         }
-        print(json.dumps(result, indent=2), file=sys.stdout)
-        return EXIT_CODES["SUCCESS"]
+        _write_json(out, result, indent=True)
+        return Exit.SUCCESS
 
     # Load input content (--prompt takes priority over --input/stdin)
     input_text = ""
+    max_input_bytes = hounfour.get("defaults", {}).get("max_input_bytes", MAX_INPUT_BYTES)
     if args.prompt and args.input:
-        print(_error_json("INVALID_INPUT", "--prompt and --input are mutually exclusive"), file=sys.stderr)
-        return EXIT_CODES["INVALID_INPUT"]
+        _write_error(err, "INVALID_INPUT", "--prompt and --input are mutually exclusive")
+        return Exit.INVALID_INPUT
 
     if args.prompt:
         input_text = args.prompt
     elif args.input:
         input_path = Path(args.input)
-        if input_path.exists():
-            input_text = input_path.read_text()
-        else:
-            print(_error_json("INVALID_INPUT", f"Input file not found: {args.input}"), file=sys.stderr)
-            return EXIT_CODES["INVALID_INPUT"]
+        try:
+            size = input_path.stat().st_size
+        except OSError:
+            _write_error(err, "INVALID_INPUT", f"Input file not found: {args.input}")
+            return Exit.INVALID_INPUT
+        if size > max_input_bytes:
+            _write_error(err, "INVALID_INPUT", f"Input file exceeds max_input_bytes ({max_input_bytes}): {args.input}")
+            return Exit.INVALID_INPUT
+        input_text = input_path.read_bytes().decode("utf-8")
     elif not sys.stdin.isatty():
-        input_text = sys.stdin.read()
+        try:
+            input_text = _read_stdin(max_input_bytes)
+        except InvalidInputError as e:
+            _write_error(err, e.code, str(e))
+            return Exit.INVALID_INPUT
 
     if not input_text:
-        print(_error_json("INVALID_INPUT", "No input provided. Use --prompt, --input <file>, or pipe to stdin."), file=sys.stderr)
-        return EXIT_CODES["INVALID_INPUT"]
-
-    # Build messages
-    messages = []
+        _write_error(err, "INVALID_INPUT", "No input provided. Use --prompt, --input <file>, or pipe to stdin.")
+        return Exit.INVALID_INPUT
 
+    # Build messages (tuple: adapters only iterate/serialize them)
     # System prompt: persona.md merged with --system (context isolation)
     persona = _load_persona(agent_name, system_override=args.system)
+    user_message = {"role": ROLE_USER, "content": input_text}
     if persona:
-        messages.append({"role": "system", "content": persona})
+        messages = ({"role": ROLE_SYSTEM, "content": persona}, user_message)
     else:
+        messages = (user_message,)
         logger.warning(
             "No system prompt loaded for agent '%s'. "
             "Expected persona at: .claude/skills/%s/persona.md — "
@@ -292,16 +793,14 @@ def cmd_invoke(args: argparse.Namespace) -> int:
             agent_name,
         )
 
-    messages.append({"role": "user", "content": input_text})
-
     # Epistemic context filtering (BB-501: audit mode, Sprint 9)
     # When context_filtering flag is set, run filter in the configured mode.
     # "audit" = log only (no message modification), "enforce" = apply filtering.
     # BB-603: Intentionally mixed-type flag (bool false | string "audit"|"enforce").
     # Other feature flags are bool-only; this uses strings for mode selection.
-    flags = hounfour.get("feature_flags", {})
-    context_filtering_mode = flags.get("context_filtering", False)
+    context_filtering_mode = flags.context_filtering
     if context_filtering_mode == "audit":
+        from loa_cheval.routing.context_filter import audit_filter_context
         messages = audit_filter_context(
             messages,
             resolved.provider,
@@ -326,16 +825,15 @@ def cmd_invoke(args: argparse.Namespace) -> int:
         metadata={"agent": agent_name},
     )
 
-    # Get adapter and call
+    # Get adapter and call (provider stack imported only when actually invoking)
     try:
-        provider_config = _build_provider_config(resolved.provider, hounfour)
-        adapter = get_adapter(provider_config)
+        adapter = _get_cached_adapter(resolved.provider, hounfour)
 
         # Non-blocking async mode (Task 2.5)
         if getattr(args, "async_mode", False):
             if not hasattr(adapter, "create_interaction"):
-                print(_error_json("INVALID_INPUT", f"Provider '{resolved.provider}' does not support --async"), file=sys.stderr)
-                return EXIT_CODES["INVALID_INPUT"]
+                _write_error(err, "INVALID_INPUT", f"Provider '{resolved.provider}' does not support --async")
+                return Exit.INVALID_INPUT
 
             model_config = adapter._get_model_config(resolved.model_id)
             interaction = adapter.create_interaction(request, model_config)
@@ -345,16 +843,16 @@ def cmd_invoke(args: argparse.Namespace) -> int:
                 "provider": resolved.provider,
                 "status": "pending",
             }
-            print(json.dumps(output), file=sys.stdout)
-            return EXIT_CODES["INTERACTION_PENDING"]
+            _write_json(out, output)
+            return Exit.INTERACTION_PENDING
 
         # Budget hook: real enforcer when metering enabled, no-op otherwise (Task 3.2)
         budget_hook = None
-        flags = hounfour.get("feature_flags", {})
-        metering_enabled = flags.get("metering", True)
-        if metering_enabled:
+        if flags.metering:
             metering_config = hounfour.get("metering", {})
             if metering_config.get("enabled", True):
+                from loa_cheval.metering.budget import BudgetEnforcer
+
                 ledger_path = metering_config.get("ledger_path", ".run/cost-ledger.jsonl")
                 budget_hook = BudgetEnforcer(
                     config=hounfour,
@@ -374,7 +872,6 @@ def cmd_invoke(args: argparse.Namespace) -> int:
             if budget_hook:
                 status = budget_hook.pre_call(request)
                 if status == "BLOCK":
-                    from loa_cheval.types import BudgetExceededError
                     raise BudgetExceededError(spent=0, limit=0)
             result = None
             try:
@@ -402,150 +899,231 @@ def cmd_invoke(args: argparse.Namespace) -> int:
                 output["thinking"] = result.thinking
             if result.tool_calls:
                 output["tool_calls"] = result.tool_calls
-            print(json.dumps(output), file=sys.stdout)
+            _write_json(out, output)
         else:
             # Text mode: thinking NEVER printed
-            print(result.content, file=sys.stdout)
+            _write_text(out, result.content)
 
-        return EXIT_CODES["SUCCESS"]
+        return Exit.SUCCESS
 
     except BudgetExceededError as e:
-        print(_error_json(e.code, str(e)), file=sys.stderr)
-        return EXIT_CODES["BUDGET_EXCEEDED"]
+        _write_error(err, e.code, str(e))
+        return Exit.BUDGET_EXCEEDED
     except ContextTooLargeError as e:
-        print(_error_json(e.code, str(e)), file=sys.stderr)
-        return EXIT_CODES["CONTEXT_TOO_LARGE"]
+        _write_error(err, e.code, str(e))
+        return Exit.CONTEXT_TOO_LARGE
     except RateLimitError as e:
-        print(_error_json(e.code, str(e), retryable=True), file=sys.stderr)
-        return EXIT_CODES["RATE_LIMITED"]
+        _write_error(err, e.code, str(e), retryable=True)
+        return Exit.RATE_LIMITED
     except ProviderUnavailableError as e:
-        print(_error_json(e.code, str(e), retryable=True), file=sys.stderr)
-        return EXIT_CODES["PROVIDER_UNAVAILABLE"]
+        _write_error(err, e.code, str(e), retryable=True)
+        return Exit.PROVIDER_UNAVAILABLE
     except RetriesExhaustedError as e:
-        print(_error_json(e.code, str(e)), file=sys.stderr)
-        return EXIT_CODES["RETRIES_EXHAUSTED"]
+        _write_error(err, e.code, str(e))
+        return Exit.RETRIES_EXHAUSTED
     except ChevalError as e:
-        print(_error_json(e.code, str(e), retryable=e.retryable), file=sys.stderr)
-        return EXIT_CODES.get(e.code, 1)
+        _write_error(err, e.code, str(e), retryable=e.retryable)
+        return EXIT_CODES.get(e.code, Exit.API_ERROR)
     except Exception as e:
         # Redact sensitive information from unexpected errors
-        msg = str(e)
-        # Strip potential auth values from error messages
-        for env_key in ["OPENAI_API_KEY", "ANTHROPIC_API_KEY", "MOONSHOT_API_KEY", "GOOGLE_API_KEY"]:
-            val = os.environ.get(env_key)
-            if val and val in msg:
-                msg = msg.replace(val, "***REDACTED***")
-        print(_error_json("API_ERROR", msg, retryable=True), file=sys.stderr)
-        return EXIT_CODES["API_ERROR"]
+        msg = _redact_secrets(str(e))
+        _write_error(err, "API_ERROR", msg, retryable=True)
+        return Exit.API_ERROR
 
 
 def cmd_print_config(args: argparse.Namespace) -> int:
-    """Print effective merged config with source annotations."""
-    config, sources = load_config(cli_args=vars(args))
-    from loa_cheval.config.interpolation import redact_config
+    """Print effective merged config with source annotations.
 
-    redacted = redact_config(config)
-    display = get_effective_config_display(redacted, sources)
-    print(display, file=sys.stdout)
-    return EXIT_CODES["SUCCESS"]
+    --output-format json emits {dotted.path: {value, source}} instead of the
+    annotated YAML-style listing.
+    """
+    config, sources = load_config(cli_args=vars(args))
+    if args.output_format == "json":
+        _write_json(sys.stdout, get_effective_config_entries(config, sources), indent=True)
+    else:
+        print(get_effective_config_display(config, sources), file=sys.stdout)
+    return Exit.SUCCESS
 
 
 def cmd_validate_bindings(args: argparse.Namespace) -> int:
     """Validate all agent bindings."""
-    config, _ = load_config(cli_args=vars(args))
-    hounfour = config if "providers" in config else config.get("hounfour", config)
+    config, _ = load_config(cli_args=vars(args), only=_BINDING_SECTIONS)
+    hounfour = _hounfour_view(config)
 
     errors = validate_bindings(hounfour)
     if errors:
-        print(json.dumps({"valid": False, "errors": errors}, indent=2), file=sys.stderr)
-        return EXIT_CODES["INVALID_CONFIG"]
+        _write_json(sys.stderr, {"valid": False, "errors": errors}, indent=True)
+        return Exit.INVALID_CONFIG
 
-    print(json.dumps({"valid": True, "agents": sorted(hounfour.get("agents", {}).keys())}), file=sys.stdout)
-    return EXIT_CODES["SUCCESS"]
+    _write_json(sys.stdout, {"valid": True, "agents": sorted(hounfour.get("agents", {}).keys())})
+    return Exit.SUCCESS
 
 
 def cmd_poll(args: argparse.Namespace) -> int:
     """Poll a Deep Research interaction."""
     if not args.agent:
-        print(_error_json("INVALID_INPUT", "--poll requires --agent to identify provider"), file=sys.stderr)
-        return EXIT_CODES["INVALID_INPUT"]
+        _write_error(sys.stderr, "INVALID_INPUT", "--poll requires --agent to identify provider")
+        return Exit.INVALID_INPUT
 
     config, _ = load_config(cli_args=vars(args))
-    hounfour = config if "providers" in config else config.get("hounfour", config)
+    hounfour = _hounfour_view(config)
 
     try:
         binding, resolved = resolve_execution(args.agent, hounfour, model_override=args.model)
     except (ConfigError, InvalidInputError) as e:
-        print(_error_json(e.code, str(e)), file=sys.stderr)
-        return EXIT_CODES.get(e.code, 2)
+        _write_error(sys.stderr, e.code, str(e))
+        return EXIT_CODES.get(e.code, Exit.INVALID_INPUT)
 
     try:
-        provider_config = _build_provider_config(resolved.provider, hounfour)
-        adapter = get_adapter(provider_config)
+        adapter = _get_cached_adapter(resolved.provider, hounfour)
 
         if not hasattr(adapter, "poll_interaction"):
-            print(_error_json("INVALID_INPUT", f"Provider '{resolved.provider}' does not support --poll"), file=sys.stderr)
-            return EXIT_CODES["INVALID_INPUT"]
+            _write_error(sys.stderr, "INVALID_INPUT", f"Provider '{resolved.provider}' does not support --poll")
+            return Exit.INVALID_INPUT
 
         model_config = adapter._get_model_config(resolved.model_id)
         result = adapter.poll_interaction(args.poll_id, model_config, poll_interval=5, timeout=30)
 
         # Completed — output result
         output = {"status": "completed", "interaction_id": args.poll_id, "result": result}
-        print(json.dumps(output), file=sys.stdout)
-        return EXIT_CODES["SUCCESS"]
+        _write_json(sys.stdout, output)
+        return Exit.SUCCESS
 
     except TimeoutError:
         # Still pending
         output = {"status": "pending", "interaction_id": args.poll_id}
-        print(json.dumps(output), file=sys.stdout)
-        return EXIT_CODES["INTERACTION_PENDING"]
+        _write_json(sys.stdout, output)
+        return Exit.INTERACTION_PENDING
     except ChevalError as e:
-        print(_error_json(e.code, str(e), retryable=e.retryable), file=sys.stderr)
-        return EXIT_CODES.get(e.code, 1)
+        _write_error(sys.stderr, e.code, str(e), retryable=e.retryable)
+        return EXIT_CODES.get(e.code, Exit.API_ERROR)
     except Exception as e:
-        print(_error_json("API_ERROR", str(e)), file=sys.stderr)
-        return EXIT_CODES["API_ERROR"]
+        _write_error(sys.stderr, "API_ERROR", str(e))
+        return Exit.API_ERROR
 
 
 def cmd_cancel(args: argparse.Namespace) -> int:
     """Cancel a Deep Research interaction."""
     if not args.agent:
-        print(_error_json("INVALID_INPUT", "--cancel requires --agent to identify provider"), file=sys.stderr)
-        return EXIT_CODES["INVALID_INPUT"]
+        _write_error(sys.stderr, "INVALID_INPUT", "--cancel requires --agent to identify provider")
+        return Exit.INVALID_INPUT
 
     config, _ = load_config(cli_args=vars(args))
-    hounfour = config if "providers" in config else config.get("hounfour", config)
+    hounfour = _hounfour_view(config)
 
     try:
         binding, resolved = resolve_execution(args.agent, hounfour, model_override=args.model)
     except (ConfigError, InvalidInputError) as e:
-        print(_error_json(e.code, str(e)), file=sys.stderr)
-        return EXIT_CODES.get(e.code, 2)
+        _write_error(sys.stderr, e.code, str(e))
+        return EXIT_CODES.get(e.code, Exit.INVALID_INPUT)
 
     try:
-        provider_config = _build_provider_config(resolved.provider, hounfour)
-        adapter = get_adapter(provider_config)
+        adapter = _get_cached_adapter(resolved.provider, hounfour)
 
         if not hasattr(adapter, "cancel_interaction"):
-            print(_error_json("INVALID_INPUT", f"Provider '{resolved.provider}' does not support --cancel"), file=sys.stderr)
-            return EXIT_CODES["INVALID_INPUT"]
+            _write_error(sys.stderr, "INVALID_INPUT", f"Provider '{resolved.provider}' does not support --cancel")
+            return Exit.INVALID_INPUT
 
         success = adapter.cancel_interaction(args.cancel_id)
         output = {"cancelled": success, "interaction_id": args.cancel_id}
-        print(json.dumps(output), file=sys.stdout)
-        return EXIT_CODES["SUCCESS"]
+        _write_json(sys.stdout, output)
+        return Exit.SUCCESS
 
     except ChevalError as e:
-        print(_error_json(e.code, str(e), retryable=e.retryable), file=sys.stderr)
-        return EXIT_CODES.get(e.code, 1)
+        _write_error(sys.stderr, e.code, str(e), retryable=e.retryable)
+        return EXIT_CODES.get(e.code, Exit.API_ERROR)
     except Exception as e:
-        print(_error_json("API_ERROR", str(e)), file=sys.stderr)
-        return EXIT_CODES["API_ERROR"]
+        _write_error(sys.stderr, "API_ERROR", str(e))
+        return Exit.API_ERROR
 
 
-def main() -> int:
-    """CLI entry point."""
+# Per-job fields accepted by --batch (each maps to the CLI flag of the same name)
+_BATCH_JOB_FIELDS = ("agent", "prompt", "input", "system", "model", "max_tokens", "include_thinking", "dry_run")
+
+
+def _run_batch_job(
+    line: str,
+    defaults: Dict[str, Any],
+    config: Dict[str, Any],
+) -> Tuple[int, Dict[str, Any]]:
+    """Run one NDJSON job through cmd_invoke and return (exit_code, result line)."""
+    try:
+        job = _loads(line)
+        if not isinstance(job, dict):
+            raise ValueError("job must be a JSON object")
+    except ValueError as e:
+        result = {"id": None, "exit_code": int(Exit.INVALID_INPUT)}
+        result.update(_error_obj("INVALID_INPUT", f"Invalid batch job: {e}"))
+        return Exit.INVALID_INPUT, result
+
+    result: Dict[str, Any] = {"id": job.get("id")}
+    unknown = sorted(set(job) - set(_BATCH_JOB_FIELDS) - {"id"})
+    if unknown:
+        result.update(_error_obj("INVALID_INPUT", f"Unknown batch job fields: {unknown}"))
+        result["exit_code"] = int(Exit.INVALID_INPUT)
+        return Exit.INVALID_INPUT, result
+    if not job.get("prompt") and not job.get("input"):
+        # stdin carries the job stream — never fall back to reading it
+        result.update(_error_obj("INVALID_INPUT", "Batch job needs 'prompt' or 'input'"))
+        result["exit_code"] = int(Exit.INVALID_INPUT)
+        return Exit.INVALID_INPUT, result
+
+    job_args = argparse.Namespace(**defaults)
+    for field in _BATCH_JOB_FIELDS:
+        if field in job:
+            setattr(job_args, field, job[field])
+    job_args.output_format = "json"
+
+    out, err = io.StringIO(), io.StringIO()
+    code = cmd_invoke(job_args, out=out, err=err, config=config)
+    result["exit_code"] = int(code)
+    if code in (Exit.SUCCESS, Exit.INTERACTION_PENDING):
+        result.update(_loads(out.getvalue()))
+    else:
+        # Last stderr line is the error JSON; earlier lines may be log output
+        lines = err.getvalue().strip().splitlines()
+        try:
+            result.update(_loads(lines[-1]))
+        except (IndexError, ValueError):
+            result.update(_error_obj("API_ERROR", err.getvalue().strip()))
+    return code, result
+
+
+def cmd_batch(args: argparse.Namespace) -> int:
+    """Run newline-delimited JSON jobs, one result line per job.
+
+    Jobs are read from --input FILE if given, else stdin. Config is loaded
+    once and adapters are cached across jobs. Results are written in input
+    order; --concurrency N runs up to N jobs at a time. Exit code is 0 if
+    every job succeeded, else the first failing job's code.
+    """
+    if args.input:
+        try:
+            with open(args.input, encoding="utf-8") as f:
+                lines = [line for line in f if line.strip()]
+        except OSError as e:
+            _write_error(sys.stderr, "INVALID_INPUT", f"Cannot read batch file {args.input}: {e.strerror}")
+            return Exit.INVALID_INPUT
+    else:
+        lines = [line for line in sys.stdin if line.strip()]
+
+    config, _ = load_config(cli_args=vars(args))
+    defaults = vars(_get_parser().parse_args([]))
+
+    def run(line: str) -> Tuple[int, Dict[str, Any]]:
+        return _run_batch_job(line, defaults, config)
+
+    exit_code = Exit.SUCCESS
+    with ThreadPoolExecutor(max_workers=max(1, args.concurrency)) as pool:
+        for code, result in pool.map(run, lines):
+            _write_json(sys.stdout, result)
+            if code not in (Exit.SUCCESS, Exit.INTERACTION_PENDING) and exit_code == Exit.SUCCESS:
+                exit_code = code
+    return exit_code
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the model-invoke argument parser."""
     parser = argparse.ArgumentParser(
         prog="model-invoke",
         description="Hounfour model-invoke — unified model API entry point",
@@ -573,9 +1151,33 @@ def main() -> int:
     parser.add_argument("--print-effective-config", action="store_true", dest="print_config", help="Print merged config with source annotations")
     parser.add_argument("--validate-bindings", action="store_true", dest="validate_bindings", help="Validate all agent bindings")
 
-    args = parser.parse_args()
+    # Batch mode: NDJSON jobs on stdin, one JSON result per line on stdout
+    parser.add_argument("--batch", action="store_true", help="Read newline-delimited JSON jobs from --input FILE or stdin")
+    parser.add_argument("--concurrency", type=int, default=1, help="Jobs run in parallel in --batch mode")
 
-    # Route to subcommand
+    # Daemon mode: keep the provider stack warm for CHEVAL_DAEMON=1 clients
+    parser.add_argument(
+        "--serve",
+        action="store_true",
+        help="Run as a daemon on a Unix socket ($CHEVAL_DAEMON_SOCKET). Config and adapters are loaded once and "
+        "inherited by a forked worker per request; HTTP connections are per request",
+    )
+
+    return parser
+
+
+@functools.lru_cache(maxsize=1)
+def _get_parser() -> argparse.ArgumentParser:
+    """Shared parser, built on first use; the fast argv path never needs it.
+
+    Parsing doesn't mutate the parser, so CLI, batch and daemon requests
+    reuse one instance (argparse resolves sys.stderr per call).
+    """
+    return _build_parser()
+
+
+def _dispatch(args: argparse.Namespace) -> int:
+    """Route parsed args to the matching subcommand."""
     if args.print_config:
         return cmd_print_config(args)
     if args.validate_bindings:
@@ -584,9 +1186,114 @@ def main() -> int:
         return cmd_poll(args)
     if args.cancel_id:
         return cmd_cancel(args)
+    if args.batch:
+        return cmd_batch(args)
 
     return cmd_invoke(args)
 
 
+def _serve_request(request: Dict[str, Any]) -> Dict[str, Any]:
+    """Run one forwarded invocation inside the daemon process.
+
+    The client's environment, cwd and stdin are swapped in for the duration
+    of the request; stdout/stderr (including log output) are captured.
+    """
+    out, err = io.StringIO(), io.StringIO()
+    saved_env = dict(os.environ)
+    saved_cwd = os.getcwd()
+    saved_stdin = sys.stdin
+    log_handlers = [h for h in logging.getLogger().handlers if isinstance(h, logging.StreamHandler)]
+    saved_streams = [h.stream for h in log_handlers]
+    try:
+        os.environ.clear()
+        os.environ.update(request.get("env") or {})
+        os.chdir(request.get("cwd") or saved_cwd)
+        sys.stdin = io.StringIO(request.get("stdin") or "")
+        for handler in log_handlers:
+            handler.setStream(err)
+        with contextlib.redirect_stdout(out), contextlib.redirect_stderr(err):
+            try:
+                argv = [str(a) for a in request.get("argv") or []]
+                args = _fast_parse_args(argv) or _get_parser().parse_args(argv)
+                if args.serve:
+                    _write_error(err, "INVALID_INPUT", "--serve cannot be forwarded to the daemon")
+                    code = int(Exit.INVALID_INPUT)
+                else:
+                    code = int(_dispatch(args))
+            except SystemExit as e:
+                # argparse --help / usage errors
+                code = e.code if isinstance(e.code, int) else int(Exit.INVALID_INPUT)
+            except Exception as e:
+                _write_error(err, "API_ERROR", _redact_secrets(str(e)), retryable=True)
+                code = int(Exit.API_ERROR)
+    finally:
+        for handler, stream in zip(log_handlers, saved_streams):
+            handler.setStream(stream)
+        sys.stdin = saved_stdin
+        os.chdir(saved_cwd)
+        os.environ.clear()
+        os.environ.update(saved_env)
+    return {"stdout": out.getvalue(), "stderr": err.getvalue(), "exit": code}
+
+
+def _warm_daemon_caches() -> None:
+    """Fill the caches forked daemon workers inherit.
+
+    Imports the lazily loaded adapters, creates the shared HTTP client, loads
+    this project's config (parsed file layers stay cached) and builds an
+    adapter per provider, so a worker whose client has the same project and
+    credentials skips all of it. Open connections are per worker: they are
+    not shared across the fork and close when the worker exits.
+    """
+    import importlib
+
+    from loa_cheval.providers import _ADAPTER_REGISTRY
+    from loa_cheval.providers.base import _detect_http_client, _get_httpx_client
+
+    for module_name, _ in _ADAPTER_REGISTRY.values():
+        importlib.import_module(module_name)
+    if _detect_http_client() == "httpx":
+        _get_httpx_client()
+
+    try:
+        config, _ = load_config()
+    except ConfigError as e:
+        logger.warning("daemon_config_not_warmed error=%s", e)
+        return
+    hounfour = _hounfour_view(config)
+    for provider_name in hounfour.get("providers", {}):
+        try:
+            _get_cached_adapter(provider_name, hounfour)
+        except ChevalError as e:
+            logger.debug("daemon_adapter_not_warmed provider=%s error=%s", provider_name, e)
+
+
+def cmd_serve(args: argparse.Namespace) -> int:
+    """Serve forwarded invocations on the daemon socket until interrupted."""
+    from loa_cheval.daemon import serve, socket_path
+
+    _warm_daemon_caches()
+
+    def ready(path: str) -> None:
+        print(f"[cheval] daemon listening on {path} (clients: CHEVAL_DAEMON=1)", file=sys.stderr)
+
+    try:
+        serve(_serve_request, socket_path(), ready=ready)
+    except KeyboardInterrupt:
+        pass
+    except OSError as e:
+        _write_error(sys.stderr, "INVALID_CONFIG", str(e))
+        return Exit.INVALID_CONFIG
+    return Exit.SUCCESS
+
+
+def main() -> int:
+    """CLI entry point."""
+    args = _fast_parse_args(sys.argv[1:]) or _get_parser().parse_args()
+    if args.serve:
+        return cmd_serve(args)
+    return _dispatch(args)
+
+
 if __name__ == "__main__":
     sys.exit(main())
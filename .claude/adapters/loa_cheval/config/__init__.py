@@ -5,6 +5,7 @@ from loa_cheval.config.loader import (
     load_config,
     clear_config_cache,
     get_effective_config_display,
+    get_effective_config_entries,
 )
 from loa_cheval.config.interpolation import interpolate_config, redact_config
 from loa_cheval.config.redaction import (
@@ -18,6 +19,7 @@ __all__ = [
     "load_config",
     "clear_config_cache",
     "get_effective_config_display",
+    "get_effective_config_entries",
     "interpolate_config",
     "redact_config",
     "redact_string",
@@ -16,7 +16,7 @@ import os
 import re
 import stat
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, FrozenSet, List, Optional, Set, Tuple
 
 from loa_cheval.types import ConfigError
 
@@ -28,8 +28,17 @@ _CORE_ENV_PATTERNS = [
     re.compile(r"^MOONSHOT_API_KEY$"),
 ]
 
+# Literal form of _CORE_ENV_PATTERNS, checked by _check_env_allowed without
+# a regex scan (the patterns are kept for callers that import them)
+_CORE_ENV_PREFIX = "LOA_"
+_CORE_ENV_EXACT = frozenset({"OPENAI_API_KEY", "ANTHROPIC_API_KEY", "MOONSHOT_API_KEY"})
+
 # Regex for interpolation tokens
 _INTERP_RE = re.compile(r"\{(env|file|cmd):([^}]+)\}")
+# Bound once: called per leaf string by the config walkers below
+_INTERP_SEARCH = _INTERP_RE.search
+_INTERP_FINDALL = _INTERP_RE.findall
+_INTERP_FULLMATCH = _INTERP_RE.fullmatch
 
 # Sentinel for redacted values
 REDACTED = "***REDACTED***"
@@ -109,6 +118,8 @@ class LazyValue:
         - vs str: resolves this LazyValue and compares resolved value.
         - vs LazyValue: compares raw templates (avoids triggering resolution).
         """
+        if other is self:
+            return True
         if isinstance(other, str):
             return self.resolve() == other
         if isinstance(other, LazyValue):
@@ -116,24 +127,80 @@ class LazyValue:
         return NotImplemented
 
     def __hash__(self) -> int:
+        # str caches its own hash, so this is O(1) after the first call
         return hash(self._raw)
 
 
+class _Interpolated(str):
+    """An eagerly resolved config value that remembers its source tokens.
+
+    Behaves as the plain resolved string. redact_config() reads .origin
+    ("env:VAR, file:path") instead of re-scanning, which also lets it redact
+    values whose template is gone once interpolated.
+    """
+
+    def __new__(cls, value: str, origin: str) -> "_Interpolated":
+        obj = super().__new__(cls, value)
+        obj.origin = origin
+        return obj
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # copy/deepcopy and pickle must pass origin back to __new__
+        return (_Interpolated, (str(self), self.origin))
+
+
+def _token_origin(template: str) -> str:
+    """Source annotation for a template, e.g. 'env:OPENAI_API_KEY, file:key'."""
+    return ", ".join(f"{t}:{r}" for t, r in _INTERP_FINDALL(template))
+
+
 def _check_env_allowed(var_name: str, extra_patterns: List[re.Pattern] = ()) -> bool:
     """Check if env var name is in the allowlist."""
-    for pattern in _CORE_ENV_PATTERNS:
-        if pattern.search(var_name):
-            return True
+    if var_name in _CORE_ENV_EXACT or var_name.startswith(_CORE_ENV_PREFIX):
+        return True
     for pattern in extra_patterns:
         if pattern.search(var_name):
             return True
     return False
 
 
+@functools.lru_cache(maxsize=1)
+def _current_uid() -> int:
+    """os.getuid(), fetched once: it doesn't change over the process lifetime."""
+    return os.getuid()
+
+
+def _reset_uid_cache() -> None:
+    """Forget the cached uid. Used for testing."""
+    _current_uid.cache_clear()
+
+
+class _PassCache:
+    """Per-interpolate_config() memo for {file:...} resolution.
+
+    Lives for one config pass only, so symlinked secret_paths and edited
+    files are re-checked on the next load.
+    """
+
+    __slots__ = ("allowed_dirs", "files")
+
+    def __init__(self) -> None:
+        self.allowed_dirs: Optional[Tuple[Path, ...]] = None
+        # {file:...} reference → stripped contents, once validated and read
+        self.files: Dict[str, str] = {}
+
+
+def _resolve_allowed_dirs(project_root: str, allowed_dirs: List[str] = ()) -> Tuple[Path, ...]:
+    """Resolved .loa.config.d plus secret_paths, the only dirs {file:} may read."""
+    config_d = Path(project_root) / ".loa.config.d"
+    return tuple(d.resolve() for d in [config_d] + [Path(d) for d in allowed_dirs])
+
+
 def _check_file_allowed(
     file_path: str,
     project_root: str,
     allowed_dirs: List[str] = (),
+    _pass: Optional[_PassCache] = None,
 ) -> str:
     """Validate and resolve a file path for secret reading.
 
@@ -148,18 +215,26 @@ def _check_file_allowed(
 
     resolved = path.resolve()
 
-    # Check symlink
-    if path.is_symlink():
+    # Check symlink (a missing path falls through to the not-found check)
+    try:
+        is_link = stat.S_ISLNK(os.lstat(path).st_mode)
+    except OSError:
+        is_link = False
+    if is_link:
         raise ConfigError(f"Secret file must not be a symlink: {file_path}")
 
-    # Check allowed directories
-    config_d = Path(project_root) / ".loa.config.d"
-    allowed = [config_d] + [Path(d) for d in allowed_dirs]
+    # Check allowed directories (resolved once per config pass)
+    if _pass is None:
+        allowed = _resolve_allowed_dirs(project_root, allowed_dirs)
+    else:
+        if _pass.allowed_dirs is None:
+            _pass.allowed_dirs = _resolve_allowed_dirs(project_root, allowed_dirs)
+        allowed = _pass.allowed_dirs
 
     in_allowed = False
     for allowed_dir in allowed:
         try:
-            resolved.relative_to(allowed_dir.resolve())
+            resolved.relative_to(allowed_dir)
             in_allowed = True
             break
         except ValueError:
@@ -171,13 +246,16 @@ def _check_file_allowed(
             f"Allowed: .loa.config.d/ or paths in hounfour.secret_paths"
         )
 
-    # Check file exists
-    if not resolved.is_file():
+    # Check file exists — one stat serves the type, ownership and mode checks
+    try:
+        file_stat = os.stat(resolved)
+    except OSError:
+        file_stat = None
+    if file_stat is None or not stat.S_ISREG(file_stat.st_mode):
         raise ConfigError(f"Secret file not found: {resolved}")
 
     # Check ownership (must be current user)
-    file_stat = resolved.stat()
-    if file_stat.st_uid != os.getuid():
+    if file_stat.st_uid != _current_uid():
         raise ConfigError(f"Secret file not owned by current user: {resolved}")
 
     # Check mode (<= 0640)
@@ -205,6 +283,11 @@ def _get_credential_provider(project_root: str):
 def _reset_credential_provider():
     """Reset credential provider cache. Used for testing."""
     _get_credential_provider.cache_clear()
+    try:
+        from loa_cheval.credentials.providers import clear_provider_cache
+        clear_provider_cache()
+    except ImportError:
+        pass
 
 
 def _resolve_env(var_name: str, project_root: str) -> Optional[str]:
@@ -234,6 +317,7 @@ def interpolate_value(
     extra_env_patterns: List[re.Pattern] = (),
     allowed_file_dirs: List[str] = (),
     commands_enabled: bool = False,
+    _pass: Optional[_PassCache] = None,
 ) -> str:
     """Resolve interpolation tokens in a string value.
 
@@ -259,8 +343,13 @@ def interpolate_value(
             return val
 
         elif source_type == "file":
-            resolved_path = _check_file_allowed(source_ref, project_root, allowed_file_dirs)
-            return Path(resolved_path).read_text().strip()
+            if _pass is not None and source_ref in _pass.files:
+                return _pass.files[source_ref]
+            resolved_path = _check_file_allowed(source_ref, project_root, allowed_file_dirs, _pass)
+            content = Path(resolved_path).read_text().strip()
+            if _pass is not None:
+                _pass.files[source_ref] = content
+            return content
 
         elif source_type == "cmd":
             if not commands_enabled:
@@ -269,19 +358,28 @@ def interpolate_value(
 
         raise ConfigError(f"Unknown interpolation type: {source_type}")
 
+    # Whole value is one token (the usual auth field): skip sub()'s rejoin
+    match = _INTERP_FULLMATCH(value)
+    if match is not None:
+        return _replace(match)
     return _INTERP_RE.sub(_replace, value)
 
 
+@functools.lru_cache(maxsize=16)
+def _compile_lazy_paths(lazy_paths: FrozenSet[str]) -> "re.Pattern[str]":
+    """One regex matching any of the lazy path patterns (fnmatch semantics)."""
+    return re.compile("|".join(fnmatch.translate(p) for p in sorted(lazy_paths)))
+
+
 def _matches_lazy_path(dotted_path: str, lazy_paths: Set[str]) -> bool:
     """Check if a dotted config key path matches any lazy path pattern.
 
     Supports '*' as a single-segment wildcard.
     Example: 'providers.openai.auth' matches 'providers.*.auth'
     """
-    for pattern in lazy_paths:
-        if fnmatch.fnmatch(dotted_path, pattern):
-            return True
-    return False
+    if not lazy_paths:
+        return False
+    return _compile_lazy_paths(frozenset(lazy_paths)).match(dotted_path) is not None
 
 
 def interpolate_config(
@@ -293,6 +391,7 @@ def interpolate_config(
     _secret_keys: Optional[Set[str]] = None,
     lazy_paths: Optional[Set[str]] = None,
     _current_path: str = "",
+    _pass: Optional[_PassCache] = None,
 ) -> Dict[str, Any]:
     """Recursively interpolate all string values in a config dict.
 
@@ -308,47 +407,62 @@ def interpolate_config(
         _secret_keys = set()
     if lazy_paths is None:
         lazy_paths = _DEFAULT_LAZY_PATHS
-
-    result = {}
-    for key, value in config.items():
-        full_path = f"{_current_path}.{key}" if _current_path else key
-
-        if isinstance(value, str) and _INTERP_RE.search(value):
-            _secret_keys.add(key)
-            if lazy_paths and _matches_lazy_path(full_path, lazy_paths):
-                # Defer resolution — wrap in LazyValue
-                # Extract provider name from path for error context
-                parts = full_path.split(".")
-                provider_name = parts[1] if len(parts) >= 2 else "unknown"
-                result[key] = LazyValue(
-                    raw=value,
-                    project_root=project_root,
-                    extra_env_patterns=extra_env_patterns,
-                    allowed_file_dirs=allowed_file_dirs,
-                    commands_enabled=commands_enabled,
-                    context={"provider": provider_name},
-                )
+    if _pass is None:
+        _pass = _PassCache()
+    lazy_match = _compile_lazy_paths(frozenset(lazy_paths)).match if lazy_paths else None
+
+    # Iterative walk: (source dict, output dict, dotted path) work items.
+    # Dotted paths are built only for token strings and containers, never
+    # for the plain leaves that make up nearly every key.
+    result: Dict[str, Any] = {}
+    stack = [(config, result, _current_path)]
+    while stack:
+        src, dst, path = stack.pop()
+        for key, value in src.items():
+            # "{" pretest: most leaf strings hold no token, skip the regex for them
+            if isinstance(value, str) and "{" in value and _INTERP_SEARCH(value):
+                _secret_keys.add(key)
+                full_path = f"{path}.{key}" if path else key
+                if lazy_match is not None and lazy_match(full_path):
+                    # Defer resolution — wrap in LazyValue
+                    # Extract provider name from path for error context
+                    parts = full_path.split(".")
+                    provider_name = parts[1] if len(parts) >= 2 else "unknown"
+                    dst[key] = LazyValue(
+                        raw=value,
+                        project_root=project_root,
+                        extra_env_patterns=extra_env_patterns,
+                        allowed_file_dirs=allowed_file_dirs,
+                        commands_enabled=commands_enabled,
+                        context={"provider": provider_name},
+                    )
+                else:
+                    dst[key] = _Interpolated(
+                        interpolate_value(value, project_root, extra_env_patterns, allowed_file_dirs, commands_enabled, _pass),
+                        _token_origin(value),
+                    )
+            elif isinstance(value, dict):
+                child: Dict[str, Any] = {}
+                dst[key] = child
+                stack.append((value, child, f"{path}.{key}" if path else key))
+            elif isinstance(value, list):
+                full_path = f"{path}.{key}" if path else key
+                items: List[Any] = []
+                for item in value:
+                    if isinstance(item, dict):
+                        child = {}
+                        items.append(child)
+                        stack.append((item, child, full_path))
+                    elif isinstance(item, str) and "{" in item and _INTERP_SEARCH(item):
+                        items.append(_Interpolated(
+                            interpolate_value(item, project_root, extra_env_patterns, allowed_file_dirs, commands_enabled, _pass),
+                            _token_origin(item),
+                        ))
+                    else:
+                        items.append(item)
+                dst[key] = items
             else:
-                result[key] = interpolate_value(value, project_root, extra_env_patterns, allowed_file_dirs, commands_enabled)
-        elif isinstance(value, dict):
-            result[key] = interpolate_config(
-                value, project_root, extra_env_patterns, allowed_file_dirs,
-                commands_enabled, _secret_keys, lazy_paths, full_path,
-            )
-        elif isinstance(value, list):
-            result[key] = [
-                interpolate_config(
-                    item, project_root, extra_env_patterns, allowed_file_dirs,
-                    commands_enabled, _secret_keys, lazy_paths, full_path,
-                )
-                if isinstance(item, dict)
-                else interpolate_value(item, project_root, extra_env_patterns, allowed_file_dirs, commands_enabled)
-                if isinstance(item, str) and _INTERP_RE.search(item)
-                else item
-                for item in value
-            ]
-        else:
-            result[key] = value
+                dst[key] = value
     return result
 
 
@@ -364,16 +478,20 @@ def redact_config(config: Dict[str, Any], secret_keys: Optional[Set[str]] = None
             result[key] = redact_config(value, secret_keys)
         elif isinstance(value, LazyValue):
             # Redact without resolving — show raw template
-            sources = _INTERP_RE.findall(value.raw)
-            annotations = ", ".join(f"{t}:{r}" for t, r in sources)
-            result[key] = f"{REDACTED} (lazy: {annotations})"
-        elif isinstance(value, str) and _INTERP_RE.search(value):
-            # Show source annotation without actual value
-            sources = _INTERP_RE.findall(value)
-            annotations = ", ".join(f"{t}:{r}" for t, r in sources)
-            result[key] = f"{REDACTED} (from {annotations})"
+            result[key] = f"{REDACTED} (lazy: {_token_origin(value.raw)})"
+        elif isinstance(value, _Interpolated):
+            # Resolved at load time: origin was recorded, no re-scan needed
+            result[key] = f"{REDACTED} (from {value.origin})"
+        elif isinstance(value, str) and "{" in value and _INTERP_SEARCH(value):
+            # Uninterpolated template: show source annotation without actual value
+            result[key] = f"{REDACTED} (from {_token_origin(value)})"
         elif key == "auth" or key.endswith("_key") or key.endswith("_secret"):
             result[key] = REDACTED
+        elif isinstance(value, list):
+            result[key] = [
+                f"{REDACTED} (from {item.origin})" if isinstance(item, _Interpolated) else item
+                for item in value
+            ]
         else:
             result[key] = value
     return result
@@ -10,11 +10,15 @@ Precedence (lowest → highest):
 from __future__ import annotations
 
 import copy
+import functools
+import hashlib
 import json
 import os
 import re
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from loa_cheval.config.interpolation import interpolate_config, redact_config
 from loa_cheval.types import ConfigError
@@ -23,12 +27,24 @@ from loa_cheval.types import ConfigError
 try:
     import yaml
 
+    # Prefer the libyaml-backed loader; same safe schema, parsed in C.
+    try:
+        from yaml import CSafeLoader as _YamlLoader
+    except ImportError:
+        from yaml import SafeLoader as _YamlLoader
+
     def _load_yaml(path: str) -> Dict[str, Any]:
         with open(path) as f:
-            return yaml.safe_load(f) or {}
+            return yaml.load(f, Loader=_YamlLoader) or {}
 except ImportError:
     import subprocess
 
+    # yq emits JSON; parse it with orjson when installed
+    try:
+        from orjson import loads as _json_loads
+    except ImportError:
+        _json_loads = json.loads
+
     def _load_yaml(path: str) -> Dict[str, Any]:
         """Fallback: use yq to convert YAML to JSON, then parse.
 
@@ -45,29 +61,94 @@ except ImportError:
             )
             if result.returncode != 0:
                 raise ConfigError(f"yq failed on {path}: {result.stderr}")
-            return json.loads(result.stdout) if result.stdout.strip() else {}
+            return _json_loads(result.stdout) if result.stdout.strip() else {}
         except FileNotFoundError:
             raise ConfigError("Neither pyyaml nor yq (mikefarah/yq) is available. Install one to load config.")
 
 
+# Leaf types shared by reference when cloning (immutable)
+_SCALAR_TYPES = (str, int, float, bool, type(None))
+
+
+def _fast_clone(obj: Any) -> Any:
+    """Copy a JSON/YAML-shaped value: dicts and lists rebuilt, scalars shared.
+
+    Much cheaper than copy.deepcopy (no memo dict or per-node dispatch);
+    anything else YAML can produce (dates, sets) still goes through deepcopy.
+    Walks with an explicit stack rather than recursing per container.
+    """
+    if isinstance(obj, dict):
+        root: Any = {}
+    elif isinstance(obj, list):
+        root = [None] * len(obj)
+    elif isinstance(obj, _SCALAR_TYPES):
+        return obj
+    else:
+        return copy.deepcopy(obj)
+
+    stack = [(obj, root)]
+    while stack:
+        src, dst = stack.pop()
+        for key, value in (src.items() if isinstance(src, dict) else enumerate(src)):
+            if isinstance(value, dict):
+                child: Any = {}
+            elif isinstance(value, list):
+                child = [None] * len(value)
+            elif isinstance(value, _SCALAR_TYPES):
+                dst[key] = value
+                continue
+            else:
+                dst[key] = copy.deepcopy(value)
+                continue
+            dst[key] = child
+            stack.append((value, child))
+    return root
+
+
 def _deep_merge(base: Dict[str, Any], overlay: Dict[str, Any]) -> Dict[str, Any]:
     """Deep merge overlay into base. Overlay values win."""
-    result = copy.deepcopy(base)
-    for key, value in overlay.items():
-        if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-            result[key] = _deep_merge(result[key], value)
+    result: Dict[str, Any] = {}
+    for key, value in base.items():
+        if key not in overlay:
+            result[key] = _fast_clone(value)
+        elif isinstance(value, dict) and isinstance(overlay[key], dict):
+            result[key] = _deep_merge(value, overlay[key])
         else:
-            result[key] = copy.deepcopy(value)
+            result[key] = _fast_clone(overlay[key])
+    for key, value in overlay.items():
+        if key not in base:
+            result[key] = _fast_clone(value)
     return result
 
 
+def _deep_merge_inplace(base: Dict[str, Any], overlay: Dict[str, Any]) -> None:
+    """Deep merge overlay into base, mutating base. Overlay values win.
+
+    Only for freshly loaded layers: overlay's containers are moved into base
+    rather than copied, so neither dict may be shared with anything else.
+    """
+    stack = [(base, overlay)]
+    while stack:
+        dst, src = stack.pop()
+        for key, value in src.items():
+            current = dst.get(key)
+            if isinstance(current, dict) and isinstance(value, dict):
+                stack.append((current, value))
+            else:
+                dst[key] = value
+
+
 def _find_project_root() -> str:
     """Walk up from cwd to find project root (contains .loa.config.yaml or .claude/)."""
-    cwd = Path.cwd()
-    for parent in [cwd] + list(cwd.parents):
-        if (parent / ".loa.config.yaml").exists() or (parent / ".claude").is_dir():
-            return str(parent)
-    return str(cwd)
+    cwd = os.getcwd()
+    parent = cwd
+    while True:
+        if os.path.exists(os.path.join(parent, ".loa.config.yaml")) or os.path.isdir(os.path.join(parent, ".claude")):
+            return parent
+        grandparent = os.path.dirname(parent)
+        if grandparent == parent:
+            return cwd
+        parent = grandparent
 
 
 def load_system_defaults(project_root: str) -> Dict[str, Any]:
@@ -102,7 +183,7 @@ def load_env_overrides() -> Dict[str, Any]:
 
 def apply_cli_overrides(config: Dict[str, Any], cli_args: Dict[str, Any]) -> Dict[str, Any]:
     """Layer 4: CLI argument overrides (highest precedence)."""
-    result = copy.deepcopy(config)
+    result = _fast_clone(config)
 
     if "model" in cli_args and cli_args["model"]:
         result["cli_model_override"] = cli_args["model"]
@@ -112,58 +193,211 @@ def apply_cli_overrides(config: Dict[str, Any], cli_args: Dict[str, Any]) -> Dic
     return result
 
 
+# Source annotation values, one shared str per layer. Sidecar-loaded sources
+# are mapped back onto these so each key doesn't hold its own JSON-decoded copy.
+_LAYER_SYSTEM = "system_defaults"
+_LAYER_PROJECT = "project_config"
+_LAYER_ENV = "env_override"
+_LAYER_CLI = "cli_override"
+_LAYERS = {layer: layer for layer in (_LAYER_SYSTEM, _LAYER_PROJECT, _LAYER_ENV, _LAYER_CLI)}
+
+
+# --- File layer cache ---
+# Maps project_root → (file signatures, merged layers 1-2, source annotations).
+# Env interpolation and CLI overrides are re-applied on every load_config()
+# call, so only the YAML parse + merge is cached.
+
+_layer_cache: Dict[str, Tuple[Tuple[Any, ...], Dict[str, Any], Dict[str, str]]] = {}
+
+
+def _file_signature(path: Path) -> Optional[Tuple[int, int, int, int]]:
+    """Return (st_mtime_ns, st_size, st_ino, st_ctime_ns) for path, or None if missing.
+
+    mtime alone is preserved by `cp -p`, `rsync -t` and tar; the inode and
+    ctime (which user tools cannot set) catch those and same-tick edits.
+    """
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size, st.st_ino, st.st_ctime_ns)
+
+
+def _file_layers_signature(project_root: str) -> Tuple[Any, ...]:
+    """Signatures of the layer 1-2 files; changes whenever either file does."""
+    root = Path(project_root)
+    return (
+        _file_signature(root / ".claude" / "defaults" / "model-config.yaml"),
+        _file_signature(root / ".loa.config.yaml"),
+    )
+
+
+# --- Persistent sidecar cache ---
+# Layers 1-2 are also written as JSON under $XDG_CACHE_HOME/cheval so fresh
+# processes can skip YAML parsing. Contents are pre-interpolation (templates,
+# never resolved secrets). One file per project root, validated by the
+# content_version field. Set CHEVAL_CACHE_DISABLE=1 to bypass.
+
+_SIDECAR_FORMAT = 1
+
+
+def _sidecar_path(project_root: str) -> Optional[Path]:
+    """Sidecar file for project_root, or None if the disk cache is disabled."""
+    if os.environ.get("CHEVAL_CACHE_DISABLE") == "1":
+        return None
+    cache_dir = os.environ.get("CHEVAL_CACHE_DIR")
+    if not cache_dir:
+        base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+        cache_dir = os.path.join(base, "cheval")
+    digest = hashlib.sha256(os.path.abspath(project_root).encode("utf-8")).hexdigest()[:16]
+    return Path(cache_dir) / f"config.{digest}.json"
+
+
+def _content_version(project_root: str, signature: Tuple[Any, ...]) -> str:
+    """Hash of the source file signatures; changes whenever either file does."""
+    raw = repr((_SIDECAR_FORMAT, os.path.abspath(project_root), signature))
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def _read_sidecar(path: Path, version: str) -> Optional[Tuple[Dict[str, Any], Dict[str, str]]]:
+    """Return (merged, sources) from the sidecar if it matches version."""
+    try:
+        data = json.loads(path.read_bytes())
+    except (OSError, ValueError):
+        return None
+    if not isinstance(data, dict) or data.get("content_version") != version:
+        return None
+    merged, sources = data.get("config"), data.get("sources")
+    if not isinstance(merged, dict) or not isinstance(sources, dict):
+        return None
+    if not all(isinstance(layer, str) for layer in sources.values()):
+        return None
+    return merged, {key: _LAYERS.get(layer, layer) for key, layer in sources.items()}
+
+
+def _write_sidecar(path: Path, version: str, merged: Dict[str, Any], sources: Dict[str, str]) -> None:
+    """Best-effort atomic sidecar write (0600).
+
+    Skipped when the config doesn't survive a JSON round trip unchanged
+    (e.g. YAML dates or non-string keys).
+    """
+    try:
+        payload = json.dumps({"content_version": version, "config": merged, "sources": sources})
+    except (TypeError, ValueError):
+        return
+    if json.loads(payload)["config"] != merged:
+        return
+
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        fd = os.open(str(tmp), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w") as f:
+            f.write(payload)
+        os.replace(str(tmp), str(path))
+    except OSError:
+        try:
+            os.unlink(str(tmp))
+        except OSError:
+            pass
+
+
+def _load_file_layers(project_root: str) -> Tuple[Dict[str, Any], Dict[str, str]]:
+    """Load and merge layers 1-2, reusing the cached result if neither file changed.
+
+    Callers must not mutate the returned dicts.
+    """
+    signature = _file_layers_signature(project_root)
+    cached = _layer_cache.get(project_root)
+    if cached is not None and cached[0] == signature:
+        return cached[1], cached[2]
+
+    # Cross-process: JSON sidecar written by an earlier invocation
+    sidecar = _sidecar_path(project_root) if signature != (None, None) else None
+    version = _content_version(project_root, signature)
+    if sidecar is not None:
+        hit = _read_sidecar(sidecar, version)
+        if hit is not None:
+            _layer_cache[project_root] = (signature, hit[0], hit[1])
+            return hit
+
+    sources: Dict[str, str] = {}
+
+    # Layer 1: System defaults
+    defaults = load_system_defaults(project_root)
+    _annotate_keys(defaults, sources, _LAYER_SYSTEM)
+
+    # Layer 2: Project config
+    project = load_project_config(project_root)
+    _annotate_keys(project, sources, _LAYER_PROJECT)
+
+    # Both layers were just parsed and are private here: merge without copying
+    _deep_merge_inplace(defaults, project)
+    merged = defaults
+    _layer_cache[project_root] = (signature, merged, sources)
+    if sidecar is not None:
+        _write_sidecar(sidecar, version, merged, sources)
+    return merged, sources
+
+
+@functools.lru_cache(maxsize=16)
+def _compile_env_patterns(pattern_strs: Tuple[str, ...]) -> Tuple["re.Pattern[str]", ...]:
+    """Compile secret_env_allowlist once per distinct pattern list."""
+    compiled = []
+    for pattern_str in pattern_strs:
+        try:
+            compiled.append(re.compile(pattern_str))
+        except re.error as e:
+            raise ConfigError(f"Invalid regex in secret_env_allowlist: {pattern_str}: {e}")
+    return tuple(compiled)
+
+
 def load_config(
     project_root: Optional[str] = None,
     cli_args: Optional[Dict[str, Any]] = None,
+    only: Optional[Iterable[str]] = None,
 ) -> Tuple[Dict[str, Any], Dict[str, str]]:
     """Load merged config through the 4-layer pipeline.
 
     Returns (merged_config, source_annotations).
     source_annotations maps dotted keys to their source layer.
+
+    If only is given, just those top-level sections (plus CLI override keys)
+    are copied and interpolated; secret_* settings are still honoured.
     """
     if project_root is None:
         project_root = _find_project_root()
     if cli_args is None:
         cli_args = {}
 
-    sources: Dict[str, str] = {}
-
-    # Layer 1: System defaults
-    defaults = load_system_defaults(project_root)
-    for key in _flatten_keys(defaults):
-        sources[key] = "system_defaults"
-
-    # Layer 2: Project config
-    project = load_project_config(project_root)
-    for key in _flatten_keys(project):
-        sources[key] = "project_config"
+    # Layers 1-2: file-backed, cached until either file changes
+    file_merged, file_sources = _load_file_layers(project_root)
+    sources: Dict[str, str] = dict(file_sources)
 
     # Layer 3: Env overrides
     env = load_env_overrides()
-    for key in _flatten_keys(env):
-        sources[key] = "env_override"
+    _annotate_keys(env, sources, _LAYER_ENV)
+
+    # Merge layer 3 over layers 1-2 (copies, so the cached layers stay pristine)
+    merged = _deep_merge(file_merged, env)
 
-    # Merge layers 1-3
-    merged = _deep_merge(defaults, project)
-    merged = _deep_merge(merged, env)
+    # Secret handling settings come from the full config, before any `only` cut
+    extra_env_patterns = list(_compile_env_patterns(tuple(merged.get("secret_env_allowlist", []))))
+
+    allowed_file_dirs = merged.get("secret_paths", [])
+    commands_enabled = merged.get("secret_commands_enabled", False)
+
+    if only is not None:
+        wanted = set(only)
+        merged = {k: v for k, v in merged.items() if k in wanted}
 
     # Layer 4: CLI overrides
     merged = apply_cli_overrides(merged, cli_args)
     for key in cli_args:
         if cli_args[key] is not None:
-            sources[f"cli_{key}"] = "cli_override"
+            sources[f"cli_{key}"] = _LAYER_CLI
 
     # Resolve secret interpolation
-    extra_env_patterns = []
-    for pattern_str in merged.get("secret_env_allowlist", []):
-        try:
-            extra_env_patterns.append(re.compile(pattern_str))
-        except re.error as e:
-            raise ConfigError(f"Invalid regex in secret_env_allowlist: {pattern_str}: {e}")
-
-    allowed_file_dirs = merged.get("secret_paths", [])
-    commands_enabled = merged.get("secret_commands_enabled", False)
-
     try:
         merged = interpolate_config(
             merged,
@@ -194,6 +428,29 @@ def get_effective_config_display(
     return "\n".join(lines)
 
 
+def get_effective_config_entries(
+    config: Dict[str, Any],
+    sources: Dict[str, str],
+) -> Dict[str, Dict[str, Any]]:
+    """Flatten merged config for machine-readable --print-effective-config.
+
+    Returns {dotted.path: {"value": ..., "source": ...}} for every leaf
+    (lists are leaves). Secret values are redacted.
+    """
+    entries: Dict[str, Dict[str, Any]] = {}
+    _collect_entries(redact_config(config), sources, entries, prefix="")
+    return entries
+
+
+def _collect_entries(d: Dict[str, Any], sources: Dict[str, str], entries: Dict[str, Dict[str, Any]], prefix: str) -> None:
+    for key, value in d.items():
+        full_key = f"{prefix}.{key}" if prefix else key
+        if isinstance(value, dict) and value:
+            _collect_entries(value, sources, entries, full_key)
+        else:
+            entries[full_key] = {"value": value, "source": sources.get(full_key, "")}
+
+
 def _format_dict(d: Dict[str, Any], sources: Dict[str, str], lines: List[str], prefix: str, indent: int = 0) -> None:
     """Recursively format dict with source annotations."""
     pad = "  " * indent
@@ -228,29 +485,62 @@ def _flatten_keys(d: Dict[str, Any], prefix: str = "") -> List[str]:
     return keys
 
 
-# --- Config cache (one per process) ---
-# NOTE: Not thread-safe. Current use is single-threaded CLI (model-invoke).
-# If loa_cheval is imported as a library in a multi-threaded application,
-# wrap get_config() with threading.Lock or replace with functools.lru_cache.
+def _annotate_keys(d: Dict[str, Any], sources: Dict[str, str], layer: str, prefix: str = "") -> None:
+    """Record layer as the source of every dotted key in d (one walk, no key lists)."""
+    for key, value in d.items():
+        full_key = f"{prefix}.{key}" if prefix else key
+        sources[full_key] = layer
+        if isinstance(value, dict):
+            _annotate_keys(value, sources, layer, full_key)
+
+
+# --- Config cache ---
+# get_config() results keyed on (project root, CLI args, LOA_MODEL, layer 1-2
+# file signatures): edits to either config file or a different invocation
+# shape reload automatically, an unchanged one costs two stat() calls.
+# Small LRU so alternating project roots or CLI args don't thrash.
 
-_cached_config: Optional[Tuple[Dict[str, Any], Dict[str, str]]] = None
-_cache_lock: Optional[Any] = None  # Lazy-init threading.Lock if needed
+_config_cache: "OrderedDict[Tuple[Any, ...], Tuple[Dict[str, Any], Dict[str, str]]]" = OrderedDict()
+_CONFIG_CACHE_MAXSIZE = 4
+_config_cache_lock = threading.Lock()
 
 
 def get_config(project_root: Optional[str] = None, cli_args: Optional[Dict[str, Any]] = None, force_reload: bool = False) -> Dict[str, Any]:
-    """Get cached config. Loads on first call, caches thereafter.
+    """Get cached config, reloading when the config files, CLI args or LOA_MODEL change.
 
-    Thread safety: safe for single-threaded CLI use. For multi-threaded
-    library use, callers should synchronize externally or call load_config()
-    directly.
+    Thread-safe. Values interpolated eagerly from other env vars are those
+    seen at load time; pass force_reload=True to pick up changes to them.
     """
-    global _cached_config
-    if _cached_config is None or force_reload:
-        _cached_config = load_config(project_root, cli_args)
-    return _cached_config[0]
+    if project_root is None:
+        project_root = _find_project_root()
+    cli_items = tuple(sorted((cli_args or {}).items()))
+    key = (
+        os.path.abspath(project_root),
+        cli_items,
+        os.environ.get("LOA_MODEL"),
+        _file_layers_signature(project_root),
+    )
+    try:
+        hash(key)
+    except TypeError:  # unhashable CLI values: load uncached
+        return load_config(project_root, cli_args)[0]
+
+    with _config_cache_lock:
+        if not force_reload and key in _config_cache:
+            _config_cache.move_to_end(key)
+            return _config_cache[key][0]
+
+    loaded = load_config(project_root, cli_args)
+    with _config_cache_lock:
+        _config_cache[key] = loaded
+        _config_cache.move_to_end(key)
+        while len(_config_cache) > _CONFIG_CACHE_MAXSIZE:
+            _config_cache.popitem(last=False)
+    return loaded[0]
 
 
 def clear_config_cache() -> None:
-    """Clear the config cache. Used for testing."""
-    global _cached_config
-    _cached_config = None
+    """Clear the config and file layer caches. Used for testing."""
+    with _config_cache_lock:
+        _config_cache.clear()
+    _layer_cache.clear()
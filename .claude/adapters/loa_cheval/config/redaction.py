@@ -9,67 +9,98 @@ Ensures secrets never leak through:
 
 from __future__ import annotations
 
+import functools
 import logging
 import os
 import re
 import traceback
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from loa_cheval.types import ChevalError
 
-# Patterns that indicate sensitive values
-_SENSITIVE_KEY_PATTERNS = re.compile(
-    r"(auth|key|secret|token|password|credential|bearer)",
-    re.IGNORECASE,
-)
+# Substrings that mark a key name as sensitive (matched case-insensitively)
+_SENSITIVE_TOKENS = frozenset({"auth", "key", "secret", "token", "password", "credential", "bearer"})
+
+# Substrings (casefolded) at least one of which every _SECRET_FIELD_PATTERN
+# match contains; text without any of them skips the regex pass.
+_SECRET_FIELD_HINTS = ("authorization", "x-api-key", "api_key=", "api-key=", "apikey=", "token=", "secret=", "auth=")
 
 # Known env vars that contain secrets
-_SECRET_ENV_VARS = [
+_SECRET_ENV_VARS = (
     "OPENAI_API_KEY",
     "ANTHROPIC_API_KEY",
     "MOONSHOT_API_KEY",
-]
-
-# URL query parameter patterns to redact
-_URL_PARAM_PATTERN = re.compile(r"([?&])(api[_-]?key|token|secret|auth)=([^&\s]+)", re.IGNORECASE)
+)
 
-# Authorization header pattern
-_AUTH_HEADER_PATTERN = re.compile(r"(Authorization:\s*Bearer\s+)\S+", re.IGNORECASE)
-_XAPI_KEY_PATTERN = re.compile(r"(x-api-key:\s*)\S+", re.IGNORECASE)
+# Authorization / x-api-key headers and secret URL query parameters, one
+# alternation so redact_string scans the text once; _redact_match picks the
+# kept prefix from whichever branch matched.
+_SECRET_FIELD_PATTERN = re.compile(
+    r"(?P<header>Authorization:\s*Bearer\s+|x-api-key:\s*)\S+"
+    r"|(?P<param>[?&](?:api[_-]?key|token|secret|auth)=)[^&\s]+",
+    re.IGNORECASE,
+)
 
 REDACTED = "***REDACTED***"
 
+# Config leaf types that redact_config_value passes through untouched
+_LEAF_TYPES = (int, float, type(None))
+
+
+@functools.lru_cache(maxsize=256)
+def _is_sensitive_key(key: str) -> bool:
+    """True if key contains any sensitive token, ignoring case.
+
+    Cached: config and header key names come from a small, repeating set.
+    """
+    key_lc = key.lower()
+    return any(tok in key_lc for tok in _SENSITIVE_TOKENS)
+
+
+def _redact_match(match: "re.Match[str]") -> str:
+    return (match.group("header") or match.group("param")) + REDACTED
+
+
+@functools.lru_cache(maxsize=1)
+def _secret_literal_pattern(secrets: Tuple[str, ...]) -> Optional["re.Pattern[str]"]:
+    """Compile one alternation over the secret values (longest first)."""
+    if not secrets:
+        return None
+    values = sorted(set(secrets), key=len, reverse=True)
+    return re.compile("|".join(map(re.escape, values)))
+
+
+def _live_secrets() -> Tuple[str, ...]:
+    """Current values of the known secret env vars and long LOA_* vars."""
+    secrets = [v for v in map(os.environ.get, _SECRET_ENV_VARS) if v]
+    secrets.extend(val for key, val in os.environ.items() if key.startswith("LOA_") and len(val) > 8)
+    return tuple(secrets)
+
 
 def redact_string(value: str) -> str:
     """Redact known secret patterns from a string value.
 
     Replaces:
-    - Env var values from known secret env vars
+    - Env var values from known secret env vars (and LOA_* values > 8 chars)
     - Authorization: Bearer headers
     - x-api-key headers
     - URL query parameters (api_key, token, secret, auth)
+
+    The env values are read on every call, so rotated keys are picked up;
+    the pattern over them is only recompiled when they change.
     """
     result = value
 
     # Redact known env var values
-    for env_var in _SECRET_ENV_VARS:
-        env_val = os.environ.get(env_var)
-        if env_val and env_val in result:
-            result = result.replace(env_val, REDACTED)
-
-    # Also check LOA_ prefixed vars
-    for key, val in os.environ.items():
-        if key.startswith("LOA_") and val and len(val) > 8 and val in result:
-            result = result.replace(val, REDACTED)
-
-    # Redact Authorization headers
-    result = _AUTH_HEADER_PATTERN.sub(rf"\1{REDACTED}", result)
-    result = _XAPI_KEY_PATTERN.sub(rf"\1{REDACTED}", result)
-
-    # Redact URL query parameters
-    result = _URL_PARAM_PATTERN.sub(rf"\1\2={REDACTED}", result)
+    pattern = _secret_literal_pattern(_live_secrets())
+    if pattern is not None:
+        result = pattern.sub(REDACTED, result)
 
-    return result
+    # Redact auth headers and URL query parameters
+    folded = result.casefold()
+    if not any(hint in folded for hint in _SECRET_FIELD_HINTS):
+        return result
+    return _SECRET_FIELD_PATTERN.sub(_redact_match, result)
 
 
 def redact_exception(exc: Exception) -> str:
@@ -117,7 +148,7 @@ def redact_headers(headers: Dict[str, str]) -> Dict[str, str]:
     """Return a copy of headers with sensitive values redacted."""
     redacted = {}
     for key, value in headers.items():
-        if _SENSITIVE_KEY_PATTERNS.search(key):
+        if _is_sensitive_key(key):
             redacted[key] = REDACTED
         else:
             redacted[key] = value
@@ -129,12 +160,15 @@ def redact_config_value(key: str, value: Any) -> Any:
 
     Handles LazyValue instances without triggering resolution.
     """
+    # Numbers, bools and None are never redacted; skip the probes below
+    if isinstance(value, _LEAF_TYPES):
+        return value
     # Handle LazyValue without importing (avoid circular import)
     if hasattr(value, "raw") and hasattr(value, "resolve"):
         return f"{REDACTED} (lazy: {value.raw})"
     if isinstance(value, str):
         # Check if the key name suggests sensitivity
-        if _SENSITIVE_KEY_PATTERNS.search(key):
+        if _is_sensitive_key(key):
             return REDACTED
         # Check for interpolation tokens (already handled by interpolation.py)
         if "{env:" in value or "{file:" in value:
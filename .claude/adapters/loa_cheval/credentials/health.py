@@ -7,20 +7,26 @@ to network proxies. (cycle-028 FR-2)
 
 from __future__ import annotations
 
+import functools
 import logging
 import re
+from concurrent.futures import ThreadPoolExecutor
 import urllib.request
 import urllib.error
 import json
-from typing import Dict, List, NamedTuple, Optional
+from dataclasses import dataclass
+from typing import Dict, List, NamedTuple, Optional, Tuple
 
 from loa_cheval.credentials.providers import CredentialProvider
+from loa_cheval.types import _SLOTS
 
 logger = logging.getLogger(__name__)
 
 
-class HealthResult(NamedTuple):
+@dataclass(frozen=True, **_SLOTS)
+class HealthResult:
     """Result of a single credential health check."""
+
     credential_id: str
     status: str  # "ok" | "error" | "missing" | "skipped" | "format_invalid" | "unknown/weak_validation"
     message: str
@@ -52,6 +58,44 @@ FORMAT_RULES: Dict[str, dict] = {
     },
 }
 
+
+class _FormatRule(NamedTuple):
+    """FORMAT_RULES entry unpacked for attribute access in _check_format."""
+    prefix: Optional[str]
+    min_length: int
+    charset: Optional["re.Pattern[str]"]
+    description: str
+    weak: bool
+    # prefix + length + charset as one pattern; a match implies all three
+    # checks pass, so only failures walk the separate checks for a message
+    full: Optional["re.Pattern[str]"]
+
+
+def _compile_format_rule(rule: dict) -> _FormatRule:
+    charset = rule["charset"]
+    full = None
+    if charset is not None:
+        prefix = re.escape(rule["prefix"] or "")
+        full = re.compile(
+            f"(?={prefix})(?=.{{{rule['min_length']},}})(?:{charset.pattern})",
+            charset.flags,
+        )
+    return _FormatRule(
+        prefix=rule["prefix"],
+        min_length=rule["min_length"],
+        charset=charset,
+        description=rule["description"],
+        weak=rule.get("validation_confidence") == "weak",
+        full=full,
+    )
+
+
+# Unpacked once at import; _check_format re-derives an entry only if
+# FORMAT_RULES has been changed since
+_FORMAT_RULES_COMPILED: Dict[str, Tuple[dict, _FormatRule]] = {
+    cred_id: (rule, _compile_format_rule(rule)) for cred_id, rule in FORMAT_RULES.items()
+}
+
 # Known credential health check configurations (live HTTP endpoints)
 HEALTH_CHECKS: Dict[str, dict] = {
     "OPENAI_API_KEY": {
@@ -68,7 +112,8 @@ HEALTH_CHECKS: Dict[str, dict] = {
         "method": "POST",
         # Deliberately malformed body (missing required 'model' field) to get 400
         # without generating a real completion. 401 = bad key, 400 = key is valid.
-        "body": json.dumps({"max_tokens": 1, "messages": [{"role": "user", "content": "ping"}]}),
+        # Pre-encoded once at import; sent as-is on every check.
+        "body": json.dumps({"max_tokens": 1, "messages": [{"role": "user", "content": "ping"}]}).encode(),
         "content_type": "application/json",
         "extra_headers": {"anthropic-version": "2023-06-01"},
         "expected_status": [400],
@@ -93,38 +138,46 @@ def _redact_credential_from_error(error_msg: str, credential_value: str) -> str:
 
 def _check_format(credential_id: str, value: str) -> HealthResult:
     """Validate credential format without making HTTP requests."""
-    rule = FORMAT_RULES.get(credential_id)
-    if rule is None:
+    raw = FORMAT_RULES.get(credential_id)
+    if raw is None:
         return HealthResult(credential_id, "skipped", "No format rule configured")
+    compiled = _FORMAT_RULES_COMPILED.get(credential_id)
+    if compiled is None or compiled[0] is not raw:
+        compiled = _FORMAT_RULES_COMPILED[credential_id] = (raw, _compile_format_rule(raw))
+    rule = compiled[1]
+
+    desc = rule.description
 
     # Moonshot: no stable format known
-    if rule.get("validation_confidence") == "weak":
+    if rule.weak:
         return HealthResult(
             credential_id,
             "unknown/weak_validation",
-            f"{rule['description']}: no stable format known — validation confidence is weak",
+            f"{desc}: no stable format known — validation confidence is weak",
         )
 
-    desc = rule["description"]
+    # Valid keys: one scan
+    if rule.full is not None and rule.full.match(value):
+        return HealthResult(credential_id, "ok", f"{desc}: format valid")
 
     # Check prefix
-    if rule["prefix"] and not value.startswith(rule["prefix"]):
+    if rule.prefix and not value.startswith(rule.prefix):
         return HealthResult(
             credential_id,
             "format_invalid",
-            f"{desc}: expected prefix '{rule['prefix']}'",
+            f"{desc}: expected prefix '{rule.prefix}'",
         )
 
     # Check minimum length
-    if len(value) < rule["min_length"]:
+    if len(value) < rule.min_length:
         return HealthResult(
             credential_id,
             "format_invalid",
-            f"{desc}: expected minimum {rule['min_length']} chars, got {len(value)}",
+            f"{desc}: expected minimum {rule.min_length} chars, got {len(value)}",
         )
 
     # Check charset
-    if rule["charset"] and not rule["charset"].match(value):
+    if rule.charset is not None and not rule.charset.match(value):
         return HealthResult(
             credential_id,
             "format_invalid",
@@ -134,6 +187,38 @@ def _check_format(credential_id: str, value: str) -> HealthResult:
     return HealthResult(credential_id, "ok", f"{desc}: format valid")
 
 
+@functools.lru_cache(maxsize=1)
+def _opener(build_opener) -> urllib.request.OpenerDirector:
+    """Shared opener with HTTP debug output disabled so headers never leak.
+
+    Keyed on the opener factory, so a patched build_opener gets its own.
+    """
+    return build_opener(
+        urllib.request.HTTPHandler(debuglevel=0),
+        urllib.request.HTTPSHandler(debuglevel=0),
+    )
+
+
+def _live_status(config: dict, header_value: str, timeout: float) -> int:
+    """Send the configured probe request and return its HTTP status."""
+    headers = {config["header"]: header_value}
+    headers.update(config.get("extra_headers", {}))
+    if config.get("content_type"):
+        headers["Content-Type"] = config["content_type"]
+    req = urllib.request.Request(
+        config["url"], data=config.get("body"), headers=headers, method=config.get("method", "GET"),
+    )
+
+    try:
+        response = _opener(urllib.request.build_opener).open(req, timeout=timeout)
+    except urllib.error.HTTPError as e:
+        return e.code
+    try:
+        return response.status
+    finally:
+        response.close()
+
+
 def _check_live(
     credential_id: str,
     value: str,
@@ -149,53 +234,25 @@ def _check_live(
         credential_id,
     )
 
-    url = config["url"]
-    header_name = config["header"]
     header_value = config.get("header_prefix", "") + value
-
     try:
-        req = urllib.request.Request(url, method=config.get("method", "GET"))
-        req.add_header(header_name, header_value)
-
-        for k, v in config.get("extra_headers", {}).items():
-            req.add_header(k, v)
-
-        if config.get("body"):
-            req.data = config["body"].encode()
-        if config.get("content_type"):
-            req.add_header("Content-Type", config["content_type"])
-
-        # Disable debug output that could leak headers
-        opener = urllib.request.build_opener(
-            urllib.request.HTTPHandler(debuglevel=0),
-            urllib.request.HTTPSHandler(debuglevel=0),
-        )
-        response = opener.open(req, timeout=timeout)
-        status = response.status
-
-        expected = config["expected_status"]
-        if isinstance(expected, list):
-            if status in expected:
-                return HealthResult(credential_id, "ok", f"{config['description']}: valid (HTTP {status})")
-        elif status == expected:
-            return HealthResult(credential_id, "ok", f"{config['description']}: valid (HTTP {status})")
-
-        return HealthResult(credential_id, "error", f"{config['description']}: unexpected HTTP {status}")
-
-    except urllib.error.HTTPError as e:
-        expected = config["expected_status"]
-        if isinstance(expected, list) and e.code in expected:
-            return HealthResult(credential_id, "ok", f"{config['description']}: valid (HTTP {e.code})")
-        if e.code == 401:
-            return HealthResult(credential_id, "error", f"{config['description']}: invalid key (HTTP 401)")
-        if e.code == 403:
-            return HealthResult(credential_id, "error", f"{config['description']}: access denied (HTTP 403)")
-        return HealthResult(credential_id, "error", f"{config['description']}: HTTP {e.code}")
-
+        status = _live_status(config, header_value, timeout)
     except Exception as e:
         redacted_msg = _redact_credential_from_error(str(e), value)
         return HealthResult(credential_id, "error", f"{config['description']}: {redacted_msg}")
 
+    desc = config["description"]
+    expected = config["expected_status"]
+    if (status in expected) if isinstance(expected, list) else (status == expected):
+        return HealthResult(credential_id, "ok", f"{desc}: valid (HTTP {status})")
+    if status == 401:
+        return HealthResult(credential_id, "error", f"{desc}: invalid key (HTTP 401)")
+    if status == 403:
+        return HealthResult(credential_id, "error", f"{desc}: access denied (HTTP 403)")
+    if 200 <= status < 300:
+        return HealthResult(credential_id, "error", f"{desc}: unexpected HTTP {status}")
+    return HealthResult(credential_id, "error", f"{desc}: HTTP {status}")
+
 
 def check_credential(
     credential_id: str,
@@ -228,13 +285,18 @@ def check_all(
         live: If True, make HTTP requests (default: format-only)
     """
     ids = credential_ids or list(HEALTH_CHECKS.keys())
-    results = []
+    found = provider.get_many(ids)
+    values = [found[cred_id] for cred_id in ids]
 
-    for cred_id in ids:
-        value = provider.get(cred_id)
+    def check(cred_id: str, value: Optional[str]) -> HealthResult:
         if value is None:
-            results.append(HealthResult(cred_id, "missing", f"{cred_id} not configured"))
-        else:
-            results.append(check_credential(cred_id, value, timeout, live=live))
-
-    return results
+            return HealthResult(cred_id, "missing", f"{cred_id} not configured")
+        return check_credential(cred_id, value, timeout, live=live)
+
+    # Live checks are independent HTTP round-trips: run them concurrently so
+    # the total wait is the slowest provider, not the sum. map keeps order.
+    present = sum(v is not None for v in values)
+    if live and present > 1:
+        with ThreadPoolExecutor(max_workers=min(8, present)) as pool:
+            return list(pool.map(check, ids, values))
+    return [check(cred_id, value) for cred_id, value in zip(ids, values)]
@@ -8,11 +8,12 @@ Precedence (highest → lowest):
 
 from __future__ import annotations
 
+import functools
 import os
 import re
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional
 
 
 class CredentialProvider(ABC):
@@ -26,6 +27,14 @@ class CredentialProvider(ABC):
     def name(self) -> str:
         """Human-readable provider name for diagnostics."""
 
+    def get_many(self, credential_ids: Iterable[str]) -> Dict[str, Optional[str]]:
+        """Return {id: value or None} for several credentials at once.
+
+        Providers with per-lookup overhead (file stat, decrypt) override this
+        to pay it once per batch.
+        """
+        return {cid: self.get(cid) for cid in credential_ids}
+
 
 class EnvProvider(CredentialProvider):
     """Reads credentials from environment variables."""
@@ -72,19 +81,31 @@ class DotenvProvider(CredentialProvider):
             line = line.strip()
             if not line or line.startswith("#"):
                 continue
-            m = self._DOTENV_LINE.match(line)
-            if m:
+            # Plain KEY=VALUE needs no regex; an `export` prefix or spaces
+            # before "=" leave a non-identifier key and take the regex path.
+            eq = line.find("=")
+            key = line[:eq]
+            if eq > 0 and key.isidentifier() and key.isascii():
+                val = line[eq + 1:].strip()
+            else:
+                m = self._DOTENV_LINE.match(line)
+                if not m:
+                    continue
                 key = m.group(1)
                 val = m.group(2).strip()
-                # Strip surrounding quotes
-                if len(val) >= 2 and val[0] == val[-1] and val[0] in ('"', "'"):
-                    val = val[1:-1]
-                self._cache[key] = val
+            # Strip surrounding quotes
+            if len(val) >= 2 and val[0] == val[-1] and val[0] in ('"', "'"):
+                val = val[1:-1]
+            self._cache[key] = val
         return self._cache
 
     def get(self, credential_id: str) -> Optional[str]:
         return self._load().get(credential_id)
 
+    def get_many(self, credential_ids: Iterable[str]) -> Dict[str, Optional[str]]:
+        values = self._load()
+        return {cid: values.get(cid) for cid in credential_ids}
+
     def name(self) -> str:
         return "dotenv (.env.local)"
 
@@ -102,6 +123,19 @@ class CompositeProvider(CredentialProvider):
                 return val
         return None
 
+    def get_many(self, credential_ids: Iterable[str]) -> Dict[str, Optional[str]]:
+        result: Dict[str, Optional[str]] = dict.fromkeys(credential_ids)
+        missing = list(result)
+        for provider in self._providers:
+            if not missing:
+                break
+            found = provider.get_many(missing)
+            for cid in missing:
+                if found[cid] is not None:
+                    result[cid] = found[cid]
+            missing = [cid for cid in missing if result[cid] is None]
+        return result
+
     def name(self) -> str:
         names = [p.name() for p in self._providers]
         return f"composite({' → '.join(names)})"
@@ -112,10 +146,14 @@ class CompositeProvider(CredentialProvider):
         return list(self._providers)
 
 
+@functools.lru_cache(maxsize=8)
 def get_credential_provider(project_root: str) -> CompositeProvider:
     """Factory: build the default credential provider chain.
 
     Chain: env → encrypted store (if available) → .env.local
+
+    Memoized per project_root: the chain holds no request state (each
+    provider rechecks its own source), so one instance serves every call.
     """
     chain: List[CredentialProvider] = [EnvProvider()]
 
@@ -128,3 +166,8 @@ def get_credential_provider(project_root: str) -> CompositeProvider:
 
     chain.append(DotenvProvider(project_root))
     return CompositeProvider(chain)
+
+
+def clear_provider_cache() -> None:
+    """Drop memoized provider chains. Used for testing."""
+    get_credential_provider.cache_clear()
@@ -8,12 +8,13 @@ Requires: pip install cryptography
 
 from __future__ import annotations
 
+import functools
 import json
 import logging
 import os
 import stat
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -22,6 +23,20 @@ from loa_cheval.credentials.providers import CredentialProvider
 # Default store location
 _DEFAULT_DIR = Path.home() / ".loa" / "credentials"
 
+# Fernet instances by key file (path, mtime_ns, size), shared by every store
+# opened on the same key in this process (and inherited by forked workers)
+_fernet_pool: Dict[Tuple[str, int, int], Any] = {}
+
+
+@functools.lru_cache(maxsize=1)
+def _fernet_class() -> Any:
+    """The cryptography Fernet class, or None if cryptography is not installed."""
+    try:
+        from cryptography.fernet import Fernet
+    except ImportError:
+        return None
+    return Fernet
+
 
 class EncryptedStore:
     """Read/write encrypted credential storage.
@@ -38,20 +53,25 @@ class EncryptedStore:
         self._store_path = self._dir / "store.json.enc"
         self._fernet = None
         self._cache: Optional[Dict[str, str]] = None
+        # (mtime_ns, size) of the store file behind _cache; None if it was missing
+        self._cache_sig: Optional[Tuple[int, int]] = None
+        self._dir_ready = False
 
     def _ensure_dir(self) -> None:
-        """Create store directory with 0700 permissions."""
+        """Create store directory with 0700 permissions (once per instance)."""
+        if self._dir_ready:
+            return
         self._dir.mkdir(parents=True, exist_ok=True)
         os.chmod(str(self._dir), stat.S_IRWXU)  # 0700
+        self._dir_ready = True
 
     def _get_fernet(self):
         """Get or create the Fernet instance."""
         if self._fernet is not None:
             return self._fernet
 
-        try:
-            from cryptography.fernet import Fernet
-        except ImportError:
+        Fernet = _fernet_class()
+        if Fernet is None:
             raise RuntimeError(
                 "The 'cryptography' package is required for encrypted credential storage.\n"
                 "Install it with: pip install cryptography"
@@ -59,23 +79,43 @@ class EncryptedStore:
 
         self._ensure_dir()
 
-        if self._key_path.is_file():
-            key = self._key_path.read_bytes().strip()
+        try:
+            key_stat = os.stat(self._key_path)
+        except FileNotFoundError:
+            key_stat = None
+
+        if key_stat is not None and stat.S_ISREG(key_stat.st_mode):
+            pool_key = (str(self._key_path), key_stat.st_mtime_ns, key_stat.st_size)
+            fernet = _fernet_pool.get(pool_key)
+            if fernet is None:
+                fernet = Fernet(self._key_path.read_bytes().strip())
+                _fernet_pool[pool_key] = fernet
         else:
             key = Fernet.generate_key()
             self._key_path.write_bytes(key + b"\n")
             os.chmod(str(self._key_path), stat.S_IRUSR | stat.S_IWUSR)  # 0600
+            fernet = Fernet(key)
 
-        self._fernet = Fernet(key)
+        self._fernet = fernet
         return self._fernet
 
     def _load(self) -> Dict[str, str]:
-        """Load and decrypt the store. Returns empty dict if missing/corrupt."""
-        if self._cache is not None:
-            return self._cache
+        """Load and decrypt the store. Returns empty dict if missing/corrupt.
 
-        if not self._store_path.is_file():
+        The decrypted dict is reused until the store file's (mtime_ns, size)
+        changes, so writes from other processes are picked up.
+        """
+        try:
+            st = os.stat(self._store_path)
+        except OSError:
+            st = None
+        if st is None or not stat.S_ISREG(st.st_mode):
             self._cache = {}
+            self._cache_sig = None
+            return self._cache
+
+        sig = (st.st_mtime_ns, st.st_size)
+        if self._cache is not None and sig == self._cache_sig:
             return self._cache
 
         fernet = self._get_fernet()
@@ -91,25 +131,36 @@ class EncryptedStore:
                 self._store_path, type(e).__name__, e,
             )
             self._cache = {}
+        self._cache_sig = sig
 
         return self._cache
 
     def _save(self, data: Dict[str, str]) -> None:
         """Encrypt and save the store."""
         fernet = self._get_fernet()
-        plaintext = json.dumps(data, indent=2).encode()
+        # Compact: the plaintext is never read by humans, only encrypted
+        plaintext = json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
         encrypted = fernet.encrypt(plaintext)
 
         self._ensure_dir()
         self._store_path.write_bytes(encrypted)
-        os.chmod(str(self._store_path), stat.S_IRUSR | stat.S_IWUSR)  # 0600
+        # Rewrites keep the mode; only a freshly created file needs the chmod
+        st = os.stat(self._store_path)
+        if stat.S_IMODE(st.st_mode) != 0o600:
+            os.chmod(str(self._store_path), stat.S_IRUSR | stat.S_IWUSR)  # 0600
 
         self._cache = data
+        self._cache_sig = (st.st_mtime_ns, st.st_size)
 
     def get(self, credential_id: str) -> Optional[str]:
         """Get a credential by ID."""
         return self._load().get(credential_id)
 
+    def get_many(self, credential_ids: Iterable[str]) -> Dict[str, Optional[str]]:
+        """Get several credentials by ID from one load of the store."""
+        data = self._load()
+        return {cid: data.get(cid) for cid in credential_ids}
+
     def set(self, credential_id: str, value: str) -> None:
         """Store a credential."""
         data = dict(self._load())
@@ -143,5 +194,12 @@ class EncryptedFileProvider(CredentialProvider):
             # cryptography not installed
             return None
 
+    def get_many(self, credential_ids: Iterable[str]) -> Dict[str, Optional[str]]:
+        try:
+            return self._store.get_many(credential_ids)
+        except RuntimeError:
+            # cryptography not installed
+            return dict.fromkeys(credential_ids)
+
     def name(self) -> str:
         return "encrypted (~/.loa/credentials/)"
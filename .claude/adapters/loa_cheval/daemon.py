@@ -0,0 +1,319 @@
+"""Unix socket daemon transport for model-invoke (cheval.py --serve).
+
+A long-lived `cheval.py --serve` process keeps the provider stack imported
+and forks one worker per connection, so requests run concurrently and each
+worker's env/cwd/stdin swap stays private to it. Clients opt in with
+CHEVAL_DAEMON=1: cheval.py forwards {argv, env, cwd, stdin} and replays the
+returned {stdout, stderr, exit} before importing anything else.
+
+Frames are a 4-byte big-endian length followed by a UTF-8 JSON object.
+This module is stdlib-only so the client path stays cheap to import.
+"""
+
+from __future__ import annotations
+
+import errno
+import io
+import json
+import logging
+import os
+import socket
+import struct
+import sys
+import tempfile
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger("loa_cheval.daemon")
+
+_HEADER = struct.Struct(">I")
+MAX_FRAME_BYTES = 64 * 1024 * 1024
+MAX_STDIN_BYTES = 8 * 1024 * 1024  # cheval.py passes its MAX_INPUT_BYTES
+
+# Connect/send/receive-request timeout; the response wait covers a full model call
+_IO_TIMEOUT = 30.0
+_RESPONSE_TIMEOUT = 3600.0
+_MAX_WORKERS = 16
+_REAP_INTERVAL = 1.0
+_STDIN_CHUNK = 64 * 1024
+
+
+def socket_path() -> str:
+    """Daemon socket path: $CHEVAL_DAEMON_SOCKET, else a per-user runtime path."""
+    override = os.environ.get("CHEVAL_DAEMON_SOCKET")
+    if override:
+        return override
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return os.path.join(runtime_dir, "cheval.sock")
+    return os.path.join(tempfile.gettempdir(), f"cheval-{os.getuid()}.sock")
+
+
+def _recv_exact(sock: socket.socket, n: int) -> bytes:
+    chunks = []
+    while n:
+        chunk = sock.recv(min(n, 1 << 20))
+        if not chunk:
+            raise ConnectionError("connection closed mid-frame")
+        chunks.append(chunk)
+        n -= len(chunk)
+    return b"".join(chunks)
+
+
+def send_frame(sock: socket.socket, obj: Dict[str, Any]) -> None:
+    """Send one length-prefixed JSON frame."""
+    payload = json.dumps(obj).encode("utf-8")
+    sock.sendall(_HEADER.pack(len(payload)) + payload)
+
+
+def recv_frame(sock: socket.socket) -> Dict[str, Any]:
+    """Receive one length-prefixed JSON frame."""
+    (length,) = _HEADER.unpack(_recv_exact(sock, _HEADER.size))
+    if length > MAX_FRAME_BYTES:
+        raise ValueError(f"frame too large: {length} bytes")
+    obj = json.loads(_recv_exact(sock, length).decode("utf-8"))
+    if not isinstance(obj, dict):
+        raise ValueError("frame must be a JSON object")
+    return obj
+
+
+def _error_json(code: str, message: str, retryable: bool = False) -> str:
+    """Compact error envelope, same bytes as cheval.py's _error_json."""
+    return json.dumps({"error": True, "code": code, "message": message, "retryable": retryable}, separators=(",", ":"), ensure_ascii=False)
+
+
+def _owned_socket(path: str) -> bool:
+    """True if path exists and is owned by the current user.
+
+    A socket planted by someone else (e.g. in a shared /tmp) would otherwise
+    receive our env.
+    """
+    try:
+        if os.stat(path).st_uid != os.getuid():
+            logger.warning("Ignoring daemon socket not owned by current user: %s", path)
+            return False
+    except OSError:
+        return False
+    return True
+
+
+def _connect(path: str, timeout: float = _IO_TIMEOUT) -> Optional[socket.socket]:
+    """Connect to the daemon socket, or None if nothing answers."""
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(timeout)
+    try:
+        sock.connect(path)
+    except OSError:
+        sock.close()
+        return None
+    return sock
+
+
+class _ReplayStdin(io.RawIOBase):
+    """Raw stream yielding bytes already taken from stdin, then the rest of it.
+
+    Holds the original text stream too: dropping it would close its buffer.
+    """
+
+    def __init__(self, head: bytes, stream: Any) -> None:
+        super().__init__()
+        self._head = head
+        self._stream = stream
+        self._rest = stream.buffer
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, b: Any) -> int:
+        if self._head:
+            n = min(len(b), len(self._head))
+            b[:n] = self._head[:n]
+            self._head = self._head[n:]
+            return n
+        read = getattr(self._rest, "read1", self._rest.read)
+        data = read(len(b))
+        b[: len(data)] = data
+        return len(data)
+
+
+def _put_back_stdin(head: bytes) -> None:
+    """Make sys.stdin yield head again, so the in-process path sees all input."""
+    sys.stdin = io.TextIOWrapper(io.BufferedReader(_ReplayStdin(head, sys.stdin)), encoding="utf-8")
+
+
+def _take_stdin(max_bytes: int) -> Tuple[Optional[str], bytes]:
+    """Read at most max_bytes of stdin: (text, raw bytes read).
+
+    text is None when the input is over the limit, not UTF-8, or stdin has
+    no binary buffer; the caller then runs in-process so cmd_invoke applies
+    the configured max_input_bytes and reports the error.
+    """
+    buffer = getattr(sys.stdin, "buffer", None)
+    if buffer is None:
+        return None, b""
+    read = getattr(buffer, "read1", buffer.read)
+    data = bytearray()
+    while len(data) <= max_bytes:
+        chunk = read(min(_STDIN_CHUNK, max_bytes + 1 - len(data)))
+        if not chunk:
+            break
+        data += chunk
+    head = bytes(data)
+    if len(head) > max_bytes:
+        return None, head
+    try:
+        return head.decode("utf-8"), head
+    except UnicodeDecodeError:
+        return None, head
+
+
+def forward(
+    argv: List[str],
+    path: Optional[str] = None,
+    read_stdin: bool = False,
+    max_stdin_bytes: int = MAX_STDIN_BYTES,
+    error_json: Callable[..., str] = _error_json,
+) -> Optional[int]:
+    """Run argv on the daemon, replaying its output here.
+
+    Returns the exit code, or None if no daemon is reachable or the input
+    must be handled in-process (caller runs in-process instead, with any
+    stdin already read put back). With read_stdin — only for commands that
+    read stdin in-process — stdin is read, capped at max_stdin_bytes, before
+    connecting, so a slow producer never holds a daemon worker; otherwise
+    it is left untouched and the daemon sees none. Transport failures are
+    reported on stderr as error_json(code, message, retryable=...), which
+    cheval.py passes so the envelope matches its other errors.
+    """
+    path = path or socket_path()
+    if not _owned_socket(path):
+        return None
+
+    stdin_text = None
+    if read_stdin and not sys.stdin.isatty():
+        stdin_text, head = _take_stdin(max_stdin_bytes)
+        if stdin_text is None:
+            if head:
+                _put_back_stdin(head)
+            return None
+
+    sock = _connect(path)
+    if sock is None:
+        if stdin_text:
+            _put_back_stdin(head)
+        return None
+
+    with sock:
+        request = {"argv": argv, "env": dict(os.environ), "cwd": os.getcwd(), "stdin": stdin_text}
+        try:
+            send_frame(sock, request)
+            sock.settimeout(_RESPONSE_TIMEOUT)
+            response = recv_frame(sock)
+        except (OSError, ValueError) as e:
+            print(error_json("API_ERROR", f"cheval daemon failed: {e}", retryable=True), file=sys.stderr)
+            return 1
+
+    sys.stdout.write(response.get("stdout", ""))
+    sys.stdout.flush()
+    sys.stderr.write(response.get("stderr", ""))
+    sys.stderr.flush()
+    return int(response.get("exit", 1))
+
+
+def _handle_connection(conn: socket.socket, handler: Callable[[Dict[str, Any]], Dict[str, Any]]) -> None:
+    conn.settimeout(_IO_TIMEOUT)
+    with conn:
+        try:
+            if not conn.recv(1, socket.MSG_PEEK):
+                return  # closed without a request: a liveness probe
+            request = recv_frame(conn)
+            send_frame(conn, handler(request))
+        except (OSError, ValueError) as e:
+            logger.warning("daemon_request_failed error=%s", e)
+
+
+def _reap(workers: List[int], block: bool = False) -> None:
+    """Collect finished workers; with block, wait for the oldest first.
+
+    Only our own pids are waited on, never -1, so children started by
+    anything else in this process keep their exit status.
+    """
+    for pid in list(workers):
+        try:
+            done, _ = os.waitpid(pid, 0 if block else os.WNOHANG)
+        except ChildProcessError:
+            done = pid
+        if done:
+            workers.remove(pid)
+        block = False
+
+
+def _bind(path: str) -> socket.socket:
+    """Bind the daemon socket, replacing a stale file but never a live daemon."""
+    if os.path.exists(path):
+        probe = _connect(path, timeout=_REAP_INTERVAL)
+        if probe is not None:
+            probe.close()
+            raise OSError(errno.EADDRINUSE, f"cheval daemon already running on {path}")
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
+
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    old_umask = os.umask(0o177)  # socket file created 0600
+    try:
+        server.bind(path)
+    except OSError:
+        server.close()
+        raise
+    finally:
+        os.umask(old_umask)
+    return server
+
+
+def serve(
+    handler: Callable[[Dict[str, Any]], Dict[str, Any]],
+    path: Optional[str] = None,
+    ready: Optional[Callable[[str], None]] = None,
+) -> None:
+    """Accept requests on the daemon socket forever, one forked worker each.
+
+    handler runs in the worker, so it may swap process-wide state
+    (environment, cwd, std streams) without affecting other requests; state
+    it warms does not survive into the next request. At most _MAX_WORKERS
+    requests run at once. ready(path) is called once listening. Raises
+    OSError(EADDRINUSE) if a daemon already answers on path.
+    """
+    path = path or socket_path()
+    server = _bind(path)
+    server.listen()
+    server.settimeout(_REAP_INTERVAL)  # wake periodically to reap workers
+    logger.info("cheval daemon listening on %s", path)
+    if ready is not None:
+        ready(path)
+
+    workers: List[int] = []
+    try:
+        while True:
+            _reap(workers, block=len(workers) >= _MAX_WORKERS)
+            try:
+                conn, _ = server.accept()
+            except socket.timeout:
+                continue
+            pid = os.fork()
+            if pid == 0:
+                status = 1
+                try:
+                    server.close()
+                    _handle_connection(conn, handler)
+                    status = 0
+                finally:
+                    os._exit(status)  # never fall back into the accept loop or its cleanup
+            conn.close()
+            workers.append(pid)
+    finally:
+        server.close()
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
@@ -1,33 +1,47 @@
-"""Metering — cost ledger, pricing, budget enforcement, and rate limiting."""
-
-from loa_cheval.metering.budget import (
-    ALLOW,
-    BLOCK,
-    DOWNGRADE,
-    WARN,
-    BudgetEnforcer,
-    check_budget,
-)
-from loa_cheval.metering.ledger import (
-    append_ledger,
-    create_ledger_entry,
-    read_daily_spend,
-    read_ledger,
-    record_cost,
-    update_daily_spend,
-)
-from loa_cheval.metering.pricing import (
-    CostBreakdown,
-    PricingEntry,
-    RemainderAccumulator,
-    calculate_cost_micro,
-    calculate_total_cost,
-    find_pricing,
-)
-from loa_cheval.metering.rate_limiter import (
-    TokenBucketLimiter,
-    create_limiter,
-)
+"""Metering — cost ledger, pricing, budget enforcement, and rate limiting.
+
+Submodules are imported on first use, so importing one of them does not
+pull in the others.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import Any, Dict
+
+# Public name → defining submodule, imported on first attribute access (PEP 562)
+_LAZY_EXPORTS: Dict[str, str] = {
+    "ALLOW": "loa_cheval.metering.budget",
+    "BLOCK": "loa_cheval.metering.budget",
+    "DOWNGRADE": "loa_cheval.metering.budget",
+    "WARN": "loa_cheval.metering.budget",
+    "BudgetEnforcer": "loa_cheval.metering.budget",
+    "MeteringConfig": "loa_cheval.metering.budget",
+    "check_budget": "loa_cheval.metering.budget",
+    "load_metering_config": "loa_cheval.metering.budget",
+    "append_ledger": "loa_cheval.metering.ledger",
+    "create_ledger_entry": "loa_cheval.metering.ledger",
+    "read_daily_spend": "loa_cheval.metering.ledger",
+    "read_ledger": "loa_cheval.metering.ledger",
+    "record_cost": "loa_cheval.metering.ledger",
+    "update_daily_spend": "loa_cheval.metering.ledger",
+    "CostBreakdown": "loa_cheval.metering.pricing",
+    "PricingEntry": "loa_cheval.metering.pricing",
+    "RemainderAccumulator": "loa_cheval.metering.pricing",
+    "calculate_cost_micro": "loa_cheval.metering.pricing",
+    "calculate_total_cost": "loa_cheval.metering.pricing",
+    "find_pricing": "loa_cheval.metering.pricing",
+    "TokenBucketLimiter": "loa_cheval.metering.rate_limiter",
+    "create_limiter": "loa_cheval.metering.rate_limiter",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module_name), name)
+
 
 __all__ = [
     "ALLOW",
@@ -35,6 +49,7 @@ __all__ = [
     "BudgetEnforcer",
     "CostBreakdown",
     "DOWNGRADE",
+    "MeteringConfig",
     "PricingEntry",
     "RemainderAccumulator",
     "TokenBucketLimiter",
@@ -46,6 +61,7 @@ __all__ = [
     "create_limiter",
     "create_ledger_entry",
     "find_pricing",
+    "load_metering_config",
     "read_daily_spend",
     "read_ledger",
     "record_cost",
@@ -9,19 +9,25 @@ Implements BudgetHook protocol from retry.py:
 from __future__ import annotations
 
 import fcntl
-import json
 import logging
 import os
-from datetime import datetime, timezone
-from typing import Any, Dict, Optional, Set
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple, Union
 
 from loa_cheval.metering.ledger import (
     _daily_spend_path,
+    _open_for_write,
+    _read_summary,
+    _remember_daily_spend,
+    _utc_today,
+    _write_summary,
     create_ledger_entry,
     read_daily_spend,
     record_cost,
 )
-from loa_cheval.types import BudgetExceededError, CompletionRequest, CompletionResult
+from loa_cheval.metering.pricing import PricingEntry, find_pricing
+from loa_cheval.types import _SLOTS, BudgetExceededError, CompletionRequest, CompletionResult
 
 logger = logging.getLogger("loa_cheval.metering.budget")
 
@@ -32,6 +38,39 @@ WARN = "WARN"
 DOWNGRADE = "DOWNGRADE"
 BLOCK = "BLOCK"
 
+# budget.on_exceeded → status once the daily limit is reached (anything else warns)
+_EXCEEDED_ACTIONS: Dict[str, str] = {"block": BLOCK, "downgrade": DOWNGRADE}
+
+# Most recent Deep Research interaction_ids remembered for deduplication;
+# bounded so a long-lived enforcer (e.g. in the daemon) doesn't grow forever.
+_SEEN_INTERACTIONS_MAXSIZE = 10_000
+
+
+@dataclass(frozen=True, **_SLOTS)
+class MeteringConfig:
+    """Budget settings from the metering config section, with derived thresholds."""
+
+    enabled: bool = True
+    daily_limit: int = 500_000_000  # micro-USD
+    warn_pct: int = 80
+    warn_threshold: int = 400_000_000  # daily_limit * warn_pct // 100
+    exceeded_action: str = DOWNGRADE  # status once daily_limit is reached
+
+
+def load_metering_config(config: Dict[str, Any]) -> MeteringConfig:
+    """Resolve the metering/budget config section once."""
+    metering = config.get("metering", {})
+    budget = metering.get("budget", {})
+    daily_limit = budget.get("daily_micro_usd", 500_000_000)
+    warn_pct = budget.get("warn_at_percent", 80)
+    return MeteringConfig(
+        enabled=metering.get("enabled", True),
+        daily_limit=daily_limit,
+        warn_pct=warn_pct,
+        warn_threshold=daily_limit * warn_pct // 100,
+        exceeded_action=_EXCEEDED_ACTIONS.get(budget.get("on_exceeded", "downgrade"), WARN),
+    )
+
 
 class BudgetEnforcer:
     """Pre/post call budget enforcement hook.
@@ -49,55 +88,38 @@ class BudgetEnforcer:
         ledger_path: str,
         trace_id: Optional[str] = None,
     ) -> None:
-        metering = config.get("metering", {})
-        self._enabled = metering.get("enabled", True)
+        self._settings = load_metering_config(config)
         self._ledger_path = ledger_path
         self._config = config
         self._trace_id = trace_id or "tr-unknown"
         self._attempt = 0
-        self._seen_interactions: Set[str] = set()
-
-        budget = metering.get("budget", {})
-        self._daily_limit = budget.get("daily_micro_usd", 500_000_000)
-        self._warn_pct = budget.get("warn_at_percent", 80)
-        self._on_exceeded = budget.get("on_exceeded", "downgrade")
+        self._seen_interactions: "OrderedDict[str, None]" = OrderedDict()
+        # (provider, model) → pricing from self._config, resolved on first use
+        self._pricing_cache: Dict[Tuple[str, str], Optional[PricingEntry]] = {}
 
     def pre_call(self, request: CompletionRequest) -> str:
         """Pre-call budget check. Returns ALLOW, WARN, DOWNGRADE, or BLOCK.
 
         Uses daily spend counter (O(1) read) instead of scanning ledger.
         """
-        if not self._enabled:
+        settings = self._settings
+        if not settings.enabled:
             return ALLOW
 
         self._attempt += 1
         spent = read_daily_spend(self._ledger_path)
 
-        if spent >= self._daily_limit:
-            if self._on_exceeded == "block":
-                logger.warning(
-                    "Budget BLOCK: spent %d >= limit %d micro-USD",
-                    spent, self._daily_limit,
-                )
-                return BLOCK
-            elif self._on_exceeded == "downgrade":
-                logger.warning(
-                    "Budget DOWNGRADE: spent %d >= limit %d micro-USD",
-                    spent, self._daily_limit,
-                )
-                return DOWNGRADE
-            else:
-                logger.warning(
-                    "Budget WARN: spent %d >= limit %d micro-USD",
-                    spent, self._daily_limit,
-                )
-                return WARN
+        if spent >= settings.daily_limit:
+            logger.warning(
+                "Budget %s: spent %d >= limit %d micro-USD",
+                settings.exceeded_action, spent, settings.daily_limit,
+            )
+            return settings.exceeded_action
 
-        warn_threshold = self._daily_limit * self._warn_pct // 100
-        if spent >= warn_threshold:
+        if spent >= settings.warn_threshold:
             logger.info(
                 "Budget WARN: spent %d >= %d%% of limit (%d micro-USD)",
-                spent, self._warn_pct, self._daily_limit,
+                spent, settings.warn_pct, settings.daily_limit,
             )
             return WARN
 
@@ -115,44 +137,27 @@ class BudgetEnforcer:
 
         Returns ALLOW, WARN, DOWNGRADE, or BLOCK.
         """
-        if not self._enabled:
+        settings = self._settings
+        if not settings.enabled:
             return ALLOW
 
         self._attempt += 1
-        today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+        today = _utc_today()
         summary_path = _daily_spend_path(self._ledger_path, today)
-        os.makedirs(os.path.dirname(summary_path) or ".", exist_ok=True)
-
-        fd = os.open(summary_path, os.O_RDWR | os.O_CREAT, 0o644)
+        fd = _open_for_write(summary_path, os.O_RDWR)
         try:
             fcntl.flock(fd, fcntl.LOCK_EX)
 
-            raw = os.read(fd, 4096)
-            if raw:
-                try:
-                    data = json.loads(raw.decode("utf-8"))
-                except json.JSONDecodeError:
-                    data = {"total_micro_usd": 0, "entry_count": 0}
-            else:
-                data = {"total_micro_usd": 0, "entry_count": 0}
-
+            data = _read_summary(fd)
             spent = data.get("total_micro_usd", 0)
 
-            if spent >= self._daily_limit:
-                if self._on_exceeded == "block":
-                    logger.warning(
-                        "Budget BLOCK (atomic): spent %d >= limit %d micro-USD",
-                        spent, self._daily_limit,
-                    )
-                    return BLOCK
-                elif self._on_exceeded == "downgrade":
+            if spent >= settings.daily_limit:
+                if settings.exceeded_action != WARN:
                     logger.warning(
-                        "Budget DOWNGRADE (atomic): spent %d >= limit %d micro-USD",
-                        spent, self._daily_limit,
+                        "Budget %s (atomic): spent %d >= limit %d micro-USD",
+                        settings.exceeded_action, spent, settings.daily_limit,
                     )
-                    return DOWNGRADE
-                else:
-                    return WARN
+                return settings.exceeded_action
 
             # Write reservation
             if reservation_micro > 0:
@@ -160,12 +165,10 @@ class BudgetEnforcer:
                 data["total_micro_usd"] = spent + reservation_micro
                 data["entry_count"] = data.get("entry_count", 0) + 1
 
-                os.lseek(fd, 0, os.SEEK_SET)
-                os.ftruncate(fd, 0)
-                os.write(fd, json.dumps(data).encode("utf-8"))
+                _write_summary(fd, data)
+                _remember_daily_spend(summary_path, fd, data["total_micro_usd"])
 
-            warn_threshold = self._daily_limit * self._warn_pct // 100
-            if spent >= warn_threshold:
+            if spent >= settings.warn_threshold:
                 return WARN
 
             return ALLOW
@@ -173,22 +176,32 @@ class BudgetEnforcer:
             fcntl.flock(fd, fcntl.LOCK_UN)
             os.close(fd)
 
+    def _pricing(self, provider: str, model: str) -> Optional[PricingEntry]:
+        """Pricing for (provider, model), looked up in config once per enforcer."""
+        key = (provider, model)
+        if key not in self._pricing_cache:
+            self._pricing_cache[key] = find_pricing(provider, model, self._config)
+        return self._pricing_cache[key]
+
     def post_call(self, result: CompletionResult) -> None:
         """Post-call cost reconciliation.
 
         Creates ledger entry and updates daily spend counter.
         Deduplicates by interaction_id for Deep Research (Flatline Beads SKP-002).
         """
-        if not self._enabled:
+        if not self._settings.enabled:
             return
 
         # Deduplicate Deep Research entries by interaction_id
         interaction_id = getattr(result, "interaction_id", None)
-        if interaction_id and interaction_id in self._seen_interactions:
-            logger.info("Skipping duplicate cost for interaction %s", interaction_id)
-            return
         if interaction_id:
-            self._seen_interactions.add(interaction_id)
+            if interaction_id in self._seen_interactions:
+                self._seen_interactions.move_to_end(interaction_id)
+                logger.info("Skipping duplicate cost for interaction %s", interaction_id)
+                return
+            self._seen_interactions[interaction_id] = None
+            if len(self._seen_interactions) > _SEEN_INTERACTIONS_MAXSIZE:
+                self._seen_interactions.popitem(last=False)
 
         agent = (result.model if hasattr(result, "model") else "unknown")
         if result.usage:
@@ -205,38 +218,32 @@ class BudgetEnforcer:
                 usage_source=result.usage.source,
                 attempt=self._attempt,
                 interaction_id=interaction_id,
+                pricing=self._pricing(result.provider, result.model),
             )
             record_cost(entry, self._ledger_path)
 
 
 def check_budget(
-    config: Dict[str, Any],
+    config: Union[Dict[str, Any], MeteringConfig],
     ledger_path: str,
 ) -> str:
     """Standalone budget check (not tied to a request).
 
+    config is the full config dict, or a MeteringConfig already resolved
+    from it with load_metering_config.
+
     Returns ALLOW, WARN, DOWNGRADE, or BLOCK.
     """
-    metering = config.get("metering", {})
-    if not metering.get("enabled", True):
+    settings = config if isinstance(config, MeteringConfig) else load_metering_config(config)
+    if not settings.enabled:
         return ALLOW
 
-    budget = metering.get("budget", {})
-    daily_limit = budget.get("daily_micro_usd", 500_000_000)
-    warn_pct = budget.get("warn_at_percent", 80)
-    on_exceeded = budget.get("on_exceeded", "downgrade")
-
     spent = read_daily_spend(ledger_path)
 
-    if spent >= daily_limit:
-        if on_exceeded == "block":
-            return BLOCK
-        elif on_exceeded == "downgrade":
-            return DOWNGRADE
-        return WARN
+    if spent >= settings.daily_limit:
+        return settings.exceeded_action
 
-    warn_threshold = daily_limit * warn_pct // 100
-    if spent >= warn_threshold:
+    if spent >= settings.warn_threshold:
         return WARN
 
     return ALLOW
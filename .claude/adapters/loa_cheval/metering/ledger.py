@@ -11,10 +11,12 @@ from __future__ import annotations
 import fcntl
 import json
 import logging
+import mmap
 import os
+import threading
+import time
 import uuid
-from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from loa_cheval.metering.pricing import (
     PricingEntry,
@@ -24,6 +26,49 @@ from loa_cheval.metering.pricing import (
 
 logger = logging.getLogger("loa_cheval.metering.ledger")
 
+# Try orjson import — optional C encoder for ledger lines, stdlib json fallback
+try:
+    import orjson
+
+    def _encode_line(entry: Dict[str, Any]) -> bytes:
+        """Encode entry as one compact JSONL line in UTF-8 (orjson)."""
+        return orjson.dumps(entry, option=orjson.OPT_APPEND_NEWLINE)
+except ImportError:
+
+    def _encode_line(entry: Dict[str, Any]) -> bytes:
+        """Encode entry as one compact JSONL line in UTF-8 (stdlib fallback)."""
+        return (json.dumps(entry, separators=(",", ":")) + "\n").encode("utf-8")
+
+# Last total seen per daily-spend summary file, keyed on the file's
+# (mtime_ns, size) so any writer — this process or another — invalidates it
+_daily_spend_cache: Dict[str, Tuple[Tuple[int, int], int]] = {}
+_daily_spend_lock = threading.Lock()
+
+
+# (epoch day, "YYYY-MM-DD") for the current UTC day, recomputed at rollover
+_today_cache: Tuple[int, str] = (-1, "")
+
+
+def _utc_today() -> str:
+    """Current UTC date as YYYY-MM-DD, formatted once per day."""
+    global _today_cache
+    epoch_day = int(time.time()) // 86400
+    cached_day, today = _today_cache
+    if cached_day != epoch_day:
+        tm = time.gmtime(epoch_day * 86400)
+        today = "%04d-%02d-%02d" % (tm.tm_year, tm.tm_mon, tm.tm_mday)
+        _today_cache = (epoch_day, today)
+    return today
+
+
+def _utc_timestamp_ms() -> str:
+    """Current UTC time as YYYY-MM-DDTHH:MM:SS.mmmZ."""
+    now_ms = time.time_ns() // 1_000_000
+    tm = time.gmtime(now_ms // 1000)
+    return "%04d-%02d-%02dT%02d:%02d:%02d.%03dZ" % (
+        tm.tm_year, tm.tm_mon, tm.tm_mday, tm.tm_hour, tm.tm_min, tm.tm_sec, now_ms % 1000,
+    )
+
 
 def _generate_request_id() -> str:
     """Generate a unique request ID."""
@@ -45,6 +90,7 @@ def create_ledger_entry(
     attempt: int = 1,
     usage_source: str = "actual",
     interaction_id: Optional[str] = None,
+    pricing: Optional[PricingEntry] = None,
 ) -> Dict[str, Any]:
     """Create a ledger entry dict matching SDD §4.5.1 format.
 
@@ -53,8 +99,12 @@ def create_ledger_entry(
 
     For Deep Research (pricing_mode="task"), tokens are informational only —
     cost is the flat per_task_micro_usd.
+
+    Callers that already resolved pricing for (provider, model) may pass it
+    as pricing to skip the config lookup.
     """
-    pricing = find_pricing(provider, model, config)
+    if pricing is None:
+        pricing = find_pricing(provider, model, config)
 
     if pricing:
         breakdown = calculate_total_cost(
@@ -69,7 +119,7 @@ def create_ledger_entry(
         pricing_mode = "token"
 
     entry = {
-        "ts": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z",
+        "ts": _utc_timestamp_ms(),
         "trace_id": trace_id,
         "request_id": _generate_request_id(),
         "agent": agent,
@@ -94,18 +144,27 @@ def create_ledger_entry(
     return entry
 
 
+def _open_for_write(path: str, flags: int) -> int:
+    """os.open with O_CREAT (mode 0644), creating the parent directory on demand.
+
+    The directory normally exists already, so it is only created when the
+    first open fails rather than checked on every write.
+    """
+    try:
+        return os.open(path, flags | os.O_CREAT, 0o644)
+    except FileNotFoundError:
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        return os.open(path, flags | os.O_CREAT, 0o644)
+
+
 def append_ledger(entry: Dict[str, Any], ledger_path: str) -> None:
     """Append a single JSONL line with concurrency safety (SDD §4.5.2).
 
     Uses fcntl.flock(LOCK_EX) for atomic append.
     """
-    line = json.dumps(entry, separators=(",", ":")) + "\n"
-    encoded = line.encode("utf-8")
-
-    # Ensure parent directory exists
-    os.makedirs(os.path.dirname(ledger_path) or ".", exist_ok=True)
+    encoded = _encode_line(entry)
 
-    fd = os.open(ledger_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    fd = _open_for_write(ledger_path, os.O_WRONLY | os.O_APPEND)
     try:
         fcntl.flock(fd, fcntl.LOCK_EX)
         os.write(fd, encoded)
@@ -120,21 +179,35 @@ def read_ledger(ledger_path: str) -> List[Dict[str, Any]]:
     Skips corrupted lines, logs warning count.
     Returns list of valid entries.
     """
-    if not os.path.exists(ledger_path):
+    try:
+        fd = os.open(ledger_path, os.O_RDONLY)
+    except FileNotFoundError:
         return []
 
     entries = []
     corrupt_count = 0
 
-    with open(ledger_path, "r") as f:
-        for line_num, line in enumerate(f, 1):
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                entries.append(json.loads(line))
-            except json.JSONDecodeError:
-                corrupt_count += 1
+    # Scan a read-only mapping for newlines instead of iterating a text
+    # file object; each line is parsed straight from bytes.
+    try:
+        size = os.fstat(fd).st_size
+        if size:
+            with mmap.mmap(fd, size, prot=mmap.PROT_READ) as mm:
+                pos = 0
+                while pos < size:
+                    end = mm.find(b"\n", pos)
+                    if end < 0:
+                        end = size
+                    line = mm[pos:end].strip()
+                    pos = end + 1
+                    if not line:
+                        continue
+                    try:
+                        entries.append(json.loads(line))
+                    except ValueError:  # bad JSON or bad UTF-8
+                        corrupt_count += 1
+    finally:
+        os.close(fd)
 
     if corrupt_count:
         logger.warning(
@@ -152,20 +225,61 @@ def read_daily_spend(ledger_path: str) -> int:
 
     Returns total_micro_usd for today, 0 if file doesn't exist.
     """
-    today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+    today = _utc_today()
     summary_path = _daily_spend_path(ledger_path, today)
 
-    if not os.path.exists(summary_path):
+    try:
+        st = os.stat(summary_path)
+    except OSError:
         return 0
+    signature = (st.st_mtime_ns, st.st_size)
+    with _daily_spend_lock:
+        cached = _daily_spend_cache.get(summary_path)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
 
     try:
         with open(summary_path, "r") as f:
             data = json.load(f)
-        if data.get("date") != today:
-            return 0
-        return data.get("total_micro_usd", 0)
     except (json.JSONDecodeError, OSError):
         return 0
+    total = data.get("total_micro_usd", 0) if data.get("date") == today else 0
+    with _daily_spend_lock:
+        _daily_spend_cache[summary_path] = (signature, total)
+    return total
+
+
+def _remember_daily_spend(summary_path: str, fd: int, total: int) -> None:
+    """Record the total just written through fd, so read_daily_spend in this
+    process can skip re-reading the file. Call before releasing the lock."""
+    st = os.fstat(fd)
+    with _daily_spend_lock:
+        _daily_spend_cache[summary_path] = ((st.st_mtime_ns, st.st_size), total)
+
+
+def _read_summary(fd: int) -> Dict[str, Any]:
+    """Read the daily-spend summary from offset 0 of a locked fd.
+
+    A missing, empty or corrupt summary counts as nothing spent yet.
+    """
+    raw = os.pread(fd, 4096, 0)
+    if raw:
+        try:
+            return json.loads(raw.decode("utf-8"))
+        except json.JSONDecodeError:
+            pass
+    return {"total_micro_usd": 0, "entry_count": 0}
+
+
+def _write_summary(fd: int, data: Dict[str, Any]) -> None:
+    """Rewrite the daily-spend summary in place through a locked fd.
+
+    Writes at offset 0 and then trims any longer previous content, so the
+    file offset never has to be moved.
+    """
+    payload = json.dumps(data).encode("utf-8")
+    os.pwrite(fd, payload, 0)
+    os.ftruncate(fd, len(payload))
 
 
 def update_daily_spend(entry_cost_micro: int, ledger_path: str) -> None:
@@ -173,31 +287,20 @@ def update_daily_spend(entry_cost_micro: int, ledger_path: str) -> None:
 
     Uses flock-protected read-modify-write on per-day summary file.
     """
-    today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+    today = _utc_today()
     summary_path = _daily_spend_path(ledger_path, today)
 
-    os.makedirs(os.path.dirname(summary_path) or ".", exist_ok=True)
-
-    fd = os.open(summary_path, os.O_RDWR | os.O_CREAT, 0o644)
+    fd = _open_for_write(summary_path, os.O_RDWR)
     try:
         fcntl.flock(fd, fcntl.LOCK_EX)
 
-        raw = os.read(fd, 4096)
-        if raw:
-            try:
-                data = json.loads(raw.decode("utf-8"))
-            except json.JSONDecodeError:
-                data = {"total_micro_usd": 0, "entry_count": 0}
-        else:
-            data = {"total_micro_usd": 0, "entry_count": 0}
-
+        data = _read_summary(fd)
         data["date"] = today
         data["total_micro_usd"] = data.get("total_micro_usd", 0) + entry_cost_micro
         data["entry_count"] = data.get("entry_count", 0) + 1
 
-        os.lseek(fd, 0, os.SEEK_SET)
-        os.ftruncate(fd, 0)
-        os.write(fd, json.dumps(data).encode("utf-8"))
+        _write_summary(fd, data)
+        _remember_daily_spend(summary_path, fd, data["total_micro_usd"])
     finally:
         fcntl.flock(fd, fcntl.LOCK_UN)
         os.close(fd)
@@ -88,16 +88,28 @@ def calculate_total_cost(
             remainder_reasoning=0,
         )
 
-    # Token-based cost calculation (shared by "token" and "hybrid" modes)
-    inp_cost, inp_rem = calculate_cost_micro(input_tokens, pricing.input_per_mtok)
-    out_cost, out_rem = calculate_cost_micro(output_tokens, pricing.output_per_mtok)
-
+    # Token-based cost calculation (shared by "token" and "hybrid" modes).
+    # Same arithmetic as calculate_cost_micro, done inline for the three
+    # token types; an overflow is re-run through it for the error message.
+    inp_product = input_tokens * pricing.input_per_mtok
+    out_product = output_tokens * pricing.output_per_mtok
     if pricing.reasoning_per_mtok and reasoning_tokens:
-        reas_cost, reas_rem = calculate_cost_micro(
-            reasoning_tokens, pricing.reasoning_per_mtok
-        )
+        reas_product = reasoning_tokens * pricing.reasoning_per_mtok
     else:
-        reas_cost, reas_rem = 0, 0
+        reas_product = 0
+
+    if (
+        inp_product > MAX_SAFE_PRODUCT
+        or out_product > MAX_SAFE_PRODUCT
+        or reas_product > MAX_SAFE_PRODUCT
+    ):
+        calculate_cost_micro(input_tokens, pricing.input_per_mtok)
+        calculate_cost_micro(output_tokens, pricing.output_per_mtok)
+        calculate_cost_micro(reasoning_tokens, pricing.reasoning_per_mtok)
+
+    inp_cost, inp_rem = divmod(inp_product, 1_000_000)
+    out_cost, out_rem = divmod(out_product, 1_000_000)
+    reas_cost, reas_rem = divmod(reas_product, 1_000_000)
 
     token_total = inp_cost + out_cost + reas_cost
 
@@ -1,30 +1,52 @@
-"""Provider adapter registry."""
+"""Provider adapter registry.
+
+Adapter modules are imported on first use, so commands that never reach a
+provider (--dry-run, --validate-bindings, --print-effective-config) don't
+pay their import cost.
+"""
 
 from __future__ import annotations
 
-from typing import Dict, Type
+import importlib
+from typing import Any, Dict, Tuple, Type
 
 from loa_cheval.providers.base import ProviderAdapter
-from loa_cheval.providers.openai_adapter import OpenAIAdapter
-from loa_cheval.providers.anthropic_adapter import AnthropicAdapter
-from loa_cheval.providers.google_adapter import GoogleAdapter
 from loa_cheval.types import ConfigError, ProviderConfig
 
-# Provider type → adapter class mapping
-_ADAPTER_REGISTRY: Dict[str, Type[ProviderAdapter]] = {
-    "openai": OpenAIAdapter,
-    "anthropic": AnthropicAdapter,
-    "openai_compat": OpenAIAdapter,  # OpenAI-compatible uses the same adapter
-    "google": GoogleAdapter,
+# Provider type → (adapter module, adapter class name)
+_ADAPTER_REGISTRY: Dict[str, Tuple[str, str]] = {
+    "openai": ("loa_cheval.providers.openai_adapter", "OpenAIAdapter"),
+    "anthropic": ("loa_cheval.providers.anthropic_adapter", "AnthropicAdapter"),
+    "openai_compat": ("loa_cheval.providers.openai_adapter", "OpenAIAdapter"),  # OpenAI-compatible uses the same adapter
+    "google": ("loa_cheval.providers.google_adapter", "GoogleAdapter"),
+}
+
+# Adapter classes re-exported lazily from this package (PEP 562)
+_LAZY_EXPORTS: Dict[str, str] = {
+    "OpenAIAdapter": "loa_cheval.providers.openai_adapter",
+    "AnthropicAdapter": "loa_cheval.providers.anthropic_adapter",
+    "GoogleAdapter": "loa_cheval.providers.google_adapter",
 }
 
 
+def _load_adapter_class(provider_type: str) -> Type[ProviderAdapter]:
+    """Import and return the adapter class registered for provider_type."""
+    module_name, class_name = _ADAPTER_REGISTRY[provider_type]
+    return getattr(importlib.import_module(module_name), class_name)
+
+
 def get_adapter(config: ProviderConfig) -> ProviderAdapter:
     """Get a provider adapter instance for the given config."""
-    adapter_cls = _ADAPTER_REGISTRY.get(config.type)
-    if adapter_cls is None:
+    if config.type not in _ADAPTER_REGISTRY:
         raise ConfigError(f"Unknown provider type: '{config.type}'. Supported: {list(_ADAPTER_REGISTRY.keys())}")
-    return adapter_cls(config)
+    return _load_adapter_class(config.type)(config)
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module_name), name)
 
 
 __all__ = ["ProviderAdapter", "OpenAIAdapter", "AnthropicAdapter", "GoogleAdapter", "get_adapter"]
@@ -6,6 +6,7 @@ import json
 import logging
 import socket
 import sys
+import threading
 import time
 from abc import ABC, abstractmethod
 from typing import Any, Dict, List, Optional, Tuple
@@ -46,6 +47,33 @@ def _detect_http_client() -> str:
     return _HTTP_CLIENT
 
 
+# Shared httpx.Client so keep-alive connections (TCP + TLS sessions) are
+# reused across requests in the same process. httpx.Client is thread-safe.
+_HTTPX_CLIENT: Any = None
+_HTTPX_CLIENT_LOCK = threading.Lock()
+
+
+def _get_httpx_client() -> Any:
+    """Return the process-wide httpx.Client, creating it on first use."""
+    global _HTTPX_CLIENT
+    if _HTTPX_CLIENT is None:
+        with _HTTPX_CLIENT_LOCK:
+            if _HTTPX_CLIENT is None:
+                import httpx
+
+                try:
+                    import h2  # noqa: F401
+
+                    http2 = True
+                except ImportError:
+                    http2 = False
+                _HTTPX_CLIENT = httpx.Client(
+                    http2=http2,
+                    limits=httpx.Limits(max_keepalive_connections=10),
+                )
+    return _HTTPX_CLIENT
+
+
 def http_post(
     url: str,
     headers: Dict[str, str],
@@ -55,7 +83,7 @@ def http_post(
 ) -> Tuple[int, Dict[str, Any]]:
     """Send HTTP POST and return (status_code, response_json).
 
-    Uses httpx if available, falls back to urllib.request.
+    Uses a pooled httpx.Client if available, falls back to urllib.request.
     """
     client = _detect_http_client()
     encoded = json.dumps(body).encode("utf-8")
@@ -69,7 +97,7 @@ def http_post(
             write=30.0,
             pool=10.0,
         )
-        resp = httpx.post(url, headers=headers, content=encoded, timeout=timeout)
+        resp = _get_httpx_client().post(url, headers=headers, content=encoded, timeout=timeout)
         return resp.status_code, resp.json()
     else:
         import urllib.request
@@ -1,36 +1,48 @@
-"""Routing — alias resolution, agent binding, chain walking, circuit breaker, context filtering."""
-
-from loa_cheval.routing.resolver import (
-    NATIVE_ALIAS,
-    NATIVE_PROVIDER,
-    NATIVE_MODEL,
-    resolve_alias,
-    resolve_agent_binding,
-    resolve_execution,
-    validate_bindings,
-)
-from loa_cheval.routing.chains import (
-    validate_chains,
-    walk_downgrade_chain,
-    walk_fallback_chain,
-)
-from loa_cheval.routing.circuit_breaker import (
-    CLOSED,
-    HALF_OPEN,
-    OPEN,
-    check_state,
-    cleanup_stale_files,
-    record_failure,
-    record_success,
-)
-from loa_cheval.routing.context_filter import (
-    audit_filter_context,
-    filter_context,
-    filter_message_content,
-    get_context_access,
-    invalidate_permissions_cache,
-    lookup_trust_scopes,
-)
+"""Routing — alias resolution, agent binding, chain walking, circuit breaker, context filtering.
+
+Submodules are imported on first use, so importing the resolver alone does
+not pull in chains, the circuit breaker or the context filter.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import Any, Dict
+
+# Public name → defining submodule, imported on first attribute access (PEP 562)
+_LAZY_EXPORTS: Dict[str, str] = {
+    "NATIVE_ALIAS": "loa_cheval.routing.resolver",
+    "NATIVE_PROVIDER": "loa_cheval.routing.resolver",
+    "NATIVE_MODEL": "loa_cheval.routing.resolver",
+    "resolve_alias": "loa_cheval.routing.resolver",
+    "resolve_agent_binding": "loa_cheval.routing.resolver",
+    "resolve_execution": "loa_cheval.routing.resolver",
+    "validate_bindings": "loa_cheval.routing.resolver",
+    "validate_chains": "loa_cheval.routing.chains",
+    "walk_downgrade_chain": "loa_cheval.routing.chains",
+    "walk_fallback_chain": "loa_cheval.routing.chains",
+    "CLOSED": "loa_cheval.routing.circuit_breaker",
+    "HALF_OPEN": "loa_cheval.routing.circuit_breaker",
+    "OPEN": "loa_cheval.routing.circuit_breaker",
+    "check_state": "loa_cheval.routing.circuit_breaker",
+    "cleanup_stale_files": "loa_cheval.routing.circuit_breaker",
+    "record_failure": "loa_cheval.routing.circuit_breaker",
+    "record_success": "loa_cheval.routing.circuit_breaker",
+    "audit_filter_context": "loa_cheval.routing.context_filter",
+    "filter_context": "loa_cheval.routing.context_filter",
+    "filter_message_content": "loa_cheval.routing.context_filter",
+    "get_context_access": "loa_cheval.routing.context_filter",
+    "invalidate_permissions_cache": "loa_cheval.routing.context_filter",
+    "lookup_trust_scopes": "loa_cheval.routing.context_filter",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module_name), name)
+
 
 __all__ = [
     "CLOSED",
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import logging
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, FrozenSet, List, Optional, Set, Tuple
 
 from loa_cheval.types import (
     AgentBinding,
@@ -160,36 +160,52 @@ def validate_bindings(config: Dict[str, Any]) -> List[str]:
     aliases = config.get("aliases", {})
     providers = config.get("providers", {})
 
+    # Agents typically share a handful of aliases: resolve each model ref and
+    # build each model's capability set once rather than once per agent.
+    resolved_refs: Dict[str, Any] = {}
+    capability_sets: Dict[Tuple[str, str], FrozenSet[str]] = {}
+
     for agent_name, agent_config in agents.items():
         model_ref = agent_config.get("model", NATIVE_ALIAS)
 
         try:
             # Check alias resolves
-            resolved = resolve_alias(model_ref, aliases)
-
-            # Check provider exists (unless native)
-            if resolved.provider != NATIVE_PROVIDER:
-                if resolved.provider not in providers:
-                    errors.append(
-                        f"Agent '{agent_name}': model '{model_ref}' resolves to provider "
-                        f"'{resolved.provider}' which is not configured"
-                    )
-
-                # Check model exists in provider
-                provider_config = providers.get(resolved.provider, {})
-                provider_models = provider_config.get("models", {})
-                if resolved.model_id not in provider_models:
-                    errors.append(
-                        f"Agent '{agent_name}': model '{resolved.model_id}' not found in "
-                        f"provider '{resolved.provider}' models"
-                    )
+            resolved = resolved_refs.get(model_ref)
+            if resolved is None:
+                try:
+                    resolved = resolve_alias(model_ref, aliases)
+                except ConfigError as e:
+                    resolved = e
+                resolved_refs[model_ref] = resolved
+            if isinstance(resolved, ConfigError):
+                raise resolved
+
+            if resolved.provider == NATIVE_PROVIDER:
+                continue
+
+            # Check provider exists
+            if resolved.provider not in providers:
+                errors.append(
+                    f"Agent '{agent_name}': model '{model_ref}' resolves to provider "
+                    f"'{resolved.provider}' which is not configured"
+                )
+
+            # Check model exists in provider
+            provider_models = providers.get(resolved.provider, {}).get("models", {})
+            if resolved.model_id not in provider_models:
+                errors.append(
+                    f"Agent '{agent_name}': model '{resolved.model_id}' not found in "
+                    f"provider '{resolved.provider}' models"
+                )
 
             # Check capabilities if requirements specified
             requires = agent_config.get("requires", {})
-            if requires and resolved.provider != NATIVE_PROVIDER:
-                provider_config = providers.get(resolved.provider, {})
-                model_config = provider_config.get("models", {}).get(resolved.model_id, {})
-                capabilities = model_config.get("capabilities", [])
+            if requires:
+                key = (resolved.provider, resolved.model_id)
+                capabilities = capability_sets.get(key)
+                if capabilities is None:
+                    model_config = provider_models.get(resolved.model_id, {})
+                    capabilities = capability_sets[key] = frozenset(model_config.get("capabilities", []))
 
                 for req_key, req_value in requires.items():
                     if req_key == "native_runtime":
@@ -219,14 +235,20 @@ def validate_bindings(config: Dict[str, Any]) -> List[str]:
 
 
 def _detect_alias_cycles(aliases: Dict[str, str]) -> None:
-    """DFS-based cycle detection for alias graph."""
+    """DFS-based cycle detection for alias graph.
+
+    Aliases already shown to terminate are remembered, so each chain is
+    walked once overall rather than once per alias that reaches it.
+    """
+    acyclic: Set[str] = set()
     for alias in aliases:
         if alias == NATIVE_ALIAS:
             continue
         visited: Set[str] = set()
         current = alias
-        while current in aliases and ":" not in aliases.get(current, ":"):
+        while current in aliases and ":" not in aliases.get(current, ":") and current not in acyclic:
             if current in visited:
                 raise ConfigError(f"Circular alias chain detected starting from '{alias}'")
             visited.add(current)
             current = aliases[current]
+        acyclic |= visited
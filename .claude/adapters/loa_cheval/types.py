@@ -2,8 +2,12 @@
 
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence
+
+# dataclass(slots=True) needs Python 3.10+; older interpreters get plain dataclasses.
+_SLOTS: Dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
 
 
 # --- Completion Request/Result ---
@@ -13,7 +17,7 @@ from typing import Any, Dict, List, Optional
 class CompletionRequest:
     """Canonical request sent to any provider adapter."""
 
-    messages: List[Dict[str, Any]]  # [{"role": "system"|"user"|"assistant"|"tool", "content": str}]
+    messages: Sequence[Dict[str, Any]]  # [{"role": "system"|"user"|"assistant"|"tool", "content": str}]
     model: str  # Provider-specific model ID (e.g., "gpt-5.2")
     temperature: float = 0.7
     max_tokens: int = 4096
@@ -74,7 +78,7 @@ class ResolvedModel:
 # --- Provider Config ---
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ProviderConfig:
     """Per-provider configuration."""
 
@@ -88,7 +92,7 @@ class ProviderConfig:
     write_timeout: float = 30.0
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class ModelConfig:
     """Per-model configuration within a provider."""
 
@@ -106,6 +110,10 @@ class ModelConfig:
 class ChevalError(Exception):
     """Base error for all cheval operations."""
 
+    # BaseException still provides a __dict__; slots keep the fixed
+    # attributes out of it and give them descriptor-speed access.
+    __slots__ = ("code", "retryable", "context")
+
     def __init__(self, code: str, message: str, retryable: bool = False, context: Optional[Dict[str, Any]] = None):
         super().__init__(f"[cheval] {code}: {message}")
         self.code = code
@@ -124,6 +132,8 @@ class ChevalError(Exception):
 class NativeRuntimeRequired(ChevalError):
     """Agent requires native_runtime — cannot be routed to remote model."""
 
+    __slots__ = ()
+
     def __init__(self, agent: str):
         super().__init__("NATIVE_RUNTIME_REQUIRED", f"Agent '{agent}' requires native_runtime", retryable=False, context={"agent": agent})
 
@@ -131,6 +141,8 @@ class NativeRuntimeRequired(ChevalError):
 class ProviderUnavailableError(ChevalError):
     """Provider is not reachable or circuit breaker is open."""
 
+    __slots__ = ()
+
     def __init__(self, provider: str, reason: str = ""):
         super().__init__("PROVIDER_UNAVAILABLE", f"Provider '{provider}' unavailable: {reason}", retryable=True, context={"provider": provider})
 
@@ -138,6 +150,8 @@ class ProviderUnavailableError(ChevalError):
 class RateLimitError(ChevalError):
     """Provider returned 429 Too Many Requests."""
 
+    __slots__ = ()
+
     def __init__(self, provider: str, retry_after: Optional[float] = None):
         super().__init__("RATE_LIMITED", f"Rate limited by {provider}", retryable=True, context={"provider": provider, "retry_after": retry_after})
 
@@ -145,6 +159,8 @@ class RateLimitError(ChevalError):
 class BudgetExceededError(ChevalError):
     """Daily budget exceeded."""
 
+    __slots__ = ()
+
     def __init__(self, spent: int, limit: int):
         super().__init__("BUDGET_EXCEEDED", f"Budget exceeded: {spent} >= {limit} micro-USD", retryable=False, context={"spent": spent, "limit": limit})
 
@@ -152,6 +168,8 @@ class BudgetExceededError(ChevalError):
 class ContextTooLargeError(ChevalError):
     """Input exceeds model context window."""
 
+    __slots__ = ()
+
     def __init__(self, estimated_tokens: int, available: int, context_window: int):
         super().__init__(
             "CONTEXT_TOO_LARGE",
@@ -164,6 +182,8 @@ class ContextTooLargeError(ChevalError):
 class RetriesExhaustedError(ChevalError):
     """All retry/fallback attempts exhausted."""
 
+    __slots__ = ()
+
     def __init__(self, total_attempts: int, last_error: Optional[str] = None):
         super().__init__("RETRIES_EXHAUSTED", f"Failed after {total_attempts} attempts: {last_error or 'unknown'}", retryable=False, context={"total_attempts": total_attempts})
 
@@ -171,6 +191,8 @@ class RetriesExhaustedError(ChevalError):
 class ConfigError(ChevalError):
     """Invalid configuration."""
 
+    __slots__ = ()
+
     def __init__(self, message: str):
         super().__init__("INVALID_CONFIG", message, retryable=False)
 
@@ -178,5 +200,7 @@ class ConfigError(ChevalError):
 class InvalidInputError(ChevalError):
     """Invalid input to model-invoke."""
 
+    __slots__ = ()
+
     def __init__(self, message: str):
         super().__init__("INVALID_INPUT", message, retryable=False)
@@ -0,0 +1,13 @@
+"""Shared fixtures for the cheval adapter tests."""
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _isolated_config_sidecar(tmp_path, monkeypatch):
+    """Keep config sidecars out of the developer's real cache directory.
+
+    The env var is inherited by cheval.py subprocesses too. Tests that need
+    a specific cache dir (or none) still override it.
+    """
+    monkeypatch.setenv("CHEVAL_CACHE_DIR", str(tmp_path / "cheval-cache"))
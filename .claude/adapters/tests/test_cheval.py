@@ -0,0 +1,590 @@
+"""Tests for cheval.py CLI internals (SDD §4.2.2, §4.3.2)."""
+
+import io
+import json
+import os
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+# Add adapters dir to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import cheval
+from cheval import (
+    _clear_adapter_cache,
+    _clear_persona_cache,
+    _dumps,
+    _error_json,
+    _load_persona,
+    _read_stdin,
+    _redact_secrets,
+    _write_json,
+    _write_text,
+)
+from loa_cheval.types import InvalidInputError
+
+
+@pytest.fixture
+def skills_dir(tmp_path, monkeypatch):
+    """Project root with an empty .claude/skills tree as cwd."""
+    monkeypatch.chdir(tmp_path)
+    skills = tmp_path / ".claude" / "skills"
+    skills.mkdir(parents=True)
+    _clear_persona_cache()
+    yield skills
+    _clear_persona_cache()
+
+
+def _write_persona(skills: Path, agent: str, text: str) -> Path:
+    agent_dir = skills / agent
+    agent_dir.mkdir(exist_ok=True)
+    path = agent_dir / "persona.md"
+    path.write_text(text)
+    return path
+
+
+class TestPersonaCache:
+    def test_loads_persona(self, skills_dir):
+        _write_persona(skills_dir, "reviewer", "You are a reviewer.\n")
+        assert _load_persona("reviewer") == "You are a reviewer."
+
+    def test_cache_hit_skips_read(self, skills_dir, monkeypatch):
+        _write_persona(skills_dir, "reviewer", "cached")
+        assert _load_persona("reviewer") == "cached"
+
+        def _fail(*args, **kwargs):
+            raise AssertionError("persona re-read on cache hit")
+
+        monkeypatch.setattr(Path, "read_text", _fail)
+        assert _load_persona("reviewer") == "cached"
+
+    def test_modified_file_is_reread(self, skills_dir):
+        path = _write_persona(skills_dir, "reviewer", "v1")
+        assert _load_persona("reviewer") == "v1"
+        path.write_text("version two")
+        assert _load_persona("reviewer") == "version two"
+
+    def test_deleted_file_falls_back_to_system(self, skills_dir, tmp_path):
+        path = _write_persona(skills_dir, "reviewer", "persona")
+        system = tmp_path / "system.md"
+        system.write_text("system only")
+        assert _load_persona("reviewer") == "persona"
+        path.unlink()
+        assert _load_persona("reviewer", system_override=str(system)) == "system only"
+
+    def test_persona_merged_with_system(self, skills_dir, tmp_path):
+        _write_persona(skills_dir, "reviewer", "persona")
+        system = tmp_path / "system.md"
+        system.write_text("context")
+        merged = _load_persona("reviewer", system_override=str(system))
+        assert merged.startswith("persona")
+        assert "context" in merged
+        assert merged.endswith(cheval.PERSONA_AUTHORITY)
+
+    def test_merged_prompt_reused(self, skills_dir, tmp_path):
+        _write_persona(skills_dir, "reviewer", "persona")
+        system = tmp_path / "system.md"
+        system.write_text("context")
+        first = _load_persona("reviewer", system_override=str(system))
+        assert _load_persona("reviewer", system_override=str(system)) is first
+        system.write_text("changed context")
+        assert "changed context" in _load_persona("reviewer", system_override=str(system))
+
+    def test_cache_is_bounded(self, skills_dir, monkeypatch):
+        monkeypatch.setattr(cheval, "_PERSONA_CACHE_MAXSIZE", 2)
+        for name in ("a", "b", "c"):
+            _write_persona(skills_dir, name, name)
+            _load_persona(name)
+        assert len(cheval._PERSONA_CACHE) == 2
+        assert not any(key.endswith(os.path.join("a", "persona.md")) for key in cheval._PERSONA_CACHE)
+
+    def test_agent_without_directory_skips_stat(self, skills_dir, monkeypatch):
+        _write_persona(skills_dir, "reviewer", "persona")
+        _load_persona("reviewer")
+
+        def _fail(path):
+            raise AssertionError(f"stat of persona candidate {path}")
+
+        monkeypatch.setattr(cheval, "_read_prompt_file", _fail)
+        assert _load_persona("routing-only") is None
+
+    def test_new_agent_directory_is_found(self, skills_dir):
+        assert _load_persona("late") is None
+        _write_persona(skills_dir, "late", "late persona")
+        assert _load_persona("late") == "late persona"
+
+
+class TestJsonOutput:
+    def test_dumps_round_trip(self):
+        obj = {"content": "héllo\n" * 100, "usage": {"input_tokens": 3}, "tool_calls": [{"id": "t1"}]}
+        assert json.loads(_dumps(obj)) == obj
+
+    def test_dumps_indent(self):
+        out = _dumps({"agent": "reviewer", "temperature": 0.3}, indent=True)
+        assert "\n  " in out
+        assert json.loads(out) == {"agent": "reviewer", "temperature": 0.3}
+
+    def test_dumps_format_matches_orjson(self):
+        # Same bytes with or without the optional orjson extra
+        assert _dumps({"content": "héllo", "n": [1, 2]}) == '{"content":"héllo","n":[1,2]}'
+        assert _dumps({"a": [1]}, indent=True) == '{\n  "a": [\n    1\n  ]\n}'
+        assert cheval._dumps_bytes({"a": "é"}) == '{"a":"é"}\n'.encode("utf-8")
+
+    def test_error_json_shape(self):
+        data = json.loads(_error_json("RATE_LIMITED", "slow down", retryable=True, provider="openai"))
+        assert data == {
+            "error": True,
+            "code": "RATE_LIMITED",
+            "message": "slow down",
+            "retryable": True,
+            "provider": "openai",
+        }
+
+
+    def test_write_json_to_byte_buffer(self):
+        raw = io.BytesIO()
+        out = io.TextIOWrapper(raw, encoding="ascii")
+        _write_json(out, {"content": "héllo"})
+        assert raw.getvalue().endswith(b"\n")
+        assert json.loads(raw.getvalue()) == {"content": "héllo"}
+
+    def test_write_json_text_stream(self):
+        out = io.StringIO()
+        _write_json(out, {"a": 1}, indent=True)
+        assert out.getvalue().endswith("}\n")
+        assert json.loads(out.getvalue()) == {"a": 1}
+
+
+class TestRedactSecrets:
+    def test_all_live_keys_redacted(self):
+        env = {"OPENAI_API_KEY": "sk-openai-123", "GOOGLE_API_KEY": "AIza-google-456"}
+        with patch.dict(os.environ, env, clear=True):
+            msg = _redact_secrets("auth sk-openai-123 failed; retry with AIza-google-456 and sk-openai-123")
+        assert "sk-openai-123" not in msg
+        assert "AIza-google-456" not in msg
+        assert msg.count("***REDACTED***") == 3
+
+    def test_no_keys_configured(self):
+        with patch.dict(os.environ, {}, clear=True):
+            assert _redact_secrets("plain message") == "plain message"
+
+    def test_pattern_follows_env_changes(self):
+        with patch.dict(os.environ, {"ANTHROPIC_API_KEY": "sk-ant-first"}, clear=True):
+            assert "sk-ant-first" not in _redact_secrets("sk-ant-first")
+        with patch.dict(os.environ, {"ANTHROPIC_API_KEY": "sk-ant-second"}, clear=True):
+            assert _redact_secrets("sk-ant-first sk-ant-second") == "sk-ant-first ***REDACTED***"
+
+    def test_overlapping_keys_use_longest_match(self):
+        with patch.dict(os.environ, {"OPENAI_API_KEY": "sk-abc", "ANTHROPIC_API_KEY": "sk-abcdef"}, clear=True):
+            assert _redact_secrets("x sk-abcdef y sk-abc") == "x ***REDACTED*** y ***REDACTED***"
+
+    def test_regex_metacharacters_escaped(self):
+        with patch.dict(os.environ, {"MOONSHOT_API_KEY": "a.b*c"}, clear=True):
+            assert _redact_secrets("axbyc a.b*c") == "axbyc ***REDACTED***"
+
+
+class TestReadStdin:
+    def test_reads_binary_buffer(self, monkeypatch):
+        stdin = io.TextIOWrapper(io.BytesIO("prompt — ünïcode\n".encode("utf-8")), encoding="latin-1")
+        monkeypatch.setattr(sys, "stdin", stdin)
+        assert _read_stdin() == "prompt — ünïcode\n"
+
+    def test_text_only_stream(self, monkeypatch):
+        monkeypatch.setattr(sys, "stdin", io.StringIO("plain"))
+        assert _read_stdin() == "plain"
+
+    def test_reads_in_chunks(self, monkeypatch):
+        payload = "x" * (cheval._STDIN_CHUNK * 2 + 7)
+        monkeypatch.setattr(sys, "stdin", io.TextIOWrapper(io.BytesIO(payload.encode("utf-8"))))
+        assert _read_stdin() == payload
+
+    def test_oversized_input_rejected(self, monkeypatch):
+        monkeypatch.setattr(sys, "stdin", io.TextIOWrapper(io.BytesIO(b"y" * 101)))
+        with pytest.raises(InvalidInputError):
+            _read_stdin(max_bytes=100)
+        monkeypatch.setattr(sys, "stdin", io.StringIO("ü" * 60))
+        with pytest.raises(InvalidInputError):
+            _read_stdin(max_bytes=100)
+
+    def test_oversized_input_file_exits_invalid_input(self, tmp_path, capsys):
+        prompt = tmp_path / "prompt.txt"
+        prompt.write_text("z" * 101)
+        config = dict(BATCH_CONFIG, defaults={"max_input_bytes": 100})
+        args = cheval._build_parser().parse_args(["--agent", "reviewing-code", "--input", str(prompt)])
+        assert cheval.cmd_invoke(args, config=config) == cheval.Exit.INVALID_INPUT
+        assert "max_input_bytes" in json.loads(capsys.readouterr().err)["message"]
+
+
+class TestWriteText:
+    def test_writes_utf8_bytes_with_newline(self):
+        raw = io.BytesIO()
+        out = io.TextIOWrapper(raw, encoding="latin-1")
+        out.write("header ")
+        _write_text(out, "réponse — " * 1000)
+        assert raw.getvalue() == b"header " + ("réponse — " * 1000).encode("utf-8") + b"\n"
+
+    def test_text_only_stream(self):
+        out = io.StringIO()
+        _write_text(out, "plain")
+        assert out.getvalue() == "plain\n"
+
+
+class TestLazyImports:
+    def test_cli_import_skips_provider_and_metering_stack(self):
+        import subprocess
+
+        adapters_dir = str(Path(__file__).resolve().parent.parent)
+        code = (
+            "import sys; sys.path.insert(0, %r); import cheval; "
+            "heavy = ('loa_cheval.providers.base', 'loa_cheval.metering.budget', 'loa_cheval.routing.context_filter'); "
+            "print([m for m in heavy if m in sys.modules])" % adapters_dir
+        )
+        out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        assert out.stdout.strip() == "[]"
+
+    def test_package_exports_resolve_on_access(self):
+        from loa_cheval.metering import BudgetEnforcer
+        from loa_cheval.routing import filter_context
+
+        assert BudgetEnforcer.__module__ == "loa_cheval.metering.budget"
+        assert filter_context.__module__ == "loa_cheval.routing.context_filter"
+
+
+class TestExitCodes:
+    def test_values_match_io_contract(self):
+        assert cheval.Exit.SUCCESS == 0
+        assert cheval.Exit.RATE_LIMITED == cheval.Exit.API_ERROR == 1
+        assert cheval.Exit.NATIVE_RUNTIME_REQUIRED == 2
+        assert cheval.Exit.INTERACTION_PENDING == 8
+
+    def test_dynamic_lookup_includes_aliases(self):
+        for code in ("RATE_LIMITED", "PROVIDER_UNAVAILABLE", "RETRIES_EXHAUSTED", "INVALID_CONFIG"):
+            assert code in cheval.EXIT_CODES
+        assert cheval.EXIT_CODES["BUDGET_EXCEEDED"] == 6
+
+
+BATCH_CONFIG = {
+    "providers": {
+        "openai": {
+            "type": "openai",
+            "endpoint": "https://api.openai.com/v1",
+            "auth": "sk-test",
+            "models": {"gpt-5.2": {"capabilities": ["chat"], "context_window": 128000}},
+        },
+    },
+    "aliases": {"reviewer": "openai:gpt-5.2"},
+    "agents": {"reviewing-code": {"model": "reviewer", "temperature": 0.3}},
+}
+
+
+def _run_batch(monkeypatch, capsys, jobs, concurrency=1):
+    calls = []
+
+    def _load_config(cli_args=None):
+        calls.append(cli_args)
+        return BATCH_CONFIG, {}
+
+    monkeypatch.setattr(cheval, "load_config", _load_config)
+    lines = "\n".join(job if isinstance(job, str) else json.dumps(job) for job in jobs) + "\n"
+    monkeypatch.setattr(sys, "stdin", io.StringIO(lines))
+    args = cheval._build_parser().parse_args(["--batch", "--concurrency", str(concurrency)])
+    code = cheval.cmd_batch(args)
+    results = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    return code, results, calls
+
+
+class TestBatch:
+    def test_results_in_input_order(self, monkeypatch, capsys, tmp_path):
+        monkeypatch.chdir(tmp_path)
+        jobs = [{"id": i, "agent": "reviewing-code", "prompt": "x", "dry_run": True} for i in range(8)]
+        code, results, calls = _run_batch(monkeypatch, capsys, jobs, concurrency=4)
+        assert code == 0
+        assert len(calls) == 1
+        assert [r["id"] for r in results] == list(range(8))
+        assert all(r["exit_code"] == 0 and r["resolved_model"] == "gpt-5.2" for r in results)
+
+    def test_job_errors_reported_per_line(self, monkeypatch, capsys, tmp_path):
+        monkeypatch.chdir(tmp_path)
+        jobs = [
+            {"id": "ok", "agent": "reviewing-code", "prompt": "x", "dry_run": True},
+            {"id": "unknown", "agent": "no-such-agent", "prompt": "x"},
+            {"id": "no-input", "agent": "reviewing-code"},
+            {"id": "bad-field", "agent": "reviewing-code", "prompt": "x", "output_format": "text"},
+            "not json",
+        ]
+        code, results, _ = _run_batch(monkeypatch, capsys, jobs)
+        assert code == 2
+        assert results[0]["exit_code"] == 0
+        assert results[1]["error"] is True and results[1]["exit_code"] == 2
+        assert results[2]["code"] == "INVALID_INPUT"
+        assert "output_format" in results[3]["message"]
+        assert results[4]["id"] is None and results[4]["code"] == "INVALID_INPUT"
+
+    def test_jobs_read_from_input_file(self, monkeypatch, capsys, tmp_path):
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr(cheval, "load_config", lambda cli_args=None: (BATCH_CONFIG, {}))
+        monkeypatch.setattr(sys, "stdin", io.StringIO("must not be read\n"))
+        jobs = tmp_path / "jobs.jsonl"
+        jobs.write_text(json.dumps({"id": "a", "agent": "reviewing-code", "prompt": "x", "dry_run": True}) + "\n\n")
+        args = cheval._build_parser().parse_args(["--batch", "--input", str(jobs)])
+        assert cheval.cmd_batch(args) == 0
+        (result,) = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+        assert result["id"] == "a" and result["exit_code"] == 0
+
+    def test_missing_input_file(self, capsys, tmp_path):
+        args = cheval._build_parser().parse_args(["--batch", "--input", str(tmp_path / "missing.jsonl")])
+        assert cheval.cmd_batch(args) == cheval.Exit.INVALID_INPUT
+        assert json.loads(capsys.readouterr().err)["code"] == "INVALID_INPUT"
+
+    def test_adapter_shared_across_jobs(self, monkeypatch, capsys, tmp_path):
+        monkeypatch.chdir(tmp_path)
+        _clear_adapter_cache()
+        built = []
+
+        class _Result:
+            content = "done"
+            model = "gpt-5.2"
+            provider = "openai"
+            thinking = None
+            tool_calls = None
+            latency_ms = 1
+
+            class usage:
+                input_tokens = 1
+                output_tokens = 1
+
+        class _Adapter:
+            def complete(self, request):
+                return _Result()
+
+        def _get_adapter(config):
+            built.append(config.name)
+            return _Adapter()
+
+        monkeypatch.setattr("loa_cheval.providers.get_adapter", _get_adapter)
+        monkeypatch.setattr("loa_cheval.providers.retry.invoke_with_retry", lambda adapter, request, *a, **kw: adapter.complete(request))
+        jobs = [{"id": i, "agent": "reviewing-code", "prompt": "x"} for i in range(3)]
+        with patch.dict(BATCH_CONFIG, {"feature_flags": {"metering": False}}):
+            code, results, _ = _run_batch(monkeypatch, capsys, jobs)
+        assert code == 0
+        assert built == ["openai"]
+        assert [r["content"] for r in results] == ["done"] * 3
+
+    def test_messages_built_as_tuple(self, monkeypatch, capsys, skills_dir):
+        _clear_adapter_cache()
+        _write_persona(skills_dir, "reviewing-code", "persona")
+        seen = []
+
+        class _Adapter:
+            def complete(self, request):
+                seen.append(request.messages)
+                raise RuntimeError("stop")
+
+        monkeypatch.setattr("loa_cheval.providers.get_adapter", lambda config: _Adapter())
+        monkeypatch.setattr("loa_cheval.providers.retry.invoke_with_retry", lambda adapter, request, *a, **kw: adapter.complete(request))
+        jobs = [{"agent": "reviewing-code", "prompt": "x"}, {"agent": "reviewing-code", "prompt": "y", "system": "missing.md"}]
+        with patch.dict(BATCH_CONFIG, {"feature_flags": {"metering": False}}):
+            _run_batch(monkeypatch, capsys, jobs)
+        assert seen[0] == ({"role": "system", "content": "persona"}, {"role": "user", "content": "x"})
+        assert json.loads(json.dumps(seen[1]))[1] == {"role": "user", "content": "y"}
+
+
+class TestAdapterCache:
+    @pytest.fixture(autouse=True)
+    def built(self, monkeypatch):
+        built = []
+
+        def _get_adapter(config):
+            built.append(config)
+            return object()
+
+        monkeypatch.setattr("loa_cheval.providers.get_adapter", _get_adapter)
+        _clear_adapter_cache()
+        yield built
+        _clear_adapter_cache()
+
+    def test_reused_for_same_config(self, built):
+        first = cheval._get_cached_adapter("openai", BATCH_CONFIG)
+        assert cheval._get_cached_adapter("openai", BATCH_CONFIG) is first
+        assert len(built) == 1
+
+    def test_auth_change_builds_new_adapter(self, built):
+        rotated = {**BATCH_CONFIG, "providers": {"openai": {**BATCH_CONFIG["providers"]["openai"], "auth": "sk-rotated"}}}
+        first = cheval._get_cached_adapter("openai", BATCH_CONFIG)
+        assert cheval._get_cached_adapter("openai", rotated) is not first
+        assert len(built) == 2
+
+    def test_key_does_not_contain_secret(self, built):
+        cheval._get_cached_adapter("openai", BATCH_CONFIG)
+        assert "sk-test" not in repr(list(cheval._ADAPTER_CACHE))
+
+    def test_daemon_warms_adapters_for_workers(self, built, monkeypatch):
+        monkeypatch.setattr(cheval, "load_config", lambda: (BATCH_CONFIG, {}))
+        cheval._warm_daemon_caches()
+        assert len(built) == 1
+        cheval._get_cached_adapter("openai", BATCH_CONFIG)
+        assert len(built) == 1
+
+    def test_daemon_warm_tolerates_config_error(self, built, monkeypatch):
+        def _load_config():
+            raise cheval.ConfigError("bad config")
+
+        monkeypatch.setattr(cheval, "load_config", _load_config)
+        cheval._warm_daemon_caches()
+        assert built == []
+
+
+class TestBuildProviderConfig:
+    def test_reused_for_same_config_object(self):
+        first = cheval._build_provider_config("openai", BATCH_CONFIG)
+        assert cheval._build_provider_config("openai", BATCH_CONFIG) is first
+
+    def test_rebuilt_for_new_config_object(self):
+        first = cheval._build_provider_config("openai", BATCH_CONFIG)
+        copy = {**BATCH_CONFIG, "feature_flags": {"thinking_traces": False}}
+        assert cheval._build_provider_config("openai", copy) is not first
+
+    def test_interleaved_configs_both_cached(self):
+        other = {**BATCH_CONFIG}
+        first = cheval._build_provider_config("openai", BATCH_CONFIG)
+        second = cheval._build_provider_config("openai", other)
+        assert cheval._build_provider_config("openai", BATCH_CONFIG) is first
+        assert cheval._build_provider_config("openai", other) is second
+
+    def test_cache_is_bounded(self, monkeypatch):
+        cheval._clear_provider_config_cache()
+        monkeypatch.setattr(cheval, "_PROVIDER_CONFIGS_MAXSIZE", 2)
+        configs = [{**BATCH_CONFIG} for _ in range(3)]
+        for config in configs:
+            cheval._build_provider_config("openai", config)
+        assert len(cheval._PROVIDER_CONFIGS) == 2
+
+    def test_model_config_is_immutable(self):
+        model = cheval._build_provider_config("openai", BATCH_CONFIG).models["gpt-5.2"]
+        with pytest.raises(AttributeError):
+            model.context_window = 1
+
+
+class TestFastParseArgs:
+    @pytest.mark.parametrize("argv", [
+        [],
+        ["--agent", "reviewing-code", "--input", "f.md", "--model", "opus", "--max-tokens", "100", "--output-format", "json"],
+        ["--agent=reviewing-code", "--prompt=hi", "--dry-run", "--include-thinking"],
+        ["--batch", "--concurrency", "4", "--json-errors"],
+        ["--agent", "x", "--poll", "int-1", "--async"],
+    ])
+    def test_matches_argparse(self, argv):
+        assert cheval._fast_parse_args(argv) == cheval._build_parser().parse_args(argv)
+
+    @pytest.mark.parametrize("argv", [
+        ["--help"],
+        ["--ag", "x"],
+        ["--agent"],
+        ["--max-tokens", "many"],
+        ["--output-format", "yaml"],
+        ["--prompt", "-x"],
+        ["positional"],
+    ])
+    def test_falls_back_to_argparse(self, argv):
+        assert cheval._fast_parse_args(argv) is None
+
+    def test_covers_every_parser_option(self):
+        parser_dests = set(vars(cheval._build_parser().parse_args([])))
+        assert parser_dests == set(cheval._FAST_DEFAULTS)
+
+    def test_parser_built_once(self):
+        assert cheval._get_parser() is cheval._get_parser()
+        assert cheval._get_parser().parse_args(["--agent", "x"]).agent == "x"
+
+
+class TestReadsStdin:
+    """Daemon clients forward stdin only for commands that read it in-process."""
+
+    @pytest.mark.parametrize("argv", [
+        ["--agent", "x"],
+        ["--agent", "x", "--async"],
+        ["--batch"],
+    ])
+    def test_reads(self, argv):
+        assert cheval._reads_stdin(cheval._fast_parse_args(argv)) is True
+
+    @pytest.mark.parametrize("argv", [
+        ["--agent", "x", "--dry-run"],
+        ["--agent", "x", "--prompt", "hi"],
+        ["--agent", "x", "--input", "f.md"],
+        ["--batch", "--input", "jobs.ndjson"],
+        ["--validate-bindings"],
+        ["--print-effective-config"],
+        ["--poll", "int-1"],
+        ["--cancel", "int-1"],
+        ["--serve"],
+        [],
+    ])
+    def test_does_not_read(self, argv):
+        assert cheval._reads_stdin(cheval._fast_parse_args(argv)) is False
+
+
+class TestServeRequest:
+    def test_runs_with_client_env_and_cwd(self, monkeypatch, tmp_path):
+        monkeypatch.setattr(cheval, "load_config", lambda cli_args=None, only=None: (BATCH_CONFIG, {}))
+        before_env, before_cwd = dict(os.environ), os.getcwd()
+        response = cheval._serve_request({
+            "argv": ["--agent", "reviewing-code", "--dry-run"],
+            "env": {"LOA_CLIENT": "1"},
+            "cwd": str(tmp_path),
+            "stdin": None,
+        })
+        assert response["exit"] == 0
+        assert json.loads(response["stdout"])["resolved_model"] == "gpt-5.2"
+        assert dict(os.environ) == before_env
+        assert os.getcwd() == before_cwd
+
+    def test_errors_captured(self, monkeypatch, tmp_path):
+        monkeypatch.setattr(cheval, "load_config", lambda cli_args=None, only=None: (BATCH_CONFIG, {}))
+        response = cheval._serve_request({"argv": ["--agent", "reviewing-code"], "env": {}, "cwd": str(tmp_path), "stdin": ""})
+        assert response["exit"] == 2
+        assert json.loads(response["stderr"].splitlines()[-1])["code"] == "INVALID_INPUT"
+
+    def test_usage_error_does_not_exit_daemon(self, tmp_path):
+        response = cheval._serve_request({"argv": ["--max-tokens"], "env": {}, "cwd": str(tmp_path)})
+        assert response["exit"] == 2
+        assert "usage:" in response["stderr"]
+
+    def test_serve_not_forwardable(self, tmp_path):
+        response = cheval._serve_request({"argv": ["--serve"], "env": {}, "cwd": str(tmp_path)})
+        assert response["exit"] == 2
+
+
+class TestFeatureFlags:
+    def test_defaults_when_unset(self):
+        flags = cheval.FeatureFlags.from_config({})
+        assert flags.google_adapter and flags.deep_research and flags.thinking_traces and flags.metering
+        assert flags.context_filtering is False
+
+    def test_values_from_config(self):
+        flags = cheval.FeatureFlags.from_config({"feature_flags": {"metering": False, "context_filtering": "audit"}})
+        assert flags.metering is False
+        assert flags.context_filtering == "audit"
+
+    def test_check_flags_blocks_disabled_provider(self):
+        flags = cheval.FeatureFlags(google_adapter=False)
+        assert "Google adapter is disabled" in cheval._check_flags(flags, "google", "gemini-2.5-pro")
+        assert cheval._check_flags(flags, "openai", "gpt-5.2") is None
+
+    def test_resolved_flags_reused_for_same_config(self):
+        hounfour = {"feature_flags": {"metering": False}}
+        flags = cheval._feature_flags(hounfour)
+        assert cheval._feature_flags(hounfour) is flags
+        assert cheval._feature_flags({"feature_flags": {"metering": True}}).metering is True
+        assert cheval._feature_flags({}) == cheval.FeatureFlags()
+
+
+class TestHounfourView:
+    def test_unwrapped_config_returned_as_is(self):
+        assert cheval._hounfour_view(BATCH_CONFIG) is BATCH_CONFIG
+
+    def test_wrapped_config_unwrapped(self):
+        assert cheval._hounfour_view({"hounfour": BATCH_CONFIG}) is BATCH_CONFIG
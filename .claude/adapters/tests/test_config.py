@@ -12,10 +12,16 @@ import pytest
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
 from loa_cheval.config.loader import (
+    _annotate_keys,
     _deep_merge,
+    _deep_merge_inplace,
+    _find_project_root,
     _flatten_keys,
     apply_cli_overrides,
     clear_config_cache,
+    get_effective_config_display,
+    get_config,
+    get_effective_config_entries,
     load_env_overrides,
     load_config,
 )
@@ -29,6 +35,7 @@ from loa_cheval.config.interpolation import (
     REDACTED,
     _DEFAULT_LAZY_PATHS,
 )
+from loa_cheval.config import interpolation, loader
 from loa_cheval.types import ConfigError
 
 
@@ -57,6 +64,44 @@ class TestDeepMerge:
         _deep_merge(base, overlay)
         assert base == {"a": {"x": 1}}
 
+    def test_result_shares_no_containers(self):
+        base = {"a": {"x": [1, {"deep": True}]}, "b": ["keep"]}
+        overlay = {"c": {"list": [2]}}
+        result = _deep_merge(base, overlay)
+        result["a"]["x"][1]["deep"] = False
+        result["b"].append("more")
+        result["c"]["list"].append(3)
+        assert base == {"a": {"x": [1, {"deep": True}]}, "b": ["keep"]}
+        assert overlay == {"c": {"list": [2]}}
+
+    def test_deeper_than_recursion_limit(self):
+        deep = leaf = {}
+        for _ in range(sys.getrecursionlimit() + 100):
+            leaf["n"] = {}
+            leaf = leaf["n"]
+        leaf["list"] = [{"x": 1}, [2]]
+
+        def _leaf(d):
+            while "n" in d:
+                d = d["n"]
+            return d
+
+        merged = _deep_merge({}, {"root": deep})["root"]
+        assert _leaf(merged) == {"list": [{"x": 1}, [2]]} and _leaf(merged) is not leaf
+        assert _leaf(interpolate_config(deep, "/tmp")) == {"list": [{"x": 1}, [2]]}
+
+    def test_key_order_preserved(self):
+        result = _deep_merge({"a": 1, "b": 2, "c": 3}, {"d": 4, "b": 5})
+        assert list(result) == ["a", "b", "c", "d"]
+
+    def test_inplace_matches_pure_merge(self):
+        base = {"a": {"x": 1, "y": {"p": 1}}, "b": [1], "c": 3}
+        overlay = {"a": {"y": {"q": 2}, "z": 4}, "b": "replaced", "d": {"n": 5}}
+        expected = _deep_merge(base, overlay)
+        _deep_merge_inplace(base, overlay)
+        assert base == expected
+        assert list(base) == list(expected) and list(base["a"]) == list(expected["a"])
+
 
 class TestFlattenKeys:
     def test_flat_dict(self):
@@ -67,6 +112,28 @@ class TestFlattenKeys:
         keys = _flatten_keys({"a": {"x": 1, "y": 2}})
         assert set(keys) == {"a", "a.x", "a.y"}
 
+    def test_annotate_matches_flatten(self):
+        d = {"a": {"x": 1, "y": {"z": 2}}, "b": 3}
+        sources = {"a.x": "older"}
+        _annotate_keys(d, sources, "project_config")
+        assert sources == {key: "project_config" for key in _flatten_keys(d)}
+
+
+class TestFindProjectRoot:
+    def test_walks_up_to_claude_dir(self, tmp_path, monkeypatch):
+        (tmp_path / ".claude").mkdir()
+        nested = tmp_path / "a" / "b"
+        nested.mkdir(parents=True)
+        monkeypatch.chdir(nested)
+        assert _find_project_root() == str(tmp_path)
+
+    def test_nearest_config_file_wins(self, tmp_path, monkeypatch):
+        (tmp_path / ".claude").mkdir()
+        (tmp_path / "sub").mkdir()
+        (tmp_path / "sub" / ".loa.config.yaml").write_text("hounfour: {}\n")
+        monkeypatch.chdir(tmp_path / "sub")
+        assert _find_project_root() == str(tmp_path / "sub")
+
 
 class TestEnvOverrides:
     def test_no_env_set(self):
@@ -129,6 +196,12 @@ class TestInterpolation:
             result = interpolate_value("{env:OPENAI_API_KEY}", "/tmp")
             assert result == "sk-test123"
 
+    def test_mixed_and_adjacent_tokens(self):
+        env = {"LOA_A": "one", "LOA_B": "two"}
+        with patch.dict(os.environ, env):
+            assert interpolate_value("Bearer {env:LOA_A}", "/tmp") == "Bearer one"
+            assert interpolate_value("{env:LOA_A}{env:LOA_B}", "/tmp") == "onetwo"
+
     def test_env_not_set(self):
         with patch.dict(os.environ, {}, clear=True):
             with pytest.raises(ConfigError, match="not set"):
@@ -158,6 +231,59 @@ class TestInterpolation:
                     allowed_file_dirs=[tmpdir],
                 )
 
+    def test_file_missing_or_directory_not_found(self, tmp_path):
+        config_d = tmp_path / ".loa.config.d"
+        (config_d / "subdir").mkdir(parents=True)
+        for name in ("absent", "subdir"):
+            with pytest.raises(ConfigError, match="not found"):
+                interpolate_value(f"{{file:.loa.config.d/{name}}}", str(tmp_path))
+
+    def test_allowed_dirs_resolved_once_per_config(self, tmp_path):
+        config_d = tmp_path / ".loa.config.d"
+        config_d.mkdir()
+        secret = config_d / "token"
+        secret.write_text("s3cret\n")
+        os.chmod(str(secret), 0o600)
+        config = {"a": "{file:.loa.config.d/token}", "b": {"c": ["{file:.loa.config.d/token}"]}}
+
+        with patch(
+            "loa_cheval.config.interpolation._resolve_allowed_dirs",
+            wraps=interpolation._resolve_allowed_dirs,
+        ) as resolve:
+            result = interpolate_config(config, str(tmp_path), lazy_paths=set())
+        assert result == {"a": "s3cret", "b": {"c": ["s3cret"]}}
+        assert resolve.call_count == 1
+
+    def test_shared_secret_file_read_once_per_config(self, tmp_path):
+        config_d = tmp_path / ".loa.config.d"
+        config_d.mkdir()
+        secret = config_d / "token"
+        secret.write_text("s3cret")
+        os.chmod(str(secret), 0o600)
+        config = {"providers": {name: {"key": "{file:.loa.config.d/token}"} for name in ("a", "b", "c")}}
+
+        with patch(
+            "loa_cheval.config.interpolation._check_file_allowed",
+            wraps=interpolation._check_file_allowed,
+        ) as check:
+            result = interpolate_config(config, str(tmp_path), lazy_paths=set())
+        assert all(p["key"] == "s3cret" for p in result["providers"].values())
+        assert check.call_count == 1
+
+    def test_file_owned_by_other_user_rejected(self, tmp_path):
+        config_d = tmp_path / ".loa.config.d"
+        config_d.mkdir()
+        secret = config_d / "token"
+        secret.write_text("s3cret")
+        os.chmod(str(secret), 0o600)
+        interpolation._reset_uid_cache()
+        try:
+            with patch("os.getuid", return_value=os.getuid() + 1):
+                with pytest.raises(ConfigError, match="not owned"):
+                    interpolate_value("{file:.loa.config.d/token}", str(tmp_path))
+        finally:
+            interpolation._reset_uid_cache()
+
 
 class TestRedaction:
     def test_auth_key_redacted(self):
@@ -183,6 +309,30 @@ class TestRedaction:
         assert "OPENAI_API_KEY" in result["auth"]
 
 
+class TestEffectiveConfigDisplay:
+    CONFIG = {
+        "providers": {"openai": {"auth": "sk-key", "endpoint": "https://api.openai.com/v1"}},
+        "aliases": {"reviewer": "openai:gpt-5.2"},
+        "retries": [1, 2],
+    }
+    SOURCES = {"providers.openai.endpoint": "system_defaults", "aliases.reviewer": "project_config"}
+
+    def test_entries_flattened_with_sources(self):
+        entries = get_effective_config_entries(self.CONFIG, self.SOURCES)
+        assert entries["providers.openai.endpoint"] == {"value": "https://api.openai.com/v1", "source": "system_defaults"}
+        assert entries["aliases.reviewer"]["source"] == "project_config"
+        assert entries["retries"] == {"value": [1, 2], "source": ""}
+
+    def test_entries_redacted(self):
+        entries = get_effective_config_entries(self.CONFIG, self.SOURCES)
+        assert entries["providers.openai.auth"]["value"] == REDACTED
+
+    def test_text_display_redacted(self):
+        display = get_effective_config_display(self.CONFIG, self.SOURCES)
+        assert "sk-key" not in display
+        assert "reviewer: openai:gpt-5.2  # from project_config" in display
+
+
 # === LazyValue Tests (v1.35.0, FR-1) ===
 
 
@@ -237,6 +387,11 @@ class TestLazyValue:
         lazy2 = LazyValue("{env:OPENAI_API_KEY}", "/tmp")
         assert hash(lazy1) == hash(lazy2)
 
+    def test_eq_self_does_not_resolve(self):
+        with patch.dict(os.environ, {}, clear=True):
+            lazy = LazyValue("{env:OPENAI_API_KEY}", "/tmp")
+            assert lazy == lazy
+
     def test_missing_env_error_with_context(self):
         with patch.dict(os.environ, {}, clear=True):
             lazy = LazyValue(
@@ -273,6 +428,12 @@ class TestLazyPathMatching:
     def test_empty_lazy_paths(self):
         assert _matches_lazy_path("providers.openai.auth", set()) is False
 
+    def test_multiple_patterns(self):
+        patterns = {"providers.*.auth", "secrets.?ey"}
+        assert _matches_lazy_path("secrets.key", patterns) is True
+        assert _matches_lazy_path("providers.openai.auth", patterns) is True
+        assert _matches_lazy_path("providers.openai.auth.extra", patterns) is False
+
 
 class TestLazyInterpolation:
     def test_auth_fields_become_lazy(self):
@@ -404,3 +565,161 @@ class TestLazyRedaction:
         result = redact_config_value("auth", lazy)
         assert REDACTED in result
         assert "lazy" in result
+
+
+class TestLoadConfigCache:
+    @pytest.fixture
+    def project(self, tmp_path, monkeypatch):
+        clear_config_cache()
+        monkeypatch.setenv("CHEVAL_CACHE_DIR", str(tmp_path / "cache"))
+        root = tmp_path / "project"
+        root.mkdir()
+        (root / ".loa.config.yaml").write_text(
+            "hounfour:\n  defaults:\n    label: '{env:LOA_LABEL}'\n"
+        )
+        yield root
+        clear_config_cache()
+
+    def test_unchanged_files_not_reparsed(self, project):
+        with patch.dict(os.environ, {"LOA_LABEL": "one"}):
+            load_config(str(project))
+            with patch("loa_cheval.config.loader._load_yaml", side_effect=AssertionError("re-parsed")):
+                config, sources = load_config(str(project))
+        assert config["defaults"]["label"] == "one"
+        assert sources["defaults.label"] == "project_config"
+
+    def test_modified_file_reloaded(self, project):
+        with patch.dict(os.environ, {"LOA_LABEL": "one"}):
+            load_config(str(project))
+            (project / ".loa.config.yaml").write_text("hounfour:\n  defaults:\n    label: changed-value\n")
+            config, _ = load_config(str(project))
+        assert config["defaults"]["label"] == "changed-value"
+
+    @pytest.mark.parametrize("replace", [False, True])
+    def test_same_size_edit_with_restored_mtime_reloaded(self, project, replace):
+        path = project / ".loa.config.yaml"
+        path.write_text("hounfour:\n  defaults:\n    label: aaaa\n")
+        load_config(str(project))
+        mtime_ns = path.stat().st_mtime_ns
+        if replace:  # cp -p / tar: new file, old mtime
+            tmp = project / "new.yaml"
+            tmp.write_text("hounfour:\n  defaults:\n    label: bbbb\n")
+            os.replace(tmp, path)
+        else:
+            path.write_text("hounfour:\n  defaults:\n    label: bbbb\n")
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+        clear_config_cache()  # a fresh process would consult the sidecar
+        config, _ = load_config(str(project))
+        assert config["defaults"]["label"] == "bbbb"
+
+    def test_env_reinterpolated_on_cache_hit(self, project):
+        with patch.dict(os.environ, {"LOA_LABEL": "one"}):
+            load_config(str(project))
+        with patch.dict(os.environ, {"LOA_LABEL": "two"}):
+            config, _ = load_config(str(project))
+        assert config["defaults"]["label"] == "two"
+
+    def test_cli_overrides_do_not_leak_into_cache(self, project):
+        with patch.dict(os.environ, {"LOA_LABEL": "one"}):
+            config, _ = load_config(str(project), cli_args={"model": "openai:gpt-5.2"})
+            assert config["cli_model_override"] == "openai:gpt-5.2"
+            config, sources = load_config(str(project))
+        assert "cli_model_override" not in config
+        assert "cli_model" not in sources
+
+    def test_sidecar_skips_yaml_in_fresh_process(self, project, tmp_path):
+        with patch.dict(os.environ, {"LOA_LABEL": "one"}):
+            load_config(str(project))
+            assert len(list((tmp_path / "cache").glob("config.*.json"))) == 1
+            clear_config_cache()  # simulate a new process
+            with patch("loa_cheval.config.loader._load_yaml", side_effect=AssertionError("re-parsed")):
+                config, sources = load_config(str(project))
+        assert config["defaults"]["label"] == "one"
+        assert sources["defaults.label"] == "project_config"
+
+    def test_sidecar_sources_share_layer_strings(self, project):
+        with patch.dict(os.environ, {"LOA_LABEL": "one"}):
+            load_config(str(project))
+            clear_config_cache()  # simulate a new process
+            _, sources = load_config(str(project))
+        assert sources["defaults.label"] is loader._LAYER_PROJECT
+
+    def test_sidecar_holds_templates_not_secrets(self, project, tmp_path):
+        with patch.dict(os.environ, {"LOA_LABEL": "resolved-secret"}):
+            load_config(str(project))
+        (sidecar,) = (tmp_path / "cache").glob("config.*.json")
+        text = sidecar.read_text()
+        assert "{env:LOA_LABEL}" in text
+        assert "resolved-secret" not in text
+
+    def test_sidecar_disabled(self, project, tmp_path, monkeypatch):
+        monkeypatch.setenv("CHEVAL_CACHE_DISABLE", "1")
+        with patch.dict(os.environ, {"LOA_LABEL": "one"}):
+            load_config(str(project))
+        assert not (tmp_path / "cache").exists()
+
+    def test_sidecar_skipped_for_non_json_values(self, project, tmp_path):
+        (project / ".loa.config.yaml").write_text("hounfour:\n  released: 2026-02-10\n")
+        load_config(str(project))
+        assert not list((tmp_path / "cache").glob("config.*.json"))
+
+    def test_only_limits_sections(self, project):
+        with patch.dict(os.environ, {"LOA_LABEL": "one"}):
+            config, _ = load_config(str(project), only={"defaults"})
+            assert config["defaults"]["label"] == "one"
+            assert "providers" not in config
+            config, _ = load_config(str(project), cli_args={"model": "openai:gpt-5.2"}, only={"aliases"})
+        assert "defaults" not in config
+        assert config["cli_model_override"] == "openai:gpt-5.2"
+
+    def test_get_config_reuses_result_until_inputs_change(self, project):
+        with patch.dict(os.environ, {"LOA_LABEL": "one"}):
+            first = get_config(str(project))
+            assert get_config(str(project)) is first
+            assert get_config(str(project), cli_args={"model": "opus"}) is not first
+            with patch.dict(os.environ, {"LOA_MODEL": "opus"}):
+                assert get_config(str(project))["env_model_override"] == "opus"
+            assert get_config(str(project), force_reload=True) is not first
+            (project / ".loa.config.yaml").write_text("hounfour:\n  defaults:\n    label: edited-file\n")
+            assert get_config(str(project))["defaults"]["label"] == "edited-file"
+
+    def test_secret_env_allowlist_applied(self, project):
+        (project / ".loa.config.yaml").write_text(
+            "hounfour:\n  secret_env_allowlist: ['^CUSTOM_']\n  defaults:\n    label: '{env:CUSTOM_LABEL}'\n"
+        )
+        with patch.dict(os.environ, {"CUSTOM_LABEL": "custom"}):
+            config, _ = load_config(str(project))
+            assert config["defaults"]["label"] == "custom"
+            assert load_config(str(project))[0]["defaults"]["label"] == "custom"
+
+    def test_invalid_secret_env_allowlist_rejected(self, project):
+        (project / ".loa.config.yaml").write_text("hounfour:\n  secret_env_allowlist: ['(']\n")
+        with pytest.raises(ConfigError, match="secret_env_allowlist"):
+            load_config(str(project))
+
+    def test_resolved_values_redacted_in_display(self, project):
+        (project / ".loa.config.yaml").write_text(
+            "hounfour:\n  defaults:\n    label: '{env:LOA_LABEL}'\n    tags: ['{env:LOA_LABEL}', plain]\n"
+        )
+        with patch.dict(os.environ, {"LOA_LABEL": "resolved-secret"}):
+            config, sources = load_config(str(project))
+        assert config["defaults"]["label"] == "resolved-secret"
+        entries = get_effective_config_entries(config, sources)
+        assert entries["defaults.label"]["value"] == f"{REDACTED} (from env:LOA_LABEL)"
+        assert entries["defaults.tags"]["value"] == [f"{REDACTED} (from env:LOA_LABEL)", "plain"]
+        assert "resolved-secret" not in get_effective_config_display(config, sources)
+
+    def test_interpolated_values_survive_copy_and_pickle(self):
+        import copy
+        import pickle
+
+        with patch.dict(os.environ, {"LOA_LABEL": "resolved-secret"}):
+            config = interpolate_config({"a": "{env:LOA_LABEL}", "b": ["{env:LOA_LABEL}"]}, "/tmp")
+        clones = [copy.copy(config), copy.deepcopy(config)]
+        clones += [pickle.loads(pickle.dumps(config, protocol)) for protocol in range(pickle.HIGHEST_PROTOCOL + 1)]
+        for clone in clones:
+            assert clone == {"a": "resolved-secret", "b": ["resolved-secret"]}
+            assert redact_config(clone) == {
+                "a": f"{REDACTED} (from env:LOA_LABEL)",
+                "b": [f"{REDACTED} (from env:LOA_LABEL)"],
+            }
@@ -18,6 +18,7 @@ from loa_cheval.credentials.providers import (
     CredentialProvider,
     DotenvProvider,
     EnvProvider,
+    clear_provider_cache,
     get_credential_provider,
 )
 from loa_cheval.credentials.health import (
@@ -106,6 +107,13 @@ class TestDotenvProvider:
         p = DotenvProvider(str(tmp_path))
         assert "dotenv" in p.name()
 
+    def test_unusual_lines(self, tmp_path):
+        (tmp_path / ".env.local").write_text(
+            "A = spaced\nB==x\n1BAD=no\nKÉY=no\nNOEQUALS\n=empty\n_U_1=' padded '\n"
+        )
+        p = DotenvProvider(str(tmp_path))
+        assert p._load() == {"A": "spaced", "B": "=x", "_U_1": " padded "}
+
 
 # === CompositeProvider Tests ===
 
@@ -137,6 +145,18 @@ class TestCompositeProvider:
             ])
             assert composite.get("NONEXISTENT") is None
 
+    def test_get_many_matches_get_and_loads_dotenv_once(self, tmp_path):
+        (tmp_path / ".env.local").write_text("OPENAI_API_KEY=sk-dotenv\nANTHROPIC_API_KEY=sk-ant-dotenv\n")
+        dotenv = DotenvProvider(str(tmp_path))
+        ids = ["OPENAI_API_KEY", "ANTHROPIC_API_KEY", "NONEXISTENT"]
+        with patch.dict(os.environ, {"OPENAI_API_KEY": "sk-env"}, clear=True):
+            composite = CompositeProvider([EnvProvider(), dotenv])
+            with patch.object(dotenv, "_load", wraps=dotenv._load) as load:
+                found = composite.get_many(ids)
+            assert load.call_count == 1
+            assert found == {cid: composite.get(cid) for cid in ids}
+            assert found == {"OPENAI_API_KEY": "sk-env", "ANTHROPIC_API_KEY": "sk-ant-dotenv", "NONEXISTENT": None}
+
     def test_providers_property(self):
         providers = [EnvProvider(), EnvProvider()]
         composite = CompositeProvider(providers)
@@ -197,6 +217,11 @@ class TestEncryptedStore:
         store = self._make_store(store_dir)
         assert store.delete("NOPE") is False
 
+    def test_get_many(self, store_dir):
+        store = self._make_store(store_dir)
+        store.set("KEY_A", "a")
+        assert store.get_many(["KEY_A", "KEY_B"]) == {"KEY_A": "a", "KEY_B": None}
+
     def test_list_keys(self, store_dir):
         store = self._make_store(store_dir)
         store.set("KEY_A", "a")
@@ -217,6 +242,14 @@ class TestEncryptedStore:
         mode = stat.S_IMODE(enc_file.stat().st_mode)
         assert mode == 0o600
 
+    def test_loosened_store_mode_restored_on_save(self, store_dir):
+        store = self._make_store(store_dir)
+        store.set("KEY", "val")
+        enc_file = store_dir / "store.json.enc"
+        os.chmod(str(enc_file), 0o644)
+        store.set("KEY", "val2")
+        assert stat.S_IMODE(enc_file.stat().st_mode) == 0o600
+
     def test_key_file_permissions(self, store_dir):
         store = self._make_store(store_dir)
         store.set("KEY", "val")
@@ -224,6 +257,11 @@ class TestEncryptedStore:
         mode = stat.S_IMODE(key_file.stat().st_mode)
         assert mode == 0o600
 
+    def test_roundtrip_through_fresh_instance(self, store_dir):
+        store = self._make_store(store_dir)
+        store.set("KEY", "välue with spaces")
+        assert self._make_store(store_dir).get("KEY") == "välue with spaces"
+
     def test_corrupted_store_recovery(self, store_dir):
         store = self._make_store(store_dir)
         store.set("KEY", "val")
@@ -245,11 +283,63 @@ class TestEncryptedFileProvider:
         result = provider.get("OPENAI_API_KEY")
         assert result is None
 
+    def test_get_many_without_cryptography(self, tmp_path):
+        from loa_cheval.credentials.store import EncryptedFileProvider
+        provider = EncryptedFileProvider(tmp_path / "nonexistent")
+        with patch("loa_cheval.credentials.store._fernet_class", return_value=None):
+            (tmp_path / "nonexistent").mkdir()
+            (tmp_path / "nonexistent" / "store.json.enc").write_bytes(b"x")
+            assert provider.get_many(["A", "B"]) == {"A": None, "B": None}
+
     def test_name(self, tmp_path):
         from loa_cheval.credentials.store import EncryptedFileProvider
         provider = EncryptedFileProvider(tmp_path)
         assert "encrypted" in provider.name()
 
+    def test_fernet_shared_per_key_file(self, tmp_path):
+        from loa_cheval.credentials.store import EncryptedStore
+
+        class FakeFernet:
+            instances = 0
+
+            def __init__(self, key):
+                FakeFernet.instances += 1
+
+        (tmp_path / ".key").write_bytes(b"k1\n")
+        with patch("loa_cheval.credentials.store._fernet_class", return_value=FakeFernet):
+            first = EncryptedStore(tmp_path)._get_fernet()
+            assert EncryptedStore(tmp_path)._get_fernet() is first
+            (tmp_path / ".key").write_bytes(b"key2\n")  # new key: size changes
+            assert EncryptedStore(tmp_path)._get_fernet() is not first
+        assert FakeFernet.instances == 2
+
+    def test_sees_store_written_by_another_instance(self, tmp_path):
+        from loa_cheval.credentials.store import EncryptedFileProvider, EncryptedStore
+
+        class PlainFernet:
+            """Identity 'encryption' so the test runs without cryptography."""
+
+            def __init__(self, key):
+                pass
+
+            @staticmethod
+            def generate_key():
+                return b"k"
+
+            def encrypt(self, data):
+                return data
+
+            def decrypt(self, data):
+                return data
+
+        with patch("loa_cheval.credentials.store._fernet_class", return_value=PlainFernet):
+            reader = EncryptedFileProvider(tmp_path)
+            assert reader.get("OPENAI_API_KEY") is None  # no store file yet
+            EncryptedStore(tmp_path).set("OPENAI_API_KEY", "sk-first")
+            assert reader.get("OPENAI_API_KEY") == "sk-first"
+            EncryptedStore(tmp_path).set("OPENAI_API_KEY", "sk-second-value")
+            assert reader.get_many(["OPENAI_API_KEY"]) == {"OPENAI_API_KEY": "sk-second-value"}
+
 
 # === Factory Tests ===
 
@@ -269,6 +359,24 @@ class TestGetCredentialProvider:
         names = [p.name() for p in provider.providers]
         assert any("dotenv" in n for n in names)
 
+    def test_memoized_per_project_root(self, tmp_path):
+        other = tmp_path / "other"
+        other.mkdir()
+        first = get_credential_provider(str(tmp_path))
+        assert get_credential_provider(str(tmp_path)) is first
+        assert get_credential_provider(str(other)) is not first
+        clear_provider_cache()
+        assert get_credential_provider(str(tmp_path)) is not first
+
+    def test_memoized_chain_sees_dotenv_changes(self, tmp_path):
+        env_file = tmp_path / ".env.local"
+        env_file.write_text("LOA_TEST_KEY=first\n")
+        with patch.dict(os.environ, {}, clear=True):
+            assert get_credential_provider(str(tmp_path)).get("LOA_TEST_KEY") == "first"
+            env_file.write_text("LOA_TEST_KEY=second\n")
+            os.utime(env_file, ns=(0, env_file.stat().st_mtime_ns + 10**9))
+            assert get_credential_provider(str(tmp_path)).get("LOA_TEST_KEY") == "second"
+
 
 # === Health Check Tests ===
 
@@ -292,6 +400,81 @@ class TestHealthChecks:
             for r in results:
                 assert r.status == "missing"
 
+    def test_check_all_live_runs_concurrently_in_order(self):
+        import threading
+
+        ids = ["OPENAI_API_KEY", "MISSING_KEY", "ANTHROPIC_API_KEY", "MOONSHOT_API_KEY"]
+        barrier = threading.Barrier(3, timeout=5)
+
+        def fake_live(cred_id, value, timeout):
+            barrier.wait()  # only passes if all three checks are in flight together
+            return HealthResult(cred_id, "ok", value)
+
+        class FakeProvider(CredentialProvider):
+            def get(self, cred_id):
+                return None if cred_id == "MISSING_KEY" else f"v-{cred_id}"
+
+            def name(self):
+                return "fake"
+
+        provider = FakeProvider()
+        with patch("loa_cheval.credentials.health._check_live", side_effect=fake_live):
+            results = check_all(provider, ids, live=True)
+        assert [r.credential_id for r in results] == ids
+        assert [r.status for r in results] == ["ok", "missing", "ok", "ok"]
+
+    def test_live_check_request_shape(self):
+        opener = MagicMock()
+        opener.open.return_value.status = 400
+        with patch("urllib.request.build_opener", return_value=opener):
+            result = check_credential("ANTHROPIC_API_KEY", "sk-ant-y", live=True)
+        assert result.status == "ok"
+        req = opener.open.call_args.args[0]
+        assert (req.get_method(), req.full_url) == ("POST", HEALTH_CHECKS["ANTHROPIC_API_KEY"]["url"])
+        assert req.get_header("X-api-key") == "sk-ant-y"
+        assert req.get_header("Anthropic-version") == "2023-06-01"
+        assert req.data is HEALTH_CHECKS["ANTHROPIC_API_KEY"]["body"]
+        opener.open.return_value.close.assert_called_once()
+
+    def test_live_checks_share_one_opener(self):
+        opener = MagicMock()
+        opener.open.return_value.status = 200
+        with patch("urllib.request.build_opener", return_value=opener) as build:
+            check_credential("OPENAI_API_KEY", "sk-a", live=True)
+            check_credential("OPENAI_API_KEY", "sk-b", live=True)
+        build.assert_called_once()
+        assert opener.open.call_count == 2
+
+    def test_live_check_urllib_http_error(self):
+        import urllib.error
+
+        opener = MagicMock()
+        opener.open.side_effect = urllib.error.HTTPError("u", 401, "Unauthorized", {}, None)
+        with patch("urllib.request.build_opener", return_value=opener):
+            result = check_credential("OPENAI_API_KEY", "sk-bad", live=True)
+        assert result.status == "error"
+        assert "HTTP 401" in result.message
+
+    def test_format_checks(self):
+        valid = "sk-" + "a" * 48
+        assert check_credential("OPENAI_API_KEY", valid).status == "ok"
+        assert "expected prefix 'sk-'" in check_credential("OPENAI_API_KEY", "pk-" + "a" * 48).message
+        assert "minimum 48 chars" in check_credential("OPENAI_API_KEY", "sk-short").message
+        assert "invalid character" in check_credential("OPENAI_API_KEY", valid + "!").message
+        assert check_credential("MOONSHOT_API_KEY", "anything").status == "unknown/weak_validation"
+
+    def test_format_length_boundary(self):
+        assert check_credential("OPENAI_API_KEY", "sk-" + "a" * 45).status == "ok"  # exactly 48
+        assert check_credential("OPENAI_API_KEY", "sk-" + "a" * 44).status == "format_invalid"
+
+    def test_health_result_frozen_value(self):
+        import dataclasses
+
+        r = HealthResult("KEY", "ok", "msg")
+        assert r == HealthResult(credential_id="KEY", status="ok", message="msg")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            r.status = "error"
+
     def test_health_result_namedtuple(self):
         r = HealthResult("KEY", "ok", "msg")
         assert r.credential_id == "KEY"
@@ -0,0 +1,149 @@
+"""Tests for the cheval daemon socket transport."""
+
+import errno
+import io
+import json
+import os
+import socket
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+# Add adapters dir to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from loa_cheval.daemon import MAX_FRAME_BYTES, _HEADER, forward, recv_frame, send_frame, serve, socket_path
+
+
+@pytest.fixture
+def sock_path(tmp_path):
+    # AF_UNIX paths are length-limited; keep it short
+    path = Path("/tmp") / f"cheval-test-{os.getpid()}-{tmp_path.name[-8:]}.sock"
+    yield str(path)
+    if path.exists():
+        path.unlink()
+
+
+def _start(handler, path):
+    thread = threading.Thread(target=serve, args=(handler, path), daemon=True)
+    thread.start()
+    for _ in range(200):
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        with probe:
+            if probe.connect_ex(path) == 0:
+                return
+        threading.Event().wait(0.01)
+    raise AssertionError("daemon did not start")
+
+
+class TestFrames:
+    def test_round_trip(self):
+        a, b = socket.socketpair()
+        with a, b:
+            send_frame(a, {"argv": ["--agent", "x"], "stdin": "ünïcode " * 1000})
+            assert recv_frame(b) == {"argv": ["--agent", "x"], "stdin": "ünïcode " * 1000}
+
+    def test_oversized_frame_rejected(self):
+        a, b = socket.socketpair()
+        with a, b:
+            a.sendall(_HEADER.pack(MAX_FRAME_BYTES + 1))
+            with pytest.raises(ValueError, match="too large"):
+                recv_frame(b)
+
+    def test_non_object_rejected(self):
+        a, b = socket.socketpair()
+        with a, b:
+            payload = json.dumps([1, 2]).encode()
+            a.sendall(_HEADER.pack(len(payload)) + payload)
+            with pytest.raises(ValueError):
+                recv_frame(b)
+
+
+class TestSocketPath:
+    def test_override(self, monkeypatch):
+        monkeypatch.setenv("CHEVAL_DAEMON_SOCKET", "/x/y.sock")
+        assert socket_path() == "/x/y.sock"
+
+    def test_runtime_dir(self, monkeypatch):
+        monkeypatch.delenv("CHEVAL_DAEMON_SOCKET", raising=False)
+        monkeypatch.setenv("XDG_RUNTIME_DIR", "/run/user/1")
+        assert socket_path() == "/run/user/1/cheval.sock"
+
+
+def _echo(request):
+    """Handler that returns the request it saw (workers are forked, so report via stdout)."""
+    return {"stdout": json.dumps(request), "stderr": "err\n", "exit": 7}
+
+
+def _piped(text):
+    return io.TextIOWrapper(io.BytesIO(text.encode("utf-8")), encoding="utf-8")
+
+
+class TestForward:
+    def test_no_daemon_returns_none(self, sock_path, monkeypatch):
+        monkeypatch.setattr(sys, "stdin", _piped("piped input"))
+        assert forward(["--agent", "x"], path=sock_path, read_stdin=True) is None
+        assert sys.stdin.read() == "piped input"
+
+    def test_round_trip_through_daemon(self, sock_path, monkeypatch, capsys):
+        _start(_echo, sock_path)
+        assert oct(os.stat(sock_path).st_mode & 0o777) == "0o600"
+        monkeypatch.setattr(sys, "stdin", _piped("piped input"))
+        assert forward(["--agent", "x"], path=sock_path, read_stdin=True) == 7
+        captured = capsys.readouterr()
+        seen = json.loads(captured.out)
+        assert captured.err == "err\n"
+        assert seen["argv"] == ["--agent", "x"]
+        assert seen["stdin"] == "piped input"
+        assert seen["cwd"] == os.getcwd()
+
+    def test_stdin_untouched_unless_read(self, sock_path, monkeypatch, capsys):
+        _start(_echo, sock_path)
+        monkeypatch.setattr(sys, "stdin", _piped("line1\nline2\n"))
+        assert forward(["--agent", "x", "--dry-run"], path=sock_path) == 7
+        assert json.loads(capsys.readouterr().out)["stdin"] is None
+        assert sys.stdin.read() == "line1\nline2\n"
+
+    def test_oversized_stdin_runs_in_process(self, sock_path, monkeypatch):
+        _start(_echo, sock_path)
+        monkeypatch.setattr(sys, "stdin", _piped("piped input"))
+        assert forward(["--agent", "x"], path=sock_path, read_stdin=True, max_stdin_bytes=4) is None
+        assert sys.stdin.read() == "piped input"
+
+
+class TestServe:
+    def test_concurrent_clients_overlap(self, sock_path, capsys):
+        def slow(request):
+            time.sleep(0.5)
+            return {"stdout": "", "stderr": "", "exit": 0}
+
+        _start(slow, sock_path)
+        codes = []
+        threads = [
+            threading.Thread(target=lambda: codes.append(forward(["--prompt", "x"], path=sock_path)))
+            for _ in range(3)
+        ]
+        started = time.monotonic()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert codes == [0, 0, 0]
+        assert time.monotonic() - started < 1.0
+
+    def test_second_serve_refused(self, sock_path, capsys):
+        _start(_echo, sock_path)
+        with pytest.raises(OSError) as exc_info:
+            serve(_echo, sock_path)
+        assert exc_info.value.errno == errno.EADDRINUSE
+        assert forward(["--prompt", "x"], path=sock_path) == 7
+
+    def test_stale_socket_replaced(self, sock_path, capsys):
+        stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        stale.bind(sock_path)
+        stale.close()
+        _start(_echo, sock_path)
+        assert forward(["--prompt", "x"], path=sock_path) == 7
@@ -23,7 +23,16 @@ import pytest
 
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
-from loa_cheval.metering.budget import ALLOW, BLOCK, DOWNGRADE, WARN, BudgetEnforcer
+from loa_cheval.metering.budget import (
+    ALLOW,
+    BLOCK,
+    DOWNGRADE,
+    WARN,
+    BudgetEnforcer,
+    MeteringConfig,
+    check_budget,
+    load_metering_config,
+)
 from loa_cheval.routing.chains import walk_fallback_chain
 from loa_cheval.routing.resolver import resolve_alias, resolve_execution
 from loa_cheval.types import (
@@ -367,3 +376,29 @@ class TestFlagPrecedence:
                 model="gpt-5.2",
             )
             assert enforcer.pre_call(request) == expected, f"Expected {expected} for on_exceeded={action}"
+
+    def test_exceeded_and_warn_thresholds_agree_across_checks(self, tmp_path):
+        """pre_call, pre_call_atomic and check_budget map spend the same way."""
+        from loa_cheval.metering.ledger import update_daily_spend
+
+        request = CompletionRequest(messages=[{"role": "user", "content": "test"}], model="gpt-5.2")
+        for action, spent, expected in [
+            ("block", 100, BLOCK), ("downgrade", 100, DOWNGRADE), ("bogus", 100, WARN),
+            ("block", 80, WARN), ("block", 79, ALLOW),
+        ]:
+            ledger = str(tmp_path / f"{action}-{spent}" / "ledger.jsonl")  # own daily-spend file
+            update_daily_spend(spent, ledger)
+            cfg = _config(metering={
+                "enabled": True,
+                "budget": {"daily_micro_usd": 100, "warn_at_percent": 80, "on_exceeded": action},
+            })
+            enforcer = BudgetEnforcer(cfg, ledger)
+            assert enforcer.pre_call(request) == expected
+            assert enforcer.pre_call_atomic(request) == expected
+            assert check_budget(cfg, ledger) == expected
+            assert check_budget(load_metering_config(cfg), ledger) == expected
+
+    def test_metering_config_defaults(self):
+        settings = load_metering_config({})
+        assert settings == MeteringConfig()
+        assert settings.warn_threshold == settings.daily_limit * settings.warn_pct // 100
@@ -338,6 +338,23 @@ class TestAdapterRegistry:
         adapter = get_adapter(config)
         assert isinstance(adapter, GoogleAdapter)
 
+    def test_get_adapter_unknown_type(self):
+        from loa_cheval.providers import get_adapter
+        from loa_cheval.types import ConfigError, ProviderConfig
+        config = ProviderConfig(name="x", type="carrier-pigeon", endpoint="", auth="")
+        with pytest.raises(ConfigError, match="Unknown provider type"):
+            get_adapter(config)
+
+    def test_adapter_modules_imported_lazily(self):
+        import subprocess
+        adapters_dir = str(Path(__file__).resolve().parent.parent)
+        code = (
+            "import sys; sys.path.insert(0, %r); import loa_cheval.providers; "
+            "print(any(m.endswith('_adapter') for m in sys.modules))" % adapters_dir
+        )
+        out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        assert out.stdout.strip() == "False"
+
 
 # ── Chain Validation ─────────────────────────────────────────────────────────
 
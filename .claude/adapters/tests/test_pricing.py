@@ -129,6 +129,16 @@ class TestCalculateTotalCost:
         breakdown = calculate_total_cost(0, 0, 0, self.OPENAI_PRICING)
         assert breakdown.total_cost_micro == 0
 
+    def test_remainders_match_calculate_cost_micro(self):
+        breakdown = calculate_total_cost(1_234_567, 7_654, 333, self.ANTHROPIC_PRICING)
+        assert (breakdown.input_cost_micro, breakdown.remainder_input) == calculate_cost_micro(1_234_567, 5_000_000)
+        assert (breakdown.output_cost_micro, breakdown.remainder_output) == calculate_cost_micro(7_654, 25_000_000)
+        assert (breakdown.reasoning_cost_micro, breakdown.remainder_reasoning) == calculate_cost_micro(333, 25_000_000)
+
+    def test_overflow_reports_offending_token_type(self):
+        with pytest.raises(ValueError, match=r"BUDGET_OVERFLOW: tokens\(10000000000\) \* price\(30000000\)"):
+            calculate_total_cost(10, 10_000_000_000, 0, self.OPENAI_PRICING)
+
 
 class TestRemainderAccumulator:
     """Remainder carry tests."""
@@ -246,6 +256,17 @@ class TestLedgerAppend:
         assert len(entries) == 2
         assert entries[0]["cost_micro_usd"] == 1000
 
+    def test_append_writes_one_compact_line_per_entry(self, tmp_path):
+        ledger = tmp_path / "test.jsonl"
+        entry = {"agent": "révieur", "cost_micro_usd": 7, "phase_id": None}
+
+        append_ledger(entry, str(ledger))
+
+        lines = ledger.read_bytes().split(b"\n")
+        assert lines[1:] == [b""]
+        assert b" " not in lines[0]
+        assert json.loads(lines[0]) == entry
+
     def test_read_empty_file(self, tmp_path):
         ledger = str(tmp_path / "empty.jsonl")
         with open(ledger, "w"):
@@ -267,6 +288,11 @@ class TestLedgerAppend:
         entries = read_ledger(ledger)
         assert len(entries) == 2
 
+    def test_read_mixed_line_endings_and_bad_bytes(self, tmp_path):
+        ledger = tmp_path / "mixed.jsonl"
+        ledger.write_bytes(b'{"a": 1}\r\n\n   \n\xff\xfe{"bad": 1}\n{"b": "\xc3\xa9"}\n{"c": 3}')
+        assert read_ledger(str(ledger)) == [{"a": 1}, {"b": "\u00e9"}, {"c": 3}]
+
 
 class TestCreateLedgerEntry:
     """Entry creation tests."""
@@ -372,6 +398,63 @@ class TestDailySpend:
         ledger = str(tmp_path / "nope.jsonl")
         assert read_daily_spend(ledger) == 0
 
+    def test_read_reuses_own_write_without_parsing(self, tmp_path):
+        from unittest.mock import patch
+
+        ledger = str(tmp_path / "test.jsonl")
+        update_daily_spend(50_000, ledger)
+        with patch("loa_cheval.metering.ledger.json.load") as load:
+            assert read_daily_spend(ledger) == 50_000
+            assert read_daily_spend(ledger) == 50_000
+        load.assert_not_called()
+
+    def test_read_sees_external_write(self, tmp_path):
+        from datetime import datetime, timezone
+
+        ledger = str(tmp_path / "test.jsonl")
+        update_daily_spend(50_000, ledger)
+        assert read_daily_spend(ledger) == 50_000
+
+        today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+        summary = tmp_path / f".daily-spend-{today}.json"
+        before = summary.stat().st_mtime_ns
+        summary.write_text(json.dumps({"date": today, "total_micro_usd": 7, "entry_count": 9}))
+        os.utime(summary, ns=(before + 10**9, before + 10**9))
+        assert read_daily_spend(ledger) == 7
+
+    def test_update_replaces_longer_corrupt_summary(self, tmp_path):
+        from datetime import datetime, timezone
+
+        ledger = str(tmp_path / "test.jsonl")
+        today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+        summary = tmp_path / f".daily-spend-{today}.json"
+        summary.write_text("{" + "x" * 500)
+        update_daily_spend(5, ledger)
+        assert json.loads(summary.read_text()) == {"total_micro_usd": 5, "entry_count": 1, "date": today}
+        assert read_daily_spend(ledger) == 5
+
+    def test_record_cost_creates_missing_directory(self, tmp_path):
+        ledger = str(tmp_path / "nested" / "dir" / "test.jsonl")
+        record_cost({"cost_micro_usd": 5}, ledger)
+        record_cost({"cost_micro_usd": 6}, ledger)
+        assert len(read_ledger(ledger)) == 2
+        assert read_daily_spend(ledger) == 11
+
+    def test_utc_date_and_timestamp_format(self):
+        from datetime import datetime, timezone
+        from unittest.mock import patch
+
+        from loa_cheval.metering import ledger as ledger_mod
+
+        instant = datetime(2026, 2, 10, 23, 59, 59, 987_654, tzinfo=timezone.utc)
+        ns = int(instant.timestamp()) * 10**9 + instant.microsecond * 1000
+        with patch.object(ledger_mod.time, "time_ns", return_value=ns), \
+                patch.object(ledger_mod.time, "time", return_value=ns / 1e9):
+            assert ledger_mod._utc_timestamp_ms() == "2026-02-10T23:59:59.987Z"
+            assert ledger_mod._utc_today() == "2026-02-10"
+        with patch.object(ledger_mod.time, "time", return_value=ns / 1e9 + 1):
+            assert ledger_mod._utc_today() == "2026-02-11"
+
     def test_record_cost_updates_both(self, tmp_path):
         ledger = str(tmp_path / "test.jsonl")
         entry = {"ts": "2026-02-10T12:00:00Z", "cost_micro_usd": 42_000}
@@ -284,6 +284,31 @@ class TestBudgetReservationReconcile:
         assert len(entries) == 1
         assert entries[0]["cost_micro_usd"] == 25_000
 
+    def test_post_call_looks_up_pricing_once(self, tmp_path):
+        config = {
+            "metering": {"enabled": True},
+            "providers": {"openai": {"models": {"gpt-5.2": {"pricing": {"input_per_mtok": 1_000_000}}}}},
+        }
+        ledger_path = str(tmp_path / "ledger.jsonl")
+        enforcer = BudgetEnforcer(config, ledger_path)
+
+        result = MagicMock()
+        result.provider = "openai"
+        result.model = "gpt-5.2"
+        result.latency_ms = 10
+        result.usage.input_tokens = 2_000
+        result.usage.output_tokens = 0
+        result.usage.reasoning_tokens = 0
+        result.usage.source = "actual"
+        result.interaction_id = None
+        result._agent = "reviewing-code"
+
+        with patch("loa_cheval.metering.budget.find_pricing", wraps=find_pricing) as lookup:
+            enforcer.post_call(result)
+            enforcer.post_call(result)
+        lookup.assert_called_once_with("openai", "gpt-5.2", config)
+        assert [e["cost_micro_usd"] for e in read_ledger(ledger_path)] == [2_000, 2_000]
+
 
 class TestBudgetDeduplication:
     """interaction_id dedupe (Flatline Beads SKP-002)."""
@@ -325,6 +350,33 @@ class TestBudgetDeduplication:
         entries = read_ledger(ledger_path)
         assert len(entries) == 1  # Only one entry
 
+    def test_dedupe_window_is_bounded(self, tmp_path):
+        config = {"metering": {"enabled": True}, "providers": {}}
+        ledger_path = str(tmp_path / "ledger.jsonl")
+        enforcer = BudgetEnforcer(config, ledger_path)
+
+        def post(interaction_id):
+            result = MagicMock()
+            result.provider = "google"
+            result.model = "deep-research-pro"
+            result.latency_ms = 1
+            result.usage.input_tokens = 0
+            result.usage.output_tokens = 0
+            result.usage.reasoning_tokens = 0
+            result.usage.source = "actual"
+            result.interaction_id = interaction_id
+            result._agent = "deep-researcher"
+            enforcer.post_call(result)
+
+        with patch("loa_cheval.metering.budget._SEEN_INTERACTIONS_MAXSIZE", 2):
+            post("dr-1")
+            post("dr-2")
+            post("dr-1")  # duplicate: skipped, and now most recent
+            post("dr-3")  # evicts dr-2
+            post("dr-1")
+            post("dr-2")
+        assert [e["interaction_id"] for e in read_ledger(ledger_path)] == ["dr-1", "dr-2", "dr-3", "dr-2"]
+
 
 # ── Rate Limiter Tests ───────────────────────────────────────────────────────
 
@@ -72,6 +72,33 @@ class TestRedactString:
             # Short values should NOT be redacted (false positive risk)
             assert "abc" in result
 
+    def test_headers_and_params_in_one_string(self):
+        result = redact_string(
+            "Authorization: Bearer sk-a x-api-key: sk-b GET /v1?token=t1&auth=t2&page=3"
+        )
+        assert result == (
+            f"Authorization: Bearer {REDACTED} x-api-key: {REDACTED} "
+            f"GET /v1?token={REDACTED}&auth={REDACTED}&page=3"
+        )
+
+    def test_field_patterns_match_any_case(self):
+        assert redact_string("AUTHORIZATION: bearer sk-x") == f"AUTHORIZATION: bearer {REDACTED}"
+        assert redact_string("/v1?API-KEY=k1&Secret=s1") == f"/v1?API-KEY={REDACTED}&Secret={REDACTED}"
+
+    def test_text_without_fields_unchanged(self):
+        text = "Traceback (most recent call last):\n  ValueError: bad request"
+        assert redact_string(text) == text
+
+    def test_longer_secret_containing_shorter_redacted_whole(self):
+        with patch.dict(os.environ, {"OPENAI_API_KEY": "sk-abc", "LOA_TOKEN": "sk-abc-extended"}):
+            assert redact_string("sk-abc-extended") == REDACTED
+
+    def test_rotated_key_redacted(self):
+        with patch.dict(os.environ, {"OPENAI_API_KEY": "sk-first-value"}):
+            redact_string("warm")
+        with patch.dict(os.environ, {"OPENAI_API_KEY": "sk-second-value"}):
+            assert redact_string("sk-first-value sk-second-value") == f"sk-first-value {REDACTED}"
+
 
 class TestRedactException:
     def test_exception_message_redacted(self):
@@ -113,6 +140,10 @@ class TestRedactHeaders:
         result = redact_headers(headers)
         assert result["x-custom-token"] == REDACTED
 
+    def test_sensitive_match_ignores_case(self):
+        headers = {"X-SESSION-TOKEN": "t", "Proxy-Authorization": "p", "Accept": "*/*"}
+        assert redact_headers(headers) == {"X-SESSION-TOKEN": REDACTED, "Proxy-Authorization": REDACTED, "Accept": "*/*"}
+
 
 class TestRedactConfigValue:
     def test_auth_key_redacted(self):
@@ -140,6 +171,11 @@ class TestRedactConfigValue:
         result = redact_config_value("endpoint", "https://api.openai.com/v1")
         assert result == "https://api.openai.com/v1"
 
+    def test_scalar_leaves_preserved(self):
+        value = {"max_tokens": 4096, "temperature": 0.2, "stream": True, "key": None, "auth": "sk-key"}
+        result = redact_config_value("model", value)
+        assert result == {"max_tokens": 4096, "temperature": 0.2, "stream": True, "key": None, "auth": REDACTED}
+
 
 class TestConfigureHttpLogging:
     def test_sets_warning_level(self):
@@ -181,6 +181,19 @@ class TestValidateBindings:
         errors = validate_bindings(config)
         assert any("nonexistent-model" in e for e in errors)
 
+    def test_shared_bad_alias_reported_per_agent(self):
+        config = {
+            **SAMPLE_CONFIG,
+            "agents": {
+                "a": {"model": "undefined-alias"},
+                "b": {"model": "undefined-alias"},
+                "c": {"model": "reviewer", "requires": {"thinking_traces": True}},
+            },
+        }
+        errors = validate_bindings(config)
+        assert sum("Unknown alias" in e for e in errors) == 2
+        assert any(e.startswith("Agent 'c': requires 'thinking_traces'") for e in errors)
+
 
 class TestAliasCircularDetection:
     def test_no_cycles(self):
@@ -196,3 +209,8 @@ class TestAliasCircularDetection:
 
     def test_native_alias_skipped(self):
         _detect_alias_cycles({"native": "claude-code:session"})
+
+    def test_cycle_behind_shared_chain(self):
+        aliases = {"a": "b", "b": "openai:gpt-5.2", "c": "d", "d": "e", "e": "d"}
+        with pytest.raises(ConfigError, match="starting from 'c'"):
+            _detect_alias_cycles(aliases)